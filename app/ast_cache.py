@@ -0,0 +1,90 @@
+# app/ast_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def content_digest(content):
+    """原始 Markdown 内容的 SHA-256，作为解析结果缓存的键"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class ParsedMarkdown:
+    """
+    一份内容的解析结果：预处理后的 Markdown 文本，以及（生成后）对应的 pandoc JSON AST。
+    AST 由 ParsedMarkdownCache.attach_ast 填入，之后换用其他样式导出时可跳过 Markdown 解析。
+    """
+
+    __slots__ = ('digest', 'source', 'ast')
+
+    def __init__(self, digest, source, ast=None):
+        self.digest = digest
+        self.source = source
+        self.ast = ast
+
+    @property
+    def size(self):
+        return len(self.source) + len(self.ast or '')
+
+
+class ParsedMarkdownCache:
+    """
+    进程内的 LRU 缓存，按原始内容的哈希保存 ParsedMarkdown。
+    AST 通常是源文本的数倍大小，因此同时限制条目数与总字符数，超出时淘汰最久未使用的条目。
+    """
+
+    def __init__(self, max_entries, max_chars):
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        """命中时返回 ParsedMarkdown 并标记为最近使用，未命中返回 None"""
+        with self._lock:
+            parsed = self._entries.get(digest)
+            if parsed is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return parsed
+
+    def put(self, parsed):
+        with self._lock:
+            old = self._entries.pop(parsed.digest, None)
+            if old is not None:
+                self._chars -= old.size
+            self._entries[parsed.digest] = parsed
+            self._chars += parsed.size
+            self._evict_locked()
+
+    def attach_ast(self, parsed, ast):
+        """为已缓存（或已被淘汰）的解析结果填入 AST，并重新计算占用"""
+        with self._lock:
+            cached = self._entries.get(parsed.digest) is parsed
+            if cached:
+                self._chars -= parsed.size
+            parsed.ast = ast
+            if cached:
+                self._chars += parsed.size
+                self._evict_locked()
+
+    def _evict_locked(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._chars > self.max_chars):
+            _, evicted = self._entries.popitem(last=False)
+            self._chars -= evicted.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                    'with_ast': sum(1 for parsed in self._entries.values() if parsed.ast is not None),
+                    'chars': self._chars}
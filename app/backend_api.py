@@ -4,30 +4,28 @@ import os
 import json
 import platform
 import subprocess
-import tempfile
-import threading
-import tkinter as tk
-from tkinter import filedialog
-import re
 import time
-import win32com.client
-import win32clipboard
-import win32con
-import pywintypes
-import webview
-
-# 关键库导入
-import pypandoc
-import docx
-from docx.shared import Pt, RGBColor
-from docx.oxml.ns import qn
-
-if platform.system() == "Windows":
-    import winreg
 
+# 注意：webview、tkinter、pywin32 等重量级或平台相关的模块均在首次使用时才导入，
+# 以缩短启动时间，并保证本模块在非 Windows 平台上也能被导入。
 # 从同级模块导入
-from .config import load_config, save_config
+from .clipboard import get_clipboard_service, shutdown_clipboard_service
+from .config import get_config_store
+from .pandoc_engine import configure_pandoc_pool, get_pandoc_version, shutdown_pandoc_pool
+from .chunked_docx import configure_chunked_conversion
+from .native_docx import DOCX_ENGINES, PANDOC_ENGINE
+from .converter import (EXPORT_FORMATS, PRESET_STYLES, build_ast, configure_ast_cache, configure_output_cache,
+                        convert_markdown_file, convert_to_bytes, convert_to_file, export_formats, file_digest,
+                        get_ast_cache_stats, get_output_cache_stats, get_reference_docx, parse_markdown,
+                        prebuild_reference_docs, process_text, reference_docx_key, wants_ast)
+from .scheduler import PRIORITY_BACKGROUND, JobScheduler, current_job_cancelled
+from .scratch import configure_scratch_workspace, shutdown_scratch_workspace
+from .office_automation import ComOfficeBackend, OfficeInstancePool
+from .font_index import FontIndex, build_font_details, build_font_list
+from .rich_copy import apply_inline_styles, needs_office
+from .timing import configure_profiling, get_bridge_stats, job, span, timed_bridge
 from .utils import get_filename_from_content
+from .watcher import FolderWatcher
 
 # 全局变量
 window = None  # 这个变量将被主GUI模块注入
@@ -40,13 +38,15 @@ def safe_evaluate_js(js_code):
         try:
             window.evaluate_js(js_code)
         except Exception as e:
-            logging.error(f"调用JavaScript代码失败: {e}")
+            logging.error("调用JavaScript代码失败: %s", e)
     else:
-        logging.warning(f"window未初始化，无法执行JavaScript: {js_code}")
+        logging.warning("window未初始化，无法执行JavaScript: %s", js_code)
 
 
 def _clear_clipboard():
     """Safely clears the clipboard."""
+    import win32clipboard
+    import pywintypes
     clipboard_opened = False
     try:
         win32clipboard.OpenClipboard()
@@ -55,181 +55,195 @@ def _clear_clipboard():
         logging.info("Clipboard cleared at start.")
     except pywintypes.error as e:
         # It's not critical if this fails, but log it.
-        logging.warning(f"启动时清空剪贴板失败 (可能已被占用): {e}")
+        logging.warning("启动时清空剪贴板失败 (可能已被占用): %s", e)
     finally:
         if clipboard_opened:
             win32clipboard.CloseClipboard()
 
 
-def _preprocess_markdown(text):
-    """对 Markdown 文本进行预处理，以解决因缺少空行导致的 Pandoc 转换失败问题。"""
-    # 步骤 1: 统一进行文本替换
-    # 修正 LaTex 公式中的多余反斜杠
-    text = text.replace('\\\\', '\\')
-    # 采纳您的建议，将 <br> 和 \<br> 替换为两个空格
-    text = text.replace('\<br\>', '  ').replace('<br>', '  ')
-    # 替换不间断空格
-    text = text.replace('\u00A0', ' ').replace('\u3000', ' ')
-
-    # 步骤 2: 智能插入空行，保证块级元素之间格式正确
-    lines = text.split('\n')
-    processed_lines = []
-    for i, current_line in enumerate(lines):
-        processed_lines.append(current_line)
-        if i < len(lines) - 1:
-            next_line = lines[i + 1]
-            current_line_stripped = current_line.strip()
-            next_line_stripped = next_line.strip()
-            if not current_line_stripped or not next_line_stripped:
-                continue
-            
-            # 修复之前损坏的正则表达式
-            is_normal_text_line = (not current_line_stripped.startswith(('* ', '- ', '+ ', '>', '#', '|')) and
-                                   not re.match(r'^\d+\.\s', current_line_stripped))
-            is_next_line_block_start = (next_line_stripped.startswith(('* ', '- ', '+ ', '|', '>')) or
-                                        re.match(r'^\d+\.\s', next_line_stripped))
-            is_current_line_list_item = (current_line_stripped.startswith(('* ', '- ', '+ ')) or
-                                         re.match(r'^\d+\.\s', current_line_stripped))
-            is_next_line_table_start = next_line_stripped.startswith('|')
-            
-            if (is_normal_text_line and is_next_line_block_start) or \
-                    (is_current_line_list_item and is_next_line_table_start):
-                # 修复之前损坏的正则表达式
-                if re.match(r'^[\s|: -]+$', current_line_stripped) and '|' in current_line_stripped:
-                    continue
-                logging.info(f"自动修正：在第 {i + 1} 行后插入了一个空行以确保块级元素格式正确。")
-                processed_lines.append('')
-                
-    return '\n'.join(processed_lines)
-
-
-def create_reference_docx(styles):
-    """根据传入的样式字典动态创建一个 reference.docx 文件"""
-    # ... (此函数代码与原文件相同，复制到此处即可)
+def _take_over_clipboard():
+    """读出 Office 放入剪贴板的全部格式后重新写入，使本程序接管剪贴板所有权"""
+    import win32clipboard
+    import pywintypes
+
+    clipboard_opened = False
     try:
-        document = docx.Document()
-
-        def _apply_font_style(style, style_data):
-            font = style.font
-            font_name = style_data.get('font', '宋体')
-            size = float(style_data.get('size', 12))
-            color_hex = style_data.get('color', '000000')
-            font.size = Pt(size)
-            font.color.rgb = RGBColor.from_string(color_hex)
-            font.name = font_name
-            rfonts = font._element.rPr.rFonts
-            rfonts.set(qn('w:eastAsia'), font_name)
-            theme_attrs = ['asciiTheme', 'hAnsiTheme', 'eastAsiaTheme', 'cstheme']
-            for attr in theme_attrs:
-                if rfonts.get(qn(f'w:{attr}')) is not None:
-                    rfonts.attrib.pop(qn(f'w:{attr}'))
-
-        _apply_font_style(document.styles['Normal'], styles.get('body', {}))
-        for i in range(1, 4):
-            _apply_font_style(document.styles[f'Heading {i}'], styles.get(f'h{i}', {}))
-
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
-        document.save(temp_file.name)
-        logging.info(f"动态样式文件已创建: {temp_file.name}")
-        return temp_file.name
+        # Retry opening the clipboard, as it might be locked by the Office app momentarily
+        for i in range(10): # Increased retries
+            try:
+                win32clipboard.OpenClipboard()
+                clipboard_opened = True
+                break
+            except pywintypes.error:
+                time.sleep(0.1)
+        
+        if not clipboard_opened:
+            raise Exception("无法打开剪贴板，它可能正被另一个程序持续占用。")
+
+        clipboard_data = {}
+        fmt = 0
+        while True:
+            fmt = win32clipboard.EnumClipboardFormats(fmt)
+            if fmt == 0: 
+                break
+            try:
+                clipboard_data[fmt] = win32clipboard.GetClipboardData(fmt)
+            except pywintypes.error:
+                pass
+        
+        # 根据用户反馈，移除会引起冲突的RTF格式
+        rtf_format_id = win32clipboard.RegisterClipboardFormat("Rich Text Format")
+        if rtf_format_id in clipboard_data:
+            del clipboard_data[rtf_format_id]
+            logging.info("已从待写入数据中移除RTF格式。")
+
+        win32clipboard.EmptyClipboard()
+        
+        for fmt, data in clipboard_data.items():
+            try:
+                win32clipboard.SetClipboardData(fmt, data)
+            except pywintypes.error:
+                pass
+        
+        logging.info("剪贴板已强制刷新并接管，保留了 %s 种格式。", len(clipboard_data))
     except Exception as e:
-        logging.error(f"创建动态样式文件失败: {e}", exc_info=True)
-        return None
+        logging.error("强制刷新剪贴板失败: %s", e)
+    finally:
+        if clipboard_opened:
+            try:
+                win32clipboard.CloseClipboard()
+            except pywintypes.error as e_close:
+                # 如果关闭失败，很可能是因为它从未被成功打开，或者已经被Office关闭了。
+                # 记录一个警告而不是让程序崩溃。
+                logging.warning("关闭剪贴板时发生错误 (可忽略): %s", e_close)
 
 
 class Api:
     def __init__(self):
         # ... (整个 Api 类的代码与原文件相同，复制到此处即可)
-        self.config = load_config()
+        # 配置的唯一来源：内存中读写，修改经防抖后原子写盘
+        self.config = get_config_store()
         self.export_directory = self.config.get('export_directory')
         self.custom_template_path = self.config.get('template_path')
         self.styles = self.config.get('styles')
         self.text_processing = self.config.get('text_processing', {'remove_separators': False})
-        self.temp_files_to_clean = []
-        self.preset_styles = {
-            "general": {"body": {"font": "宋体", "size": 12, "color": "000000"},
-                        "h1": {"font": "黑体", "size": 22, "color": "000000"},
-                        "h2": {"font": "黑体", "size": 16, "color": "000000"},
-                        "h3": {"font": "黑体", "size": 14, "color": "000000"}},
-            "academic": {"body": {"font": "Times New Roman", "size": 12, "color": "000000"},
-                         "h1": {"font": "Times New Roman", "size": 16, "color": "000000"},
-                         "h2": {"font": "Times New Roman", "size": 14, "color": "000000"},
-                         "h3": {"font": "Times New Roman", "size": 12, "color": "000000"}},
-            "business": {"body": {"font": "Arial", "size": 11, "color": "000000"},
-                         "h1": {"font": "Arial", "size": 24, "color": "1F497D"},
-                         "h2": {"font": "Arial", "size": 18, "color": "4F81BD"},
-                         "h3": {"font": "Arial", "size": 14, "color": "4F81BD"}},
-            "technical": {"body": {"font": "Courier New", "size": 11, "color": "000000"},
-                          "h1": {"font": "黑体", "size": 18, "color": "000000"},
-                          "h2": {"font": "黑体", "size": 16, "color": "000000"},
-                          "h3": {"font": "黑体", "size": 14, "color": "000000"}},
-            "teaching": {"body": {"font": "楷体", "size": 14, "color": "000000"},
-                         "h1": {"font": "黑体", "size": 22, "color": "000000"},
-                         "h2": {"font": "黑体", "size": 18, "color": "000000"},
-                         "h3": {"font": "楷体", "size": 16, "color": "000000"}},
-            "government": {"body": {"font": "仿宋", "size": 16, "color": "000000"},
-                           "h1": {"font": "黑体", "size": 22, "color": "000000"},
-                           "h2": {"font": "楷体", "size": 16, "color": "000000"},
-                           "h3": {"font": "仿宋", "size": 16, "color": "000000"}},
-            "modern": {"body": {"font": "微软雅黑", "size": 11, "color": "333333"},
-                       "h1": {"font": "微软雅黑", "size": 24, "color": "0078D4"},
-                       "h2": {"font": "微软雅黑", "size": 18, "color": "0078D4"},
-                       "h3": {"font": "微软雅黑", "size": 15, "color": "333333"}}
-        }
+        # 最近打开的 Markdown 文件，导出 md 时不会覆盖它
+        self.opened_file_path = None
+        # 按需为每次导出、复制采集 cProfile / tracemalloc 数据（也可用环境变量 MD2WORD_PROFILE 开启）
+        configure_profiling(**self.config.get('profiling', {}))
+        # 必须落盘的中间文件（复制时交给 Office 的 docx）复用固定数量的文件，优先放在内存文件系统中
+        scratch_settings = self.config.get('scratch', {})
+        self.scratch = configure_scratch_workspace(slots=scratch_settings.get('slots', 4),
+                                                   max_idle=scratch_settings.get('max_idle', 300),
+                                                   use_ram_disk=scratch_settings.get('use_ram_disk', True))
+        self.font_index = FontIndex()
+        # 所有后台工作都经由调度器执行，每类任务的并发数有上限
+        self.scheduler = JobScheduler(self.config.get('scheduler', {}))
+        # 复制功能使用的常驻 Office 实例池，默认首次复制时才启动实例
+        office_settings = self.config.get('office_pool', {})
+        self.office_pool = OfficeInstancePool(ComOfficeBackend(), size=office_settings.get('size', 1),
+                                              max_operations=office_settings.get('max_operations', 50))
+        if office_settings.get('prewarm') in ('word', 'wps') and platform.system() == "Windows":
+            self.scheduler.submit('office', lambda: self.office_pool.prewarm(office_settings['prewarm']),
+                                  name='预热 Office', priority=PRIORITY_BACKGROUND)
+        # 保存与复制共享同一个常驻 pandoc 工作进程池，并在后台预热
+        pool_settings = self.config.get('pandoc_pool', {})
+        self.pandoc_pool = configure_pandoc_pool(size=pool_settings.get('size', 2),
+                                                 max_jobs=pool_settings.get('max_jobs', 200),
+                                                 use_server=pool_settings.get('use_server', True))
+        self.scheduler.submit('pandoc', self.pandoc_pool.warm_up, name='预热 pandoc', priority=PRIORITY_BACKGROUND)
+        # 内容、样式均未变化的重复导出直接复用缓存结果
+        cache_settings = self.config.get('output_cache', {})
+        configure_output_cache(enabled=cache_settings.get('enabled', True),
+                               max_bytes=cache_settings.get('max_mb', 256) * 1024 * 1024,
+                               max_entries=cache_settings.get('max_entries', 200),
+                               hardlink=cache_settings.get('hardlink', False))
+        # 同一内容换用不同样式导出时，直接从内存中缓存的 pandoc AST 渲染
+        ast_settings = self.config.get('ast_cache', {})
+        configure_ast_cache(enabled=ast_settings.get('enabled', True),
+                            max_chars=ast_settings.get('max_mb', 64) * 1024 * 1024,
+                            max_entries=ast_settings.get('max_entries', 8))
+        # 超过阈值的大文档在多个 pandoc 进程中分块并行转换
+        chunked_settings = self.config.get('chunked_conversion', {})
+        configure_chunked_conversion(enabled=chunked_settings.get('enabled', True),
+                                     min_bytes=chunked_settings.get('min_kb', 512) * 1024,
+                                     workers=chunked_settings.get('workers', 0))
+        self.preset_styles = PRESET_STYLES
+        # 监视文件夹：上次退出时仍在监视的目录在后台恢复，清单保证未变化的文件不会重新转换
+        self.watcher = None
+        watch_settings = self.config.get('watch', {})
+        if watch_settings.get('enabled') and os.path.isdir(watch_settings.get('source_dir') or ''):
+            self.scheduler.submit('background', lambda: self.start_watch(watch_settings['source_dir']),
+                                  name='恢复监视文件夹', priority=PRIORITY_BACKGROUND)
+        # 首次运行时在后台把全部预设样式预先生成到缓存中
+        self.scheduler.submit('background', lambda: prebuild_reference_docs(list(PRESET_STYLES.values())),
+                              name='预生成样式文件', priority=PRIORITY_BACKGROUND)
 
     def get_preset_styles(self):
         return self.preset_styles
 
+    @timed_bridge
     def get_system_fonts(self):
-        preferred_fonts = ['宋体', '黑体', '楷体', '仿宋', '微软雅黑', 'Times New Roman', 'Arial', 'Courier New']
-        all_system_fonts = set()
-        try:
-            if platform.system() == "Windows":
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
-                                    r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts") as key:
-                    i = 0
-                    while True:
-                        try:
-                            name, _, _ = winreg.EnumValue(key, i)
-                            all_system_fonts.add(name.split(' (')[0].strip())
-                            i += 1
-                        except OSError:
-                            break
-            elif platform.system() == "Darwin":
-                output = subprocess.check_output(['system_profiler', 'SPFontsDataType'], text=True, encoding='utf-8')
-                for line in output.splitlines():
-                    if not line.startswith(' ') and line.endswith(':'):
-                        font_name = line[:-1].strip()
-                        if font_name and font_name != "Fonts": all_system_fonts.add(font_name)
-            else:
-                output = subprocess.check_output(['fc-list', ':', 'family'], text=True, encoding='utf-8')
-                for line in output.splitlines():
-                    font_family = line.split(',')[0].strip()
-                    if font_family: all_system_fonts.add(font_family)
-        except Exception as e:
-            logging.error(f"获取系统字体失败: {e}. 将仅使用常用字体列表。")
-            return preferred_fonts
-        final_list = list(preferred_fonts)
-        added_fonts = set(preferred_fonts)
-        for font in sorted(list(all_system_fonts)):
-            if font not in added_fonts: final_list.append(font)
-        logging.info(f"检测到 {len(all_system_fonts)} 个系统字体。最终字体列表长度 {len(final_list)}。")
+        # 直接读取持久化的字体索引，变化检测在窗口显示后由 refresh_fonts_in_background 完成
+        fonts = self.font_index.get_fonts()
+        final_list = build_font_list(fonts)
+        logging.info("字体索引中有 %s 个系统字体。最终字体列表长度 %s。", len(fonts), len(final_list))
         return final_list
 
+    def get_font_details(self):
+        """返回字体族的字形与 CJK 支持信息，供字体选择器筛选"""
+        return build_font_details(self.font_index.get_fonts())
+
+    def refresh_fonts_in_background(self):
+        """在后台检查系统字体是否变化，如有变化则把增量推送给前端"""
+        def _refresh():
+            try:
+                delta = self.font_index.refresh()
+            except Exception as e:
+                logging.error("刷新字体索引失败: %s", e, exc_info=True)
+                return
+            if delta:
+                fonts = self.font_index.get_fonts()
+                delta['font_list'] = build_font_list(fonts)
+                delta['fonts'] = {name: detail for name, detail in build_font_details(fonts).items()
+                                  if name in delta['added']}
+                safe_evaluate_js(f'window.app.onFontsUpdated({json.dumps(delta, ensure_ascii=False)})')
+
+        self.scheduler.submit('background', _refresh, name='刷新字体索引', key='refresh_fonts',
+                              priority=PRIORITY_BACKGROUND, supersede_running=False)
+
     def get_initial_info(self):
-        return self.config
+        return self.config.snapshot()
 
     def save_styles(self, styles, last_preset=""):
         self.styles = styles
-        self.config['styles'] = styles
-        self.config['last_preset'] = last_preset
-        save_config(self.config)
+        self.config.update(styles=styles, last_preset=last_preset)
         return {"success": True}
 
+    def get_output_cache_stats(self):
+        """导出结果缓存的命中/未命中次数与占用空间"""
+        return get_output_cache_stats()
+
+    def get_ast_cache_stats(self):
+        """解析结果（AST）缓存的命中/未命中次数与占用"""
+        return get_ast_cache_stats()
+
+    def get_bridge_stats(self):
+        """前端桥接调用（文件名、文本处理、字体列表等）的调用次数与耗时"""
+        return get_bridge_stats()
+
+    def _prepare_ast(self, parsed):
+        """导出后在后台把内容解析为 pandoc AST，之后换用其他预设或模板导出时跳过 Markdown 解析"""
+        if wants_ast(parsed):
+            self.scheduler.submit('background', lambda: build_ast(self.pandoc_pool, parsed), name='生成 pandoc AST',
+                                  key=('ast', parsed.digest), priority=PRIORITY_BACKGROUND, supersede_running=False)
+
+    @timed_bridge
     def update_filename(self, content):
         return get_filename_from_content(content)
 
     def select_export_directory(self):
+        import webview
         global window
         if not window:
             logging.error("Window object not available for folder dialog.")
@@ -240,15 +254,16 @@ class Api:
         if result and result[0]:
             directory = result[0]
             self.export_directory = directory
-            self.config['export_directory'] = directory
-            save_config(self.config)
+            self.config.set('export_directory', directory)
             return directory
         return None
 
-    def _run_dialog_in_thread(self, func):
-        threading.Thread(target=func, daemon=True).start()
+    def get_scheduler_stats(self):
+        """各类任务的队列深度、计数与排队/执行延迟"""
+        return self.scheduler.stats()
 
     def open_file_dialog(self):
+        import webview
         global window
         if not window:
             logging.error("Window object not available for file dialog.")
@@ -259,18 +274,20 @@ class Api:
 
         if result and result[0]:
             filepath = result[0]
-            logging.info(f"正在打开文件: {filepath}")
+            logging.info("正在打开文件: %s", filepath)
             try:
                 with open(filepath, 'r', encoding='utf-8') as f:
                     content = f.read()
+                self.opened_file_path = filepath
                 # 应用文本处理
                 processed_content = self.process_text(content)
                 safe_evaluate_js(f'window.app.onFileOpened({json.dumps(processed_content)})')
             except Exception as e:
-                logging.error(f"读取文件失败: {filepath}", exc_info=True)
+                logging.error("读取文件失败: %s", filepath, exc_info=True)
                 safe_evaluate_js(f'window.app.showNotification("无法读取文件: {e}", "error")')
 
     def select_template_dialog(self):
+        import webview
         global window
         if not window:
             logging.error("Window object not available for file dialog.")
@@ -281,231 +298,306 @@ class Api:
         
         if result and result[0]:
             filepath = result[0]
-            logging.info(f"用户选择了新模板: {filepath}")
+            logging.info("用户选择了新模板: %s", filepath)
             self.custom_template_path = filepath
-            self.config['template_path'] = filepath
-            self.config['last_preset'] = 'custom'
-            save_config(self.config)
+            self.config.update(template_path=filepath, last_preset='custom')
             base_name = os.path.basename(filepath)
             safe_evaluate_js(f'window.app.onTemplateSelected({json.dumps(base_name)})')
 
     def cleanup_on_exit(self):
         """在程序关闭时，清理所有为复制功能创建的临时文件。"""
+        # 先取消尚未开始的任务，避免它们在清理过程中再创建临时文件
+        self.scheduler.shutdown()
         logging.info("程序关闭，开始清理临时文件...")
-        for f in self.temp_files_to_clean:
-            if f and os.path.exists(f):
-                try:
-                    os.remove(f)
-                    logging.info(f"已删除临时文件: {f}")
-                except Exception as e:
-                    logging.error(f"删除临时文件失败 {f}: {e}")
-        self.temp_files_to_clean.clear()
+        self.office_pool.shutdown()
+        shutdown_scratch_workspace()
+        # 监视状态保留在配置中，下次启动时自动恢复
+        self._stop_watcher()
+        shutdown_clipboard_service()
+        shutdown_pandoc_pool()
+        self.config.flush()
+
+    def _resolve_engine(self, engine):
+        """校验前端传入的转换引擎；与上次不同时记住选择，未指定时沿用配置中的引擎"""
+        if engine is None:
+            return self.config.get('docx_engine', PANDOC_ENGINE)
+        if engine not in DOCX_ENGINES:
+            logging.warning("未知的转换引擎 %s，改用 Pandoc。", engine)
+            return PANDOC_ENGINE
+        if engine != self.config.get('docx_engine'):
+            self.config.set('docx_engine', engine)
+        return engine
+
+    def copy_via_office_app(self, content, styles, target_app='word', engine=None):
+        engine = self._resolve_engine(engine)
 
-    def copy_via_office_app(self, content, styles, target_app='word'):
         def _copy():
-            # 0. 在开始前清空剪贴板，确保一个干净的环境
-            _clear_clipboard()
-
-            # 使用与保存相同的前处理逻辑
-            processed_content = _preprocess_markdown(content)
+            # 每次复制输出一条耗时记录，各阶段（预处理、pandoc、Office 插入与复制等）分别计时
+            with job('copy', target_app=target_app, engine=engine, chars=len(content)) as timer:
+                _copy_timed(timer)
+
+        def _copy_timed(timer):
+            # 使用与保存相同的前处理逻辑，并共用解析结果缓存
+            parsed = parse_markdown(content)
+            processed_content = parsed.source
             if not processed_content.strip():
+                timer.status = 'empty'
                 safe_evaluate_js('window.app.showNotification("内容为空，无法复制。", "info")')
                 return
 
-            temp_ref_path = None
-            temp_output_path = None
-            office_app = None
+            # 多数文档直接写入富文本即可粘贴到 Word/WPS，只有含公式、图片时才需要经过 Office
+            copy_mode = self.config.get('copy_mode', 'auto')
+            if copy_mode != 'office' and self._copy_rich_text(parsed, styles, force=copy_mode == 'native'):
+                timer.set(mode='native')
+                if engine == PANDOC_ENGINE:
+                    self._prepare_ast(parsed)
+                safe_evaluate_js('window.app.showNotification("内容已复制到剪贴板。", "success")')
+                return
+            timer.set(mode='office')
 
-            try:
-                # 1. 创建一个临时的Word文档
-                fd, temp_output_path = tempfile.mkstemp(suffix='.docx', prefix='md_copy_')
-                os.close(fd)
-                # 登记到待清理列表
-                self.temp_files_to_clean.append(temp_output_path)
+            # 0. 在开始前清空剪贴板，确保一个干净的环境
+            with span('clipboard_clear'):
+                _clear_clipboard()
+
+            def _copy_in_office(office_app, temp_output_path):
+                backend = self.office_pool.backend
+                # 新建一个内存文档后插入文件内容，避免在"最近文件"列表中留下痕迹
+                with span('office_new_document'):
+                    doc = backend.new_document(office_app)
+                logging.info("创建了一个新的内存文档，用以承载复制内容。")
+                try:
+                    with span('office_insert_file'):
+                        backend.insert_file(doc, temp_output_path)
+                    logging.info("已将临时文件 %s 的内容插入内存文档。", temp_output_path)
+                    with span('office_copy'):
+                        backend.copy_document(doc)
+                    with span('clipboard_settle'):
+                        time.sleep(0.2) # 增加短暂延时，等待Office完成剪贴板操作
+                    # 必须在关闭文档前接管剪贴板，否则延迟渲染的格式会丢失
+                    with span('clipboard_take_over'):
+                        _take_over_clipboard()
+                finally:
+                    with span('office_close_document'):
+                        backend.close_document(doc)
 
+            try:
                 # 强制使用根目录的 "楷体模板.docx"
                 extra_args = ['--mathjax']
                 template_to_use = os.path.join(os.getcwd(), '楷体模板.docx')
                 if os.path.exists(template_to_use):
                     extra_args.append(f'--reference-doc={template_to_use}')
-                    logging.info(f"复制预览功能强制使用模板: {template_to_use}")
+                    logging.info("复制预览功能强制使用模板: %s", template_to_use)
                 else:
-                    logging.warning(f"楷体模板.docx 未找到，将使用Pandoc默认样式进行复制。")
-                
-                pypandoc.convert_text(source=processed_content, to='docx',
-                                      format='markdown+tex_math_dollars+tex_math_single_backslash',
-                                      outputfile=temp_output_path, extra_args=extra_args)
-
-                # 2. 在后台启动一个全新的、独立的对应Office实例
-                if target_app == 'word':
-                    prog_id = "Word.Application"
-                    logging.info(f"正在尝试启动后台应用: {prog_id}")
-                    office_app = win32com.client.DispatchEx(prog_id)
-                else: # wps
-                    office_app = None
-                    # WPS Office has several possible ProgIDs depending on version and installation.
-                    # We try them in order to find one that works.
-                    wps_prog_ids = ["wps.application", "kwps.application"]
-                    logging.info(f"正在尝试连接 WPS Office, 将依次尝试: {wps_prog_ids}")
-                    for prog_id in wps_prog_ids:
-                        try:
-                            office_app = win32com.client.DispatchEx(prog_id)
-                            logging.info(f"成功连接到 WPS Office: {prog_id}")
-                            break # Success, exit loop
-                        except pywintypes.com_error:
-                            logging.warning(f"尝试连接 {prog_id} 失败, 正在尝试下一个...")
-                            continue
-                    
-                    if not office_app:
-                        # If loop finishes without success, raise a specific error
-                        raise Exception("无法连接到 WPS Office。请确认 WPS 已正确安装并注册了 COM 组件。")
-
-                office_app.Visible = False
-                
-                # 策略变更：不再直接打开文件，而是新建一个内存文档后插入文件内容，
-                # 这样可以彻底避免在"最近文件"列表中留下痕迹。
-                doc = office_app.Documents.Add()
-                logging.info("创建了一个新的内存文档，用以承载复制内容。")
-                
-                # 将pandoc生成的临时文件内容插入到新文档中
-                doc.Content.InsertFile(FileName=temp_output_path, ConfirmConversions=False, Link=False)
-                logging.info(f"已将临时文件 {temp_output_path} 的内容插入内存文档。")
-                
-                doc.Content.Select()
-                doc.Content.Copy()
-                time.sleep(0.2) # 增加短暂延时，等待Office完成剪贴板操作
-                
-                # -- 强制刷新剪贴板，获取所有权 --
-                clipboard_opened = False
-                try:
-                    # Retry opening the clipboard, as it might be locked by the Office app momentarily
-                    for i in range(10): # Increased retries
-                        try:
-                            win32clipboard.OpenClipboard()
-                            clipboard_opened = True
-                            break
-                        except pywintypes.error:
-                            time.sleep(0.1)
-                    
-                    if not clipboard_opened:
-                        raise Exception("无法打开剪贴板，它可能正被另一个程序持续占用。")
-
-                    clipboard_data = {}
-                    fmt = 0
-                    while True:
-                        fmt = win32clipboard.EnumClipboardFormats(fmt)
-                        if fmt == 0: 
-                            break
-                        try:
-                            clipboard_data[fmt] = win32clipboard.GetClipboardData(fmt)
-                        except pywintypes.error:
-                            pass
-                    
-                    # 根据用户反馈，移除会引起冲突的RTF格式
-                    rtf_format_id = win32clipboard.RegisterClipboardFormat("Rich Text Format")
-                    if rtf_format_id in clipboard_data:
-                        del clipboard_data[rtf_format_id]
-                        logging.info("已从待写入数据中移除RTF格式。")
-
-                    win32clipboard.EmptyClipboard()
-                    
-                    for fmt, data in clipboard_data.items():
-                        try:
-                            win32clipboard.SetClipboardData(fmt, data)
-                        except pywintypes.error:
-                            pass
-                    
-                    logging.info(f"剪贴板已强制刷新并接管，保留了 {len(clipboard_data)} 种格式。")
-                except Exception as e:
-                    logging.error(f"强制刷新剪贴板失败: {e}")
-                finally:
-                    if clipboard_opened:
-                        try:
-                            win32clipboard.CloseClipboard()
-                        except pywintypes.error as e_close:
-                            # 如果关闭失败，很可能是因为它从未被成功打开，或者已经被Office关闭了。
-                            # 记录一个警告而不是让程序崩溃。
-                            logging.warning(f"关闭剪贴板时发生错误 (可忽略): {e_close}")
-                # -- 刷新结束 --
-
-                doc.Close(SaveChanges=False)
+                    logging.warning("楷体模板.docx 未找到，将使用Pandoc默认样式进行复制。")
+
+                # 1. Office 只能从文件插入内容：借用工作区中的一个中间文件，用完即归还复用
+                with self.scratch.reserve('.docx') as temp_output_path:
+                    convert_to_file(self.pandoc_pool, processed_content, 'docx', temp_output_path,
+                                    extra_args=extra_args, engine=engine, ast=parsed.ast)
+                    if engine == PANDOC_ENGINE:
+                        self._prepare_ast(parsed)
+
+                    if current_job_cancelled():
+                        timer.status = 'cancelled'
+                        logging.info("复制任务已被更新的复制请求取代，跳过写入剪贴板。")
+                        return
+                    # 2. 在常驻的隐藏 Office 实例中完成插入与复制（实例不存在或不健康时才会启动新进程）
+                    self.office_pool.run(target_app,
+                                         lambda office_app: _copy_in_office(office_app, temp_output_path))
                 safe_evaluate_js('window.app.showNotification("内容已复制到剪贴板。", "success")')
 
             except Exception as e:
+                timer.status = 'error'
                 error_msg_prefix = f"无法启动后台应用。请确保您已正确安装 {target_app.upper()}"
                 if "pywintypes.com_error" in str(e) or "无效的类字符串" in str(e) or "无法连接" in str(e):
                     error_msg = f"{error_msg_prefix} 并且程序有足够权限。"
                 else:
                     error_str = str(e).replace('"', "'")
                     error_msg = f"复制失败: {error_str}"
-                logging.error(f"通过 {target_app} 复制时失败: {e}", exc_info=True)
+                logging.error("通过 %s 复制时失败: %s", target_app, e, exc_info=True)
                 safe_evaluate_js(f'window.app.showNotification("{error_msg}", "error")')
-            finally:
-                # 3. 清理资源 (只清理Office进程和临时的样式文件)
-                if office_app:
-                    office_app.Quit()
-                if temp_ref_path and os.path.exists(temp_ref_path):
-                    os.remove(temp_ref_path)
 
-        self._run_dialog_in_thread(_copy)
+        # 剪贴板只有一个：连续点击复制时只执行最新的一次
+        self.scheduler.submit('office', _copy, name=f'复制到 {target_app}', key='copy')
+
+    def _copy_rich_text(self, parsed, styles, force=False):
+        """
+        不经过 Office，把按样式设置加上内联样式的 HTML 与纯文本（Markdown 原文）直接写入剪贴板。
+        文档含公式或图片（force 为 True 时除外）或当前剪贴板后端无法写入 HTML 时返回 False，由调用方改用 Office 复制。
+        """
+        start = time.perf_counter()
+        try:
+            with span('html_render'):
+                fragment = convert_to_bytes(self.pandoc_pool, parsed.source, 'html', extra_args=['--mathjax'],
+                                            ast=parsed.ast).decode('utf-8')
+        except Exception as e:
+            logging.warning("生成 HTML 失败，改用 Office 复制: %s", e)
+            return False
+        if not force and needs_office(fragment):
+            logging.info("文档包含公式或图片，使用 Office 复制以保留可编辑的公式并嵌入图片。")
+            return False
+        with span('inline_styles'):
+            styled = apply_inline_styles(fragment, styles)
+        with span('clipboard_write'):
+            written = get_clipboard_service().write_html(styled, parsed.source)
+        if not written:
+            return False
+        logging.info("已直接写入富文本剪贴板，耗时 %.1f ms。", (time.perf_counter() - start) * 1000)
+        return True
+
+    def _resolve_formats(self, formats):
+        """校验导出格式列表：docx 总是第一个，忽略未知格式；与上次不同时记住选择"""
+        if formats is None:
+            formats = self.config.get('export_formats', ['docx'])
+        resolved = ['docx'] + [fmt for fmt in dict.fromkeys(formats) if fmt in EXPORT_FORMATS and fmt != 'docx']
+        if resolved != self.config.get('export_formats'):
+            self.config.set('export_formats', resolved)
+        return resolved
+
+    def _reference_args(self, styles):
+        """返回当前模板（或与样式对应的样式文件）的 docx 参数及其内容标识，保存与监视文件夹共用"""
+        extra_args = ['--mathjax']
+        if self.custom_template_path and self.config.get('last_preset') == 'custom' and os.path.exists(
+                self.custom_template_path):
+            extra_args.append(f'--reference-doc={self.custom_template_path}')
+            logging.info("使用用户选择的模板: %s", self.custom_template_path)
+            return extra_args, f"template:{file_digest(self.custom_template_path)}"
+        logging.info("未选择模板，使用与样式设置对应的样式文件...")
+        ref_path = get_reference_docx(styles)
+        if ref_path:
+            extra_args.append(f'--reference-doc={ref_path}')
+            return extra_args, f"styles:{reference_docx_key(styles)}"
+        logging.warning("动态样式文件创建失败，将使用Pandoc默认样式。")
+        return extra_args, None
+
+    def save_word_document(self, content, directory, filename, styles, engine=None, formats=None):
+        """导出为 Word，并按 formats 同时导出 html、odt、md 等格式；各格式共用一次预处理与解析"""
+        engine = self._resolve_engine(engine)
+        formats = self._resolve_formats(formats)
 
-    def save_word_document(self, content, directory, filename, styles):
         def _save():
-            processed_content = _preprocess_markdown(content)
+            # 每次导出输出一条耗时记录，包含各格式的耗时与是否命中缓存
+            with job('export', formats=formats, engine=engine, chars=len(content)) as timer:
+                _save_timed(timer)
+
+        def _save_timed(timer):
+            # 相同内容再次导出时复用缓存的预处理结果与 AST
+            parsed = parse_markdown(content)
+            processed_content = parsed.source
             if not all([processed_content, directory, filename]):
+                timer.status = 'empty'
                 safe_evaluate_js('window.app.showNotification("内容、保存路径或文件名不能为空。", "error")')
                 return
-            output_path = os.path.join(directory, f"{filename}.docx")
-            temp_ref_path = None
+            output_stem = os.path.join(directory, filename)
             try:
-                logging.info(f"正在保存文件到: {output_path}")
-                extra_args = ['--mathjax']
-                if self.custom_template_path and self.config.get('last_preset') == 'custom' and os.path.exists(
-                        self.custom_template_path):
-                    extra_args.append(f'--reference-doc={self.custom_template_path}')
-                    logging.info(f"使用用户选择的模板: {self.custom_template_path}")
-                else:
-                    logging.info("未选择模板，根据样式设置动态生成...")
-                    temp_ref_path = create_reference_docx(styles)
-                    if temp_ref_path:
-                        extra_args.append(f'--reference-doc={temp_ref_path}')
-                    else:
-                        logging.warning("动态样式文件创建失败，将使用Pandoc默认样式。")
-
-                pypandoc.convert_text(source=processed_content, to='docx',
-                                      format='markdown+tex_math_dollars+tex_math_single_backslash',
-                                      outputfile=output_path, extra_args=extra_args)
-                safe_path = json.dumps(output_path)
-                safe_evaluate_js(f'window.app.showExportSuccessDialog({safe_path})')
+                logging.info("正在导出 %s 到: %s", '、'.join(formats), output_stem)
+                extra_args, reference_id = self._reference_args(styles)
+                results = export_formats(self.pandoc_pool, parsed, formats, output_stem, docx_args=extra_args,
+                                         reference_id=reference_id, engine=engine, title=filename,
+                                         source_path=self.opened_file_path)
+                timer.set(outputs={result['format']: round(result['seconds'] * 1000, 1) for result in results},
+                          cached=[result['format'] for result in results if result['cached']])
+                if all(result['error'] for result in results):
+                    raise RuntimeError(results[0]['error'])
+                safe_evaluate_js(f'window.app.showExportSuccessDialog({json.dumps(results, ensure_ascii=False)})')
+                if engine == PANDOC_ENGINE:
+                    self._prepare_ast(parsed)
 
             except Exception as e:
+                timer.status = 'error'
                 error_str = str(e).replace('"', "'")
                 error_msg = f"转换失败: {error_str}"
-                logging.error(f"Pandoc DOCX conversion failed: {e}", exc_info=True)
+                logging.error("Pandoc DOCX conversion failed: %s", e, exc_info=True)
                 safe_evaluate_js(f'window.app.showNotification("{error_msg}", "error")')
 
-            finally:
-                if temp_ref_path and os.path.exists(temp_ref_path):
-                    os.remove(temp_ref_path)
-                    logging.info(f"临时样式文件已删除: {temp_ref_path}")
+        # 保存到同一路径的重复请求合并为一次，以最新内容为准
+        self.scheduler.submit('pandoc', _save, name='保存 Word 文档', key=('save', directory, filename))
+
+    def start_watch(self, source_dir=None):
+        """
+        开始监视文件夹（未指定时弹出选择框），其中的 Markdown 文件保存后自动转换到当前输出位置。
+        样式、模板、引擎与导出格式在开始监视时确定，修改后重新开启监视即可生效。
+        """
+        if source_dir is None:
+            import webview
+            if not window:
+                logging.error("Window object not available for folder dialog.")
+                return None
+            last_dir = self.config.get('watch', {}).get('source_dir') or self.export_directory
+            result = window.create_file_dialog(webview.FOLDER_DIALOG, directory=last_dir)
+            if not result or not result[0]:
+                return None
+            source_dir = result[0]
+        self._stop_watcher()
+        settings = self.config.get('watch', {})
+        docx_args, reference_id = self._reference_args(self.styles)
+        engine = self.config.get('docx_engine', PANDOC_ENGINE)
+        formats = self._resolve_formats(None)
+        text_processing = dict(self.text_processing)
+        settings_id = json.dumps({'reference': reference_id, 'engine': engine, 'formats': formats,
+                                  'text_processing': text_processing, 'pandoc': get_pandoc_version()},
+                                 sort_keys=True)
+
+        def _convert(src_path, output_stem):
+            outputs, _ = convert_markdown_file(self.pandoc_pool, src_path, output_stem, docx_args=docx_args,
+                                               reference_id=reference_id, engine=engine, formats=formats,
+                                               text_processing=text_processing)
+            return outputs
+
+        def _report(src_path, outputs, error):
+            name = os.path.basename(src_path)
+            if error:
+                message, kind = f"自动转换失败: {name}", "error"
+            else:
+                message, kind = f"已自动转换: {name}", "success"
+            safe_evaluate_js(f'window.app.showNotification({json.dumps(message)}, "{kind}")')
 
-        self._run_dialog_in_thread(_save)
+        watcher = FolderWatcher(source_dir, self.export_directory, _convert, settings_id=settings_id,
+                                debounce=settings.get('debounce_ms', 500) / 1000,
+                                workers=settings.get('workers', 1),
+                                poll_interval=settings.get('poll_interval', 1.0), on_result=_report)
+        try:
+            watcher.start()
+        except Exception as e:
+            logging.error("无法开始监视文件夹 %s: %s", source_dir, e)
+            safe_evaluate_js(f'window.app.showNotification({json.dumps(f"无法监视文件夹: {e}")}, "error")')
+            return None
+        self.watcher = watcher
+        self.config.set('watch', {**settings, 'source_dir': watcher.source_dir, 'enabled': True})
+        status = self.get_watch_status()
+        safe_evaluate_js(f'window.app.onWatchStatusChanged({json.dumps(status, ensure_ascii=False)})')
+        return status
+
+    def stop_watch(self):
+        """停止监视文件夹，下次启动程序时不再自动恢复"""
+        self._stop_watcher()
+        self.config.set('watch', {**self.config.get('watch', {}), 'enabled': False})
+        return self.get_watch_status()
+
+    def _stop_watcher(self):
+        watcher, self.watcher = self.watcher, None
+        if watcher is not None:
+            watcher.stop()
+
+    def get_watch_status(self):
+        """正在监视时返回监视目录、输出目录与转换计数，否则返回 None"""
+        watcher = self.watcher
+        return watcher.stats() if watcher is not None else None
 
     def get_clipboard_content(self):
-        try:
-            root = tk.Tk();
-            root.withdraw()
-            content = root.clipboard_get();
-            root.destroy()
-            return content
-        except Exception:
-            return ""
+        return get_clipboard_service().read_text()
+
+    @timed_bridge
+    def paste_and_process(self):
+        """读取剪贴板并按文本处理设置处理，粘贴只需一次桥接调用"""
+        return process_text(get_clipboard_service().read_text(), self.text_processing)
 
     def open_file(self, path):
-        self._run_dialog_in_thread(lambda: self._open_path(path))
+        self.scheduler.submit('shell', lambda: self._open_path(path), name='打开文件', key=('open', path))
 
     def open_folder(self, path):
-        self._run_dialog_in_thread(lambda: self._open_path(os.path.dirname(path)))
+        folder = os.path.dirname(path)
+        self.scheduler.submit('shell', lambda: self._open_path(folder), name='打开目录', key=('open', folder))
 
     def _open_path(self, path):
         try:
@@ -516,23 +608,14 @@ class Api:
             else:
                 subprocess.run(["xdg-open", path], check=True)
         except Exception as e:
-            logging.error(f"打开路径失败: {path} - {e}")
+            logging.error("打开路径失败: %s - %s", path, e)
 
+    @timed_bridge
     def process_text(self, content):
         """
         根据文本处理设置处理输入的文本
         """
-        if not content:
-            return ""
-            
-        processed_text = content
-        
-        # 删除分隔线
-        if self.text_processing.get('remove_separators', False):
-            # 匹配任何三个以上的连字符（---）作为分隔线
-            processed_text = re.sub(r'^---+$', '', processed_text, flags=re.MULTILINE)
-        
-        return processed_text
+        return process_text(content, self.text_processing)
         
     def save_text_processing_settings(self, settings):
         """
@@ -540,12 +623,11 @@ class Api:
         """
         try:
             self.text_processing = settings
-            self.config['text_processing'] = settings
-            save_config(self.config)
-            logging.info(f"已保存文本处理设置: {settings}")
+            self.config.set('text_processing', settings)
+            logging.info("已保存文本处理设置: %s", settings)
             return {"success": True}
         except Exception as e:
-            logging.error(f"保存文本处理设置失败: {e}")
+            logging.error("保存文本处理设置失败: %s", e)
             return {"success": False, "error": str(e)}
     
     def get_text_processing_settings(self):
@@ -0,0 +1,692 @@
+# app/chunked_docx.py
+# 大文档分块并行转换：按顶层标题把 Markdown 切成若干块，在多个 pandoc 进程中并行转换为 docx，
+# 再把各块的正文、编号、脚注、关系与媒体文件合并为一个文档。
+import hashlib
+import io
+import logging
+import mimetypes
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from .pandoc_engine import MARKDOWN_FORMAT, convert_with_subprocess
+
+# 预处理后的文本达到该大小（按字符数计）才启用分块转换
+CHUNKED_MIN_BYTES = 512 * 1024
+# 每块至少包含的文本量，块太小时进程启动与合并的开销会抵消并行的收益
+CHUNK_MIN_BYTES = 64 * 1024
+
+_chunked_settings = {'enabled': True, 'min_bytes': CHUNKED_MIN_BYTES, 'workers': 0}
+
+_ATX_HEADING_RE = re.compile(r'^(#{1,6})(?:[ \t]+(.*?))?[ \t]*$')
+_FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+_FENCED_DIV_RE = re.compile(r'^ {0,3}:{3,}')
+_HTML_OPEN_RE = re.compile(r'<(div|section|details|blockquote|table|figure|article|aside)\b', re.IGNORECASE)
+_HTML_CLOSE_RE = re.compile(r'</(div|section|details|blockquote|table|figure|article|aside)\s*>', re.IGNORECASE)
+_LINK_DEF_RE = re.compile(r'^ {0,3}\[([^\]^][^\]]*)\]:\s*\S')
+_NOTE_DEF_RE = re.compile(r'^ {0,3}\[\^([^\]\s]+)\]:')
+_NOTE_REF_RE = re.compile(r'\[\^([^\]\s]+)\]')
+# 可能构成隐式标题引用的 [文字] 或 [文字][]，排除行内链接、完整引用链接与定义
+_BRACKET_RE = re.compile(r'\[([^\[\]\n]+)\](?!\(|\[[^\]]|:)')
+_EXPLICIT_ID_RE = re.compile(r'\{[^}\n]*?#([^\s}]+)')
+_HEADING_ATTR_RE = re.compile(r'\s*\{[^}]*\}\s*$')
+_YAML_KEY_RE = re.compile(r'^[\w-]+:(\s|$)')
+_EXAMPLE_LIST_RE = re.compile(r'\(@[\w-]*\)')
+_INDENTED_RE = re.compile(r'^( {4}|\t)')
+
+# 合并时需要重新编号的标识：书签、脚注、图片的 docPr/cNvPr 与 pandoc 的关系 Id 共用同一个递增计数器。
+# 每个分支都以 "<" 开头，正则引擎可以快速跳过其余文本
+_TAG_ID_RE = re.compile(
+    r'<(?:w:bookmarkStart w:id="(\d+)" w:name="([^"]*)"'
+    r'|(w:bookmarkEnd|w:footnoteReference|w:footnote) w:id="(\d+)"'
+    r'|((wp:docPr|pic:cNvPr)\b[^>]*?\sid=")(\d+)"'
+    r'|w:numId w:val="(\d+)")'
+)
+_REL_ATTR_RE = re.compile(r' r:(id|embed|link)="([^"]*)"')
+# 必须全部被 _TAG_ID_RE 识别的标签，数量对不上说明遇到了未知写法，放弃合并
+_ID_MARKERS = ('w:bookmarkStart', 'w:bookmarkEnd', 'w:footnoteReference', 'wp:docPr', 'pic:cNvPr', 'w:numId')
+_RELATIONSHIP_RE = re.compile(r'<Relationship\b[^>]*?/>')
+_XML_ATTR_RE = re.compile(r'([\w:]+)="([^"]*)"')
+_RID_NUMBER_RE = re.compile(r'^rId(\d+)$')
+_ABSTRACT_NUM_RE = re.compile(r'<w:abstractNum\b[^>]*?w:abstractNumId="(\d+)"[^>]*>.*?</w:abstractNum>', re.DOTALL)
+_NUM_RE = re.compile(r'<w:num\b[^>]*?w:numId="(\d+)"[^>]*?(?:/>|>.*?</w:num>)', re.DOTALL)
+_FOOTNOTE_RE = re.compile(r'<w:footnote\b([^>]*)>.*?</w:footnote>', re.DOTALL)
+_OVERRIDE_RE = re.compile(r'<Override PartName="([^"]*)" ContentType="([^"]*)"\s*/>')
+
+_REL_TYPE_PREFIX = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+_CONTENT_REL_TYPES = (_REL_TYPE_PREFIX + 'image', _REL_TYPE_PREFIX + 'hyperlink')
+_DOCUMENT_PART = 'word/document.xml'
+_DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+_NUMBERING_PART = 'word/numbering.xml'
+_FOOTNOTES_PART = 'word/footnotes.xml'
+_FOOTNOTES_RELS_PART = 'word/_rels/footnotes.xml.rels'
+_COMMENTS_PART = 'word/comments.xml'
+_CONTENT_TYPES_PART = '[Content_Types].xml'
+
+
+class ChunkMergeError(Exception):
+    """分块结果中出现了无法安全合并的结构，调用方应回退到整篇转换"""
+
+
+def configure_chunked_conversion(enabled=True, min_bytes=CHUNKED_MIN_BYTES, workers=0):
+    """设置分块转换的启用阈值与并行进程数（0 表示 CPU 核心数）"""
+    _chunked_settings.update(enabled=bool(enabled), min_bytes=int(min_bytes), workers=int(workers))
+
+
+def chunked_workers():
+    """
+    分块转换实际使用的并行进程数，不超过 CPU 核心数：
+    多个 pandoc 进程争用同一个核心时，垃圾回收互相干扰，总耗时反而数倍于整篇转换。
+    """
+    cpus = os.cpu_count() or 1
+    return min(_chunked_settings['workers'] or cpus, cpus)
+
+
+def should_convert_chunked(source):
+    """文本是否大到值得分块转换；只能使用一个核心时并行没有收益"""
+    return (_chunked_settings['enabled'] and chunked_workers() > 1
+            and len(source) >= _chunked_settings['min_bytes'])
+
+
+# ---------------------------------------------------------------- 切分
+
+class MarkdownChunk:
+    """切分出的一块：待转换的文本，以及块中显式指定的标识符（合并书签名时不参与去重）"""
+
+    def __init__(self, text, explicit_ids):
+        self.text = text
+        self.explicit_ids = explicit_ids
+
+
+def _heading_text(line):
+    match = _ATX_HEADING_RE.match(line)
+    text = (match.group(2) or '') if match else ''
+    text = _HEADING_ATTR_RE.sub('', text).rstrip('#').strip()
+    return ' '.join(text.split()).lower()
+
+
+def _scan_blocks(lines):
+    """
+    逐行扫描，找出可以安全切分的位置（空行之后、不在代码块/公式/容器内的 ATX 标题），
+    并收集链接引用定义与脚注定义。文档中出现无法分块处理的结构时返回 None。
+    """
+    headings = []
+    link_defs = []
+    notes = {}
+    start = 0
+    if lines and lines[0].strip() == '---':
+        # 文首的 YAML 元数据块
+        for index in range(1, len(lines)):
+            if lines[index].strip() in ('---', '...'):
+                start = index + 1
+                break
+    fence = None
+    in_math = False
+    div_depth = 0
+    html_depth = 0
+    previous_blank = True
+    # 定义（链接引用、脚注）可以逐行紧挨着书写，不需要空行分隔
+    after_definition = False
+    index = start
+    while index < len(lines):
+        line = lines[index]
+        if fence:
+            match = _FENCE_RE.match(line)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not line[match.end():].strip():
+                fence = None
+            index += 1
+            continue
+        stripped = line.strip()
+        if in_math:
+            if '$$' in stripped:
+                in_math = False
+            index += 1
+            continue
+        if not stripped:
+            previous_blank = True
+            index += 1
+            continue
+        if previous_blank or after_definition:
+            note = _NOTE_DEF_RE.match(line)
+            if note:
+                end = index + 1
+                # 脚注正文：紧随的非空行（惰性续行）以及空行之后的缩进段落，遇到下一个定义时结束
+                while end < len(lines):
+                    if lines[end].strip():
+                        if not _INDENTED_RE.match(lines[end]) and \
+                                (_NOTE_DEF_RE.match(lines[end]) or _LINK_DEF_RE.match(lines[end])):
+                            break
+                        end += 1
+                        continue
+                    following = end
+                    while following < len(lines) and not lines[following].strip():
+                        following += 1
+                    if following < len(lines) and _INDENTED_RE.match(lines[following]):
+                        end = following
+                        continue
+                    break
+                notes.setdefault(note.group(1), (index, end))
+                previous_blank = False
+                after_definition = True
+                index = end
+                continue
+            if _LINK_DEF_RE.match(line):
+                link_defs.append((index, line))
+                previous_blank = False
+                after_definition = True
+                index += 1
+                continue
+        after_definition = False
+        match = _FENCE_RE.match(line)
+        if match:
+            fence = match.group(1)
+            previous_blank = False
+            index += 1
+            continue
+        if stripped.startswith('$$') and stripped.count('$$') == 1:
+            in_math = True
+        if _FENCED_DIV_RE.match(line):
+            div_depth += -1 if not stripped.strip(':').strip() else 1
+            div_depth = max(div_depth, 0)
+        if '<' in line:
+            html_depth += len(_HTML_OPEN_RE.findall(line)) - len(_HTML_CLOSE_RE.findall(line))
+            html_depth = max(html_depth, 0)
+        if previous_blank:
+            if stripped == '---' and index + 1 < len(lines) and _YAML_KEY_RE.match(lines[index + 1]):
+                # 文档中间的 YAML 元数据块作用于整篇文档，不能分块
+                return None
+            if line.startswith('#') and not div_depth and not html_depth:
+                heading = _ATX_HEADING_RE.match(line)
+                if heading:
+                    headings.append((index, len(heading.group(1))))
+        previous_blank = False
+        index += 1
+    return headings, link_defs, notes
+
+
+def split_markdown(text, max_chunks, min_chunk_bytes=CHUNK_MIN_BYTES):
+    """
+    在顶层标题处把 Markdown 切分为至多 max_chunks 块，各块大小尽量均衡。
+    链接引用定义会附加到其他各块，脚注定义移到引用它的块末尾，使各块可以独立转换。
+    无法安全切分（例如跨块的隐式标题引用、示例列表、文中元数据块）或切分后不足两块时返回 None。
+    """
+    if _EXAMPLE_LIST_RE.search(text):
+        # 示例列表的编号贯穿全文，分块后会重新从 1 开始
+        return None
+    lines = text.split('\n')
+    scanned = _scan_blocks(lines)
+    if scanned is None:
+        return None
+    headings, link_defs, notes = scanned
+    if not headings:
+        return None
+    top_level = min(level for _, level in headings)
+    boundaries = [index for index, level in headings if level == top_level and index > 0]
+    chunk_count = min(max_chunks, len(text) // max(1, min_chunk_bytes), len(boundaries) + 1)
+    if chunk_count < 2:
+        return None
+
+    # 按各节的累计大小贪心分组
+    line_offsets = [0]
+    for line in lines:
+        line_offsets.append(line_offsets[-1] + len(line) + 1)
+    target = line_offsets[-1] / chunk_count
+    cuts = []
+    for index in boundaries:
+        if line_offsets[index] >= target * (len(cuts) + 1) and len(cuts) < chunk_count - 1:
+            cuts.append(index)
+    if not cuts:
+        return None
+    ranges = list(zip([0] + cuts, cuts + [len(lines)]))
+
+    # 隐式标题引用（[标题文字]）指向其他块中的标题时，单独转换的块无法解析它
+    heading_chunks = {}
+    for chunk_index, (begin, end) in enumerate(ranges):
+        for index, _ in headings:
+            if begin <= index < end:
+                heading_chunks.setdefault(_heading_text(lines[index]), set()).add(chunk_index)
+    link_labels = {' '.join(_LINK_DEF_RE.match(line).group(1).split()).lower() for _, line in link_defs}
+
+    # 脚注定义从原位置移出，附加到引用它的块末尾
+    note_lines = set()
+    for begin, end in notes.values():
+        note_lines.update(range(begin, end))
+    chunks = []
+    for chunk_index, (begin, end) in enumerate(ranges):
+        body = '\n'.join(lines[index] for index in range(begin, end) if index not in note_lines)
+        for match in _BRACKET_RE.finditer(body):
+            label = ' '.join(match.group(1).split()).lower()
+            owners = heading_chunks.get(label)
+            if owners and chunk_index not in owners and label not in link_labels:
+                return None
+        extra = [line for index, line in link_defs if not begin <= index < end]
+        for label in dict.fromkeys(_NOTE_REF_RE.findall(body)):
+            if label in notes:
+                note_begin, note_end = notes[label]
+                extra.append('\n'.join(lines[note_begin:note_end]))
+        if extra:
+            body = body.rstrip('\n') + '\n\n' + '\n\n'.join(extra) + '\n'
+        chunks.append(MarkdownChunk(body, set(_EXPLICIT_ID_RE.findall(body))))
+    return chunks
+
+
+# ---------------------------------------------------------------- 合并
+
+def _parse_relationships(xml):
+    relationships = []
+    for match in _RELATIONSHIP_RE.finditer(xml):
+        relationships.append(dict(_XML_ATTR_RE.findall(match.group(0))))
+    return relationships
+
+
+def _relationship_xml(rel):
+    attrs = ''.join(f' {name}="{rel[name]}"' for name in ('Type', 'Id', 'Target', 'TargetMode') if name in rel)
+    return f'<Relationship{attrs} />'
+
+
+def _rid_number(rel_id):
+    match = _RID_NUMBER_RE.match(rel_id)
+    return int(match.group(1)) if match else 0
+
+
+def _split_document(xml):
+    """把 document.xml 拆为 (正文之前的部分, 正文内容, 节属性, 正文之后的部分)"""
+    body_start = xml.find('<w:body>')
+    body_end = xml.rfind('</w:body>')
+    if body_start < 0 or body_end < 0:
+        raise ChunkMergeError("document.xml 中没有找到正文")
+    body_start += len('<w:body>')
+    inner = xml[body_start:body_end]
+    sect_start = inner.rfind('<w:sectPr')
+    sect_pr = ''
+    if sect_start >= 0 and inner.rstrip().endswith('</w:sectPr>'):
+        sect_pr = inner[sect_start:]
+        inner = inner[:sect_start]
+    return xml[:body_start], inner, sect_pr, xml[body_end:]
+
+
+class _RelationshipTable:
+    """合并后某个部件（正文或脚注）的关系表。图片按内容去重，超链接按目标地址去重"""
+
+    def __init__(self, merger, relationships):
+        self.merger = merger
+        self.relationships = list(relationships)
+        self.by_key = {}
+        for rel in self.relationships:
+            key = self._key(rel, None)
+            if key is not None:
+                self.by_key.setdefault(key, rel['Id'])
+
+    def _key(self, rel, archive):
+        if rel.get('Type') == _REL_TYPE_PREFIX + 'hyperlink':
+            return ('hyperlink', rel.get('Target'), rel.get('TargetMode'))
+        if rel.get('Type') == _REL_TYPE_PREFIX + 'image' and rel.get('TargetMode') != 'External':
+            digest = self.merger.media_digest(rel['Target'], archive)
+            return ('image', digest) if digest else None
+        return None
+
+    def add_chunk(self, relationships, archive, offset):
+        """登记一块的关系，返回该块中旧 Id 到合并后 Id 的映射"""
+        mapping = {}
+        base_ids = {rel['Id']: rel for rel in self.relationships}
+        for rel in relationships:
+            if rel.get('Type') not in _CONTENT_REL_TYPES:
+                # 样式、编号、页眉页脚等部件来自同一个模板，必须与第一块完全一致
+                existing = base_ids.get(rel['Id'])
+                if existing is None or existing.get('Type') != rel.get('Type') or \
+                        existing.get('Target') != rel.get('Target'):
+                    raise ChunkMergeError(f"无法合并的关系: {rel}")
+                mapping[rel['Id']] = rel['Id']
+                continue
+            key = self._key(rel, archive)
+            if key is not None and key in self.by_key:
+                mapping[rel['Id']] = self.by_key[key]
+                continue
+            new_rel = dict(rel)
+            new_rel['Id'] = f"rId{_rid_number(rel['Id']) + offset}"
+            if key is not None and key[0] == 'image':
+                # 同一张图片可能已被其他部件（正文或脚注）引用，共用同一个媒体文件
+                existing_media = self.merger.media_by_digest.get(key[1])
+                new_rel['Target'] = existing_media[len('word/'):] if existing_media else \
+                    self.merger.add_media(rel['Target'], archive, new_rel['Id'])
+            self.merger.note_id(_rid_number(new_rel['Id']))
+            self.relationships.append(new_rel)
+            if key is not None:
+                self.by_key[key] = new_rel['Id']
+            mapping[rel['Id']] = new_rel['Id']
+        return mapping
+
+    def to_xml(self, template):
+        # 保留原有的 XML 声明与根元素，没有关系时根元素可能是自闭合的
+        root = re.search(r'<Relationships\b[^>]*?(/?)>', template)
+        if root is None:
+            raise ChunkMergeError("关系文件格式无法识别")
+        head = template[:root.start()] + root.group(0)[:-len(root.group(1)) - 1].rstrip() + '>'
+        return head + ''.join(_relationship_xml(rel) for rel in self.relationships) + '</Relationships>'
+
+
+class _ChunkContext:
+    """合并一块时的编号状态：标识偏移量、列表编号映射、块内已出现的书签名"""
+
+    def __init__(self, offset, num_map, explicit_ids):
+        self.offset = offset
+        self.num_map = num_map
+        self.explicit_ids = set(explicit_ids)
+        self.local_names = set()
+
+
+class DocxChunkMerger:
+    """
+    把同一模板下分别转换的若干个 docx 依次合并。
+    第一块作为基础文档（模板部件、元数据、节属性都取自它），后续各块的正文、脚注、
+    列表编号、超链接与图片被追加进来，所有标识重新编号以保证在合并后的文档中唯一，
+    标题书签名按 pandoc 的规则在全文范围内去重。
+    """
+
+    def __init__(self, first_docx, explicit_ids=()):
+        self.base = zipfile.ZipFile(io.BytesIO(first_docx))
+        self.names = set(self.base.namelist())
+        for part in (_DOCUMENT_PART, _DOCUMENT_RELS_PART, _CONTENT_TYPES_PART):
+            if part not in self.names:
+                raise ChunkMergeError(f"缺少部件 {part}")
+        self._check_no_comments(self.base)
+        self.max_id = 0
+        self.used_names = set()
+        self.media = {}            # 合并后的媒体部件名 -> (数据, 压缩方式, 内容类型)
+        self.media_by_digest = {}  # 内容摘要 -> 合并后的部件名
+        self.chunk_content_types = {}
+        self._digest_cache = {}
+
+        document = self._read(self.base, _DOCUMENT_PART)
+        self.prefix, body, self.sect_pr, self.suffix = _split_document(document)
+        # 各块正文末尾的缩进空白只在最后保留一份，使合并结果与 pandoc 的输出格式一致
+        self.body_separator = body[len(body.rstrip()):]
+        body = body.rstrip()
+        self.document_rels_xml = self._read(self.base, _DOCUMENT_RELS_PART)
+        self.footnotes_rels_xml = self._read(self.base, _FOOTNOTES_RELS_PART, '')
+        self.numbering_xml = self._read(self.base, _NUMBERING_PART, '')
+        self.footnotes_xml = self._read(self.base, _FOOTNOTES_PART, '')
+        self.content_types_xml = self._read(self.base, _CONTENT_TYPES_PART)
+
+        document_rels = _parse_relationships(self.document_rels_xml)
+        footnote_rels = _parse_relationships(self.footnotes_rels_xml)
+        for rel in document_rels + footnote_rels:
+            self.note_id(_rid_number(rel['Id']))
+            if rel.get('Type') == _REL_TYPE_PREFIX + 'image' and rel.get('TargetMode') != 'External':
+                name = self._media_part(rel['Target'])
+                if name in self.names:
+                    self.media_by_digest.setdefault(self.media_digest(rel['Target'], self.base), name)
+        self.document_rels = _RelationshipTable(self, document_rels)
+        self.footnote_rels = _RelationshipTable(self, footnote_rels)
+
+        self.abstract_nums = {}
+        self.new_abstract_nums = []
+        self.new_nums = []
+        self.max_num_id = 0
+        for match in _ABSTRACT_NUM_RE.finditer(self.numbering_xml):
+            self.abstract_nums[match.group(1)] = match.group(0)
+        for match in _NUM_RE.finditer(self.numbering_xml):
+            self.max_num_id = max(self.max_num_id, int(match.group(1)))
+
+        self.bodies = []
+        self.footnotes = []
+        # 第一块的标识保持不变，只登记其中用到的书签名
+        first = _ChunkContext(0, {}, explicit_ids)
+        self.bodies.append(self._remap(body, first, {}))
+        for footnote in self._iter_footnotes(self.footnotes_xml):
+            self._remap(footnote, first, {})
+
+    @staticmethod
+    def _read(archive, name, default=None):
+        try:
+            return archive.read(name).decode('utf-8')
+        except KeyError:
+            if default is None:
+                raise ChunkMergeError(f"缺少部件 {name}")
+            return default
+
+    @staticmethod
+    def _check_no_comments(archive):
+        try:
+            if b'<w:comment ' in archive.read(_COMMENTS_PART):
+                raise ChunkMergeError("文档包含批注")
+        except KeyError:
+            pass
+
+    @staticmethod
+    def _media_part(target):
+        return os.path.normpath(os.path.join('word', target)).replace(os.sep, '/')
+
+    @staticmethod
+    def _iter_footnotes(xml):
+        """只返回正文脚注，分隔符等特殊脚注带有 w:type 属性"""
+        for match in _FOOTNOTE_RE.finditer(xml):
+            if 'w:type=' not in match.group(1):
+                yield match.group(0)
+
+    def note_id(self, value):
+        if value > self.max_id:
+            self.max_id = value
+
+    def media_digest(self, target, archive):
+        name = self._media_part(target)
+        key = (id(archive), name)
+        if key not in self._digest_cache:
+            try:
+                data = (archive or self.base).read(name)
+            except KeyError:
+                self._digest_cache[key] = None
+            else:
+                self._digest_cache[key] = hashlib.sha1(data).hexdigest() + os.path.splitext(name)[1].lower()
+        return self._digest_cache[key]
+
+    def add_media(self, target, archive, new_id):
+        """把某块中的媒体文件以新名称加入合并后的文档，返回相对于 word/ 的新目标路径"""
+        source_name = self._media_part(target)
+        extension = os.path.splitext(source_name)[1]
+        name = f"word/media/{new_id}{extension}"
+        if name in self.names or name in self.media:
+            raise ChunkMergeError(f"媒体文件名冲突: {name}")
+        info = archive.getinfo(source_name)
+        content_type = self.chunk_content_types.get(source_name) or \
+            mimetypes.guess_type(source_name)[0] or 'application/octet-stream'
+        self.media[name] = (archive.read(source_name), info.compress_type, content_type)
+        digest = self.media_digest(target, archive)
+        if digest:
+            self.media_by_digest.setdefault(digest, name)
+        return name[len('word/'):]
+
+    def _remap(self, xml, context, rel_map):
+        """对一段正文或脚注的 XML 重新编号，并登记书签名"""
+        counts = dict.fromkeys(_ID_MARKERS, 0)
+        offset = context.offset
+
+        def _replace(match):
+            if match.group(1) is not None:
+                counts['w:bookmarkStart'] += 1
+                new_id = int(match.group(1)) + offset
+                self.note_id(new_id)
+                return f'<w:bookmarkStart w:id="{new_id}" w:name="{self._bookmark_name(match.group(2), context)}"'
+            if match.group(3) is not None:
+                counts[match.group(3)] = counts.get(match.group(3), 0) + 1
+                new_id = int(match.group(4)) + offset
+                self.note_id(new_id)
+                return f'<{match.group(3)} w:id="{new_id}"'
+            if match.group(5) is not None:
+                counts[match.group(6)] += 1
+                new_id = int(match.group(7)) + offset
+                self.note_id(new_id)
+                return f'<{match.group(5)}{new_id}"'
+            counts['w:numId'] += 1
+            num_id = match.group(8)
+            return f'<w:numId w:val="{context.num_map.get(num_id, num_id)}"'
+
+        result = _TAG_ID_RE.sub(_replace, xml)
+        for marker in _ID_MARKERS:
+            if xml.count(f'<{marker} ') != counts[marker]:
+                raise ChunkMergeError(f"无法识别的 {marker} 写法")
+        if rel_map:
+            result = _REL_ATTR_RE.sub(lambda m: f' r:{m.group(1)}="{rel_map.get(m.group(2), m.group(2))}"', result)
+        return result
+
+    def _bookmark_name(self, name, context):
+        """
+        pandoc 在各块内部独立为重复的标题生成 name-1、name-2 ……，
+        这里先还原出基础名称，再按全文已用过的名称重新去重，得到与整篇转换相同的结果。
+        """
+        local_seen = context.local_names
+        base = name
+        if name not in context.explicit_ids:
+            match = re.match(r'^(.*)-(\d+)$', name)
+            if match and match.group(1) in local_seen:
+                base = match.group(1)
+        local_seen.add(name)
+        if base in context.explicit_ids:
+            self.used_names.add(base)
+            return base
+        candidate = base
+        suffix = 0
+        while candidate in self.used_names:
+            suffix += 1
+            candidate = f"{base}-{suffix}"
+        self.used_names.add(candidate)
+        return candidate
+
+    def add_chunk(self, docx_bytes, explicit_ids=()):
+        archive = zipfile.ZipFile(io.BytesIO(docx_bytes))
+        self._check_no_comments(archive)
+        document = self._read(archive, _DOCUMENT_PART)
+        prefix, body, _, _ = _split_document(document)
+        if prefix != self.prefix:
+            raise ChunkMergeError("各块的文档声明不一致")
+        self.chunk_content_types = {name.lstrip('/'): content_type for name, content_type in
+                                    _OVERRIDE_RE.findall(self._read(archive, _CONTENT_TYPES_PART))}
+        offset = self.max_id
+
+        document_rels = _parse_relationships(self._read(archive, _DOCUMENT_RELS_PART))
+        footnote_rels = _parse_relationships(self._read(archive, _FOOTNOTES_RELS_PART, ''))
+        document_rel_map = self.document_rels.add_chunk(document_rels, archive, offset)
+        footnote_rel_map = self.footnote_rels.add_chunk(footnote_rels, archive, offset)
+
+        numbering = self._read(archive, _NUMBERING_PART, '')
+        footnotes = list(self._iter_footnotes(self._read(archive, _FOOTNOTES_PART, '')))
+        referenced = set(re.findall(r'<w:numId w:val="(\d+)"', body))
+        for footnote in footnotes:
+            referenced.update(re.findall(r'<w:numId w:val="(\d+)"', footnote))
+        num_map = {}
+        for match in _ABSTRACT_NUM_RE.finditer(numbering):
+            existing = self.abstract_nums.get(match.group(1))
+            if existing is None:
+                self.abstract_nums[match.group(1)] = match.group(0)
+                self.new_abstract_nums.append(match.group(0))
+            elif existing != match.group(0):
+                raise ChunkMergeError(f"列表样式 {match.group(1)} 在各块中的定义不一致")
+        for match in _NUM_RE.finditer(numbering):
+            if match.group(1) in referenced:
+                self.max_num_id += 1
+                num_map[match.group(1)] = str(self.max_num_id)
+                self.new_nums.append(match.group(0).replace(f'w:numId="{match.group(1)}"',
+                                                            f'w:numId="{self.max_num_id}"', 1))
+        if referenced - set(num_map):
+            raise ChunkMergeError("正文引用了不存在的列表编号")
+
+        context = _ChunkContext(offset, num_map, explicit_ids)
+        self.bodies.append(self._remap(body.strip(), context, document_rel_map))
+        for footnote in footnotes:
+            self.footnotes.append(self._remap(footnote, context, footnote_rel_map))
+
+    def _merged_numbering(self):
+        xml = self.numbering_xml
+        if not (self.new_abstract_nums or self.new_nums):
+            return xml
+        # 架构要求全部 abstractNum 位于 num 之前
+        first_num = re.search(r'<w:num\b', xml)
+        end = xml.rfind('</w:numbering>')
+        if end < 0:
+            raise ChunkMergeError("numbering.xml 格式无法识别")
+        insert_at = first_num.start() if first_num else end
+        xml = xml[:insert_at] + ''.join(self.new_abstract_nums) + xml[insert_at:]
+        end = xml.rfind('</w:numbering>')
+        return xml[:end] + ''.join(self.new_nums) + xml[end:]
+
+    def _merged_footnotes(self):
+        xml = self.footnotes_xml
+        if not self.footnotes:
+            return xml
+        end = xml.rfind('</w:footnotes>')
+        return xml[:end] + ''.join(self.footnotes) + xml[end:]
+
+    def _merged_content_types(self):
+        xml = self.content_types_xml
+        overrides = ''.join(f'<Override PartName="/{name}" ContentType="{content_type}" />'
+                            for name, (_, _, content_type) in self.media.items())
+        end = xml.rfind('</Types>')
+        return xml[:end] + overrides + xml[end:]
+
+    def write(self, output):
+        """写出合并后的文档；output 可以是路径或可写的二进制文件对象"""
+        replacements = {
+            _DOCUMENT_PART: (self.prefix + self.body_separator.join(self.bodies) + self.body_separator
+                             + self.sect_pr + self.suffix),
+            _DOCUMENT_RELS_PART: self.document_rels.to_xml(self.document_rels_xml),
+            _CONTENT_TYPES_PART: self._merged_content_types(),
+        }
+        if self.numbering_xml:
+            replacements[_NUMBERING_PART] = self._merged_numbering()
+        if self.footnotes_xml:
+            replacements[_FOOTNOTES_PART] = self._merged_footnotes()
+        if self.footnotes_rels_xml or self.footnote_rels.relationships:
+            replacements[_FOOTNOTES_RELS_PART] = self.footnote_rels.to_xml(
+                self.footnotes_rels_xml or self.document_rels_xml)
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as merged:
+            for info in self.base.infolist():
+                data = replacements.pop(info.filename, None)
+                merged.writestr(info, data.encode('utf-8') if data is not None else self.base.read(info.filename))
+            for name, data in replacements.items():
+                merged.writestr(name, data.encode('utf-8'))
+            for name, (data, compress_type, _) in self.media.items():
+                merged.writestr(name, data, compress_type=compress_type)
+
+
+# ---------------------------------------------------------------- 转换
+
+def convert_docx_chunked(source, output_path, format=MARKDOWN_FORMAT, extra_args=None, workers=None):
+    """
+    分块并行转换为 docx 并写入 output_path。各块使用同一个模板（extra_args 中的 --reference-doc）。
+    文本无法安全切分时返回 False 且不写入任何内容，调用方应改用整篇转换；
+    合并阶段遇到无法处理的结构时抛出 ChunkMergeError。
+    """
+    workers = workers or chunked_workers()
+    chunks = split_markdown(source, workers)
+    if chunks is None:
+        return False
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks)), thread_name_prefix='pandoc-chunk') as executor:
+        outputs = list(executor.map(
+            lambda chunk: convert_with_subprocess(chunk.text, 'docx', format=format, extra_args=extra_args), chunks))
+    converted = time.perf_counter()
+    merger = DocxChunkMerger(outputs[0], chunks[0].explicit_ids)
+    for chunk, output in zip(chunks[1:], outputs[1:]):
+        merger.add_chunk(output, chunk.explicit_ids)
+    merger.write(output_path)
+    logging.info("分块转换完成: %s 块，并行转换 %.2fs，合并 %.2fs，共 %s 字节。",
+                 len(chunks), converted - start, time.perf_counter() - converted, len(source))
+    return True
+
+
+def convert_docx(pool, source, output_path, format=MARKDOWN_FORMAT, extra_args=None):
+    """
+    把 Markdown 转换为 docx 写入 output_path。文本超过阈值时尝试分块并行转换，
+    不适合分块或合并失败时回退到经由工作进程池的整篇转换。
+    """
+    if should_convert_chunked(source):
+        try:
+            if convert_docx_chunked(source, output_path, format=format, extra_args=extra_args):
+                return
+            logging.info("文档没有可以安全切分的顶层标题，使用整篇转换。")
+        except ChunkMergeError as e:
+            logging.warning("分块转换结果无法合并，改为整篇转换: %s", e)
+    pool.convert_text(source=source, to='docx', format=format, outputfile=output_path, extra_args=extra_args)
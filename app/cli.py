@@ -0,0 +1,321 @@
+# app/cli.py
+# 无界面的命令行入口，只依赖转换核心，不会导入 webview / tkinter / pywin32
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import util as mp_util
+
+from .chunked_docx import configure_chunked_conversion
+from .converter import (EXPORT_FORMATS, PRESET_STYLES, configure_ast_cache, configure_output_cache,
+                        convert_markdown_file, file_digest, get_reference_docx)
+from .native_docx import DOCX_ENGINES, PANDOC_ENGINE
+from .http_service import ConversionService, create_server
+from .pandoc_engine import configure_pandoc_pool, get_pandoc_pool, get_pandoc_version, shutdown_pandoc_pool
+from .watcher import FolderWatcher
+
+MARKDOWN_EXTENSIONS = ('.md', '.markdown')
+
+
+def _is_glob(pattern):
+    return any(ch in pattern for ch in '*?[')
+
+
+def _glob_root(pattern):
+    """通配符中第一个含通配字符的部分之前的目录，如 'docs/**/*.md' 为 'docs'"""
+    root = pattern
+    while _is_glob(root):
+        root = os.path.dirname(root)
+    return root or os.curdir
+
+
+def collect_inputs(inputs):
+    """
+    将文件、目录或通配符展开为 (源文件, 相对输出路径) 列表。
+    目录与通配符都在输出目录中保留相对于其根目录（通配符中不含通配字符的部分）的子目录结构。
+    两个源文件对应同一个输出文件时抛出 ValueError。
+    """
+    tasks = []
+    seen = set()
+    outputs = {}
+
+    def _add(path, rel_path):
+        abs_path = os.path.abspath(path)
+        if abs_path in seen:
+            return
+        seen.add(abs_path)
+        output = os.path.splitext(rel_path)[0] + '.docx'
+        # 同一目录中的 a.md 与 a.markdown、或分别给出的两个同名文件会写到同一个输出文件
+        key = os.path.normcase(os.path.normpath(output))
+        if key in outputs:
+            raise ValueError(f"{outputs[key]} 与 {abs_path} 都会输出到 {output}，请分别转换到不同的输出目录")
+        outputs[key] = abs_path
+        tasks.append((abs_path, output))
+
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                for name in sorted(files):
+                    if name.lower().endswith(MARKDOWN_EXTENSIONS):
+                        path = os.path.join(root, name)
+                        _add(path, os.path.relpath(path, item))
+        elif _is_glob(item):
+            root = _glob_root(item)
+            for path in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(path):
+                    _add(path, os.path.relpath(path, root))
+        elif os.path.isfile(item):
+            _add(item, os.path.basename(item))
+        else:
+            logging.warning("输入不存在，已跳过: %s", item)
+    return tasks
+
+
+def _docx_args(reference_doc):
+    extra_args = ['--mathjax']
+    if reference_doc:
+        extra_args.append(f'--reference-doc={reference_doc}')
+    return extra_args
+
+
+def _init_worker(pool_size, chunk_workers):
+    """
+    进程池初始化：每个工作进程各自持有一个小型 pandoc 池，并在进程退出时关闭。
+    文件数少于并发数时，多出的核心留给单个大文件的分块并行转换。
+    """
+    configure_pandoc_pool(size=pool_size)
+    configure_chunked_conversion(workers=chunk_workers)
+    # 批量转换中每个文件只处理一次，不需要跨任务的导出结果与解析结果缓存
+    configure_output_cache(enabled=False)
+    configure_ast_cache(enabled=False)
+    mp_util.Finalize(None, shutdown_pandoc_pool, exitpriority=10)
+
+
+def _convert_one(src_path, dst_path, reference_doc, text_processing, engine=PANDOC_ENGINE, formats=('docx',)):
+    """
+    在工作进程中把单个文件导出为 formats 中的各个格式，
+    返回 (源文件, 输出文件列表, 耗时, 输入字节数, 错误信息)
+    """
+    start = time.perf_counter()
+    try:
+        outputs, size = convert_markdown_file(get_pandoc_pool(), src_path, os.path.splitext(dst_path)[0],
+                                              docx_args=_docx_args(reference_doc), engine=engine, formats=formats,
+                                              text_processing=text_processing)
+        return src_path, outputs, time.perf_counter() - start, size, None
+    except Exception as e:
+        return src_path, [], time.perf_counter() - start, 0, str(e)
+
+
+def _format_size(num_bytes):
+    if num_bytes >= 1024 * 1024:
+        return f"{num_bytes / 1024 / 1024:.1f} MB"
+    return f"{num_bytes / 1024:.1f} KB"
+
+
+def _resolve_reference_doc(args):
+    """返回 --template 或 --preset 对应的 reference.docx 路径；生成失败时为 None，模板不存在时为 False"""
+    if args.template:
+        if not os.path.isfile(args.template):
+            print(f"模板文件不存在: {args.template}", file=sys.stderr)
+            return False
+        return os.path.abspath(args.template)
+    # 在主进程中一次性生成（或命中缓存）样式文件，所有工作进程共用
+    reference_doc = get_reference_docx(PRESET_STYLES[args.preset])
+    if not reference_doc:
+        logging.warning("样式文件生成失败，将使用 Pandoc 默认样式。")
+    return reference_doc
+
+
+def _resolve_formats(formats):
+    return ['docx'] + [fmt for fmt in dict.fromkeys(formats) if fmt != 'docx']
+
+
+def run_convert(args):
+    try:
+        tasks = collect_inputs(args.inputs)
+    except ValueError as e:
+        print(f"输出文件冲突: {e}", file=sys.stderr)
+        return 2
+    if not tasks:
+        print("没有找到需要转换的 Markdown 文件。", file=sys.stderr)
+        return 1
+
+    reference_doc = _resolve_reference_doc(args)
+    if reference_doc is False:
+        return 2
+
+    text_processing = {'remove_separators': args.remove_separators}
+    output_dir = os.path.abspath(args.output)
+    jobs = max(1, args.jobs)
+    processes = min(jobs, len(tasks))
+    formats = _resolve_formats(args.formats)
+    print(f"开始转换 {len(tasks)} 个文件，并发进程数 {processes}，转换引擎 {args.engine}，"
+          f"输出格式 {'、'.join(formats)}，输出目录 {output_dir}")
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(1, max(1, jobs // processes))) as executor:
+        futures = [executor.submit(_convert_one, src, os.path.join(output_dir, rel), reference_doc, text_processing,
+                                   args.engine, formats)
+                   for src, rel in tasks]
+        for future in as_completed(futures):
+            src, outputs, elapsed, size, error = future.result()
+            results.append((src, outputs, elapsed, size, error))
+            if error:
+                print(f"  失败  {elapsed:7.3f}s  {src}: {error}")
+            else:
+                print(f"  完成  {elapsed:7.3f}s  {_format_size(size):>10}  {src} -> {', '.join(outputs)}")
+    wall_time = time.perf_counter() - start
+
+    succeeded = [r for r in results if not r[4]]
+    failed = len(results) - len(succeeded)
+    total_bytes = sum(r[3] for r in succeeded)
+    print("-" * 60)
+    print(f"共 {len(results)} 个文件，成功 {len(succeeded)} 个，失败 {failed} 个，总用时 {wall_time:.2f}s")
+    if succeeded and wall_time > 0:
+        per_file = sum(r[2] for r in succeeded) / len(succeeded)
+        print(f"吞吐量: {len(succeeded) / wall_time:.2f} 文件/秒，{_format_size(total_bytes / wall_time)}/秒，"
+              f"单文件平均耗时 {per_file:.3f}s")
+    return 1 if failed else 0
+
+
+def run_watch(args):
+    if not os.path.isdir(args.source):
+        print(f"监视目录不存在: {args.source}", file=sys.stderr)
+        return 2
+    reference_doc = _resolve_reference_doc(args)
+    if reference_doc is False:
+        return 2
+    text_processing = {'remove_separators': args.remove_separators}
+    formats = _resolve_formats(args.formats)
+    docx_args = _docx_args(reference_doc)
+    jobs = max(1, args.jobs)
+    configure_pandoc_pool(size=jobs)
+    configure_output_cache(enabled=False)
+    configure_ast_cache(enabled=False)
+    # 样式、引擎、格式或 pandoc 版本变化后，清单中的记录全部失效
+    settings_id = json.dumps({'reference': file_digest(reference_doc) if reference_doc else None,
+                              'engine': args.engine, 'formats': formats, 'text_processing': text_processing,
+                              'pandoc': get_pandoc_version()}, sort_keys=True)
+
+    def _convert(src_path, output_stem):
+        outputs, _ = convert_markdown_file(get_pandoc_pool(), src_path, output_stem, docx_args=docx_args,
+                                           engine=args.engine, formats=formats, text_processing=text_processing)
+        return outputs
+
+    def _report(src_path, outputs, error):
+        stamp = time.strftime('%H:%M:%S')
+        if error:
+            print(f"  [{stamp}] 失败  {src_path}: {error}", flush=True)
+        else:
+            print(f"  [{stamp}] 完成  {src_path} -> {', '.join(outputs)}", flush=True)
+
+    watcher = FolderWatcher(args.source, args.output, _convert, settings_id=settings_id,
+                            debounce=args.debounce, workers=jobs, poll_interval=args.poll_interval,
+                            use_watchdog=not args.poll, on_result=_report)
+    try:
+        watcher.start()
+        print(f"正在监视 {watcher.source_dir}（{watcher.backend}），输出目录 {watcher.output_dir}，"
+              f"输出格式 {'、'.join(formats)}。按 Ctrl+C 停止。", flush=True)
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("正在停止监视……")
+    finally:
+        watcher.stop()
+        shutdown_pandoc_pool()
+    stats = watcher.stats()
+    print(f"共转换 {stats['converted']} 个文件，未变化跳过 {stats['skipped']} 个，失败 {stats['failed']} 个")
+    return 1 if stats['failed'] else 0
+
+
+def run_serve(args):
+    if args.template_dir and not os.path.isdir(args.template_dir):
+        print(f"模板目录不存在: {args.template_dir}", file=sys.stderr)
+        return 2
+    workers = max(1, args.workers)
+    configure_pandoc_pool(size=workers)
+    service = ConversionService(get_pandoc_pool(), workers=workers, queue_size=args.queue_size,
+                                template_dir=args.template_dir, timeout=args.timeout)
+    try:
+        server = create_server(service, host=args.host, port=args.port, token=args.token)
+    except OSError as e:
+        print(f"无法监听 {args.host}:{args.port}: {e}", file=sys.stderr)
+        service.shutdown()
+        shutdown_pandoc_pool()
+        return 2
+    host, port = server.server_address[:2]
+    print(f"转换服务已启动: http://{host}:{port}/ ，并发转换数 {workers}，排队上限 {args.queue_size}。"
+          f"按 Ctrl+C 停止。", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("正在停止转换服务……")
+    finally:
+        server.server_close()
+        service.shutdown()
+        shutdown_pandoc_pool()
+    return 0
+
+
+def _add_output_arguments(parser):
+    """convert 与 watch 共用的样式、引擎与格式参数"""
+    style_group = parser.add_mutually_exclusive_group()
+    style_group.add_argument('--preset', default='general', choices=sorted(PRESET_STYLES),
+                             help="使用的预设样式（默认 general）")
+    style_group.add_argument('--template', help="自定义 reference.docx 模板路径")
+    parser.add_argument('--engine', default=PANDOC_ENGINE, choices=DOCX_ENGINES,
+                        help="docx 转换引擎：pandoc，或只支持常用语法、遇到不支持的语法自动回退的内置快速引擎 native")
+    parser.add_argument('--formats', nargs='+', default=['docx'], choices=sorted(EXPORT_FORMATS),
+                        help="输出格式，可给出多个（如 docx html md），每个文件只解析一次（默认 docx）")
+    parser.add_argument('--remove-separators', action='store_true', help="删除 --- 分隔线")
+    parser.add_argument('-v', '--verbose', action='store_true', help="输出详细日志")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='md2word', description="Markdown to Word 转换器命令行工具")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert = subparsers.add_parser('convert', help="批量将 Markdown 文件转换为 Word 文档")
+    convert.add_argument('inputs', nargs='+', help="Markdown 文件、目录或通配符（如 'docs/**/*.md'）")
+    convert.add_argument('-o', '--output', required=True, help="输出目录")
+    convert.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="并发进程数（默认 CPU 核心数）")
+    _add_output_arguments(convert)
+    convert.set_defaults(func=run_convert)
+
+    watch = subparsers.add_parser('watch', help="监视文件夹，Markdown 文件内容变化后自动转换")
+    watch.add_argument('source', help="要监视的目录（递归监视子目录）")
+    watch.add_argument('-o', '--output', required=True, help="输出目录，保留源目录的子目录结构")
+    watch.add_argument('-j', '--jobs', type=int, default=2, help="同时进行的转换数（默认 2）")
+    watch.add_argument('--debounce', type=float, default=0.5, help="文件停止写入多少秒后才开始转换（默认 0.5）")
+    watch.add_argument('--poll', action='store_true', help="不使用 watchdog，强制以轮询方式监视")
+    watch.add_argument('--poll-interval', type=float, default=1.0, help="轮询间隔秒数（默认 1）")
+    _add_output_arguments(watch)
+    watch.set_defaults(func=run_watch)
+
+    serve = subparsers.add_parser('serve', help="启动本地 HTTP 转换服务")
+    serve.add_argument('--host', default='127.0.0.1', help="监听地址（默认 127.0.0.1，仅本机可访问）")
+    serve.add_argument('--port', type=int, default=8765, help="监听端口（默认 8765，0 表示随机端口）")
+    serve.add_argument('-j', '--workers', type=int, default=2, help="同时进行的转换数（默认 2）")
+    serve.add_argument('--queue-size', type=int, default=8,
+                       help="转换全部占满时最多排队的请求数，超出后返回 429（默认 8）")
+    serve.add_argument('--template-dir', help="存放自定义 reference.docx 模板的目录，以文件名作为模板 id")
+    serve.add_argument('--timeout', type=float, default=300, help="单个请求等待转换结果的最长秒数（默认 300）")
+    serve.add_argument('--token', help="要求请求携带 Authorization: Bearer <token>")
+    serve.add_argument('-v', '--verbose', action='store_true', help="输出详细日志")
+    serve.set_defaults(func=run_serve)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(processName)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S', stream=sys.stderr)
+    return args.func(args)
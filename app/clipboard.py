@@ -0,0 +1,337 @@
+# app/clipboard.py
+# 读写剪贴板。后端在首次使用时选定并常驻，之后每次粘贴不再重复初始化 Tcl/Tk 等重量级组件
+import logging
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+
+from .rich_copy import CF_HTML_FORMAT_NAME, build_cf_html
+
+
+class ClipboardUnavailable(Exception):
+    """当前后端无法工作（缺少依赖、没有图形会话等），应改用下一个后端"""
+
+
+class ClipboardBackend:
+    """剪贴板后端接口：read_text 在剪贴板中没有文本时返回空字符串"""
+
+    name = 'base'
+
+    def read_text(self):
+        raise NotImplementedError
+
+    def write_html(self, fragment, text):
+        """同时写入 HTML 片段与纯文本；不支持写入富文本的后端抛出 ClipboardUnavailable"""
+        raise ClipboardUnavailable(f"{self.name} 后端不支持写入 HTML")
+
+    def close(self):
+        """释放常驻资源"""
+
+
+class Win32ClipboardBackend(ClipboardBackend):
+    """直接读取 CF_UNICODETEXT；pywin32 已随复制功能一起依赖，无需其他进程或窗口"""
+
+    name = 'win32'
+
+    def __init__(self, retries=10, retry_delay=0.02):
+        try:
+            import win32clipboard
+        except ImportError as e:
+            raise ClipboardUnavailable(f"pywin32 不可用: {e}")
+        self._clipboard = win32clipboard
+        self.retries = retries
+        self.retry_delay = retry_delay
+
+    def _open(self):
+        # 剪贴板可能被其他程序短暂占用，稍等后重试
+        for attempt in range(self.retries):
+            try:
+                self._clipboard.OpenClipboard()
+                return
+            except Exception:
+                if attempt == self.retries - 1:
+                    raise
+                time.sleep(self.retry_delay)
+
+    def read_text(self):
+        win32clipboard = self._clipboard
+        self._open()
+        try:
+            if not win32clipboard.IsClipboardFormatAvailable(win32clipboard.CF_UNICODETEXT):
+                return ""
+            return win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def write_html(self, fragment, text):
+        win32clipboard = self._clipboard
+        payload = build_cf_html(fragment)
+        html_format = win32clipboard.RegisterClipboardFormat(CF_HTML_FORMAT_NAME)
+        self._open()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(html_format, payload)
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+
+
+class CommandClipboardBackend(ClipboardBackend):
+    """
+    通过 wl-paste / xclip / xsel / pbpaste 读取，输出只解码一次。
+    不用于写入富文本：wl-copy、xclip 一次只能以一种类型持有剪贴板，写入 text/html 后纯文本目标将粘贴不到任何内容。
+    """
+
+    def __init__(self, name, command, timeout=5):
+        self.name = name
+        self.command = command
+        self.timeout = timeout
+
+    def read_text(self):
+        try:
+            result = subprocess.run(self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    timeout=self.timeout, check=False)
+        except FileNotFoundError as e:
+            raise ClipboardUnavailable(str(e))
+        if result.returncode != 0:
+            message = result.stderr.decode('utf-8', 'replace').strip()
+            # 剪贴板为空或没有文本类型时这些工具以非零状态退出
+            if 'No selection' in message or 'No suitable type' in message or 'target STRING not available' in message:
+                return ""
+            raise ClipboardUnavailable(f"{self.command[0]} 退出码 {result.returncode}: {message}")
+        return result.stdout.decode('utf-8', 'replace')
+
+
+class TkClipboardBackend(ClipboardBackend):
+    """
+    在一个专用线程中常驻隐藏的 Tk 根窗口。Tk 只能在创建它的线程中使用，
+    因此读写请求经队列交给该线程执行，调用方等待结果。
+    X11 下 Tk 作为剪贴板所有者可以同时提供 text/html 与纯文本，常驻的根窗口在程序运行期间一直持有写入的内容。
+    """
+
+    name = 'tk'
+    # 空闲时处理 Tk 事件的间隔：持有剪贴板时，其他程序的粘贴请求要等到这时才会得到应答
+    idle_interval = 0.1
+
+    def __init__(self, timeout=5):
+        self.timeout = timeout
+        self._requests = queue.Queue()
+        ready = Future()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name='clipboard-tk', daemon=True)
+        self._thread.start()
+        try:
+            ready.result(timeout=timeout)
+        except Exception as e:
+            raise ClipboardUnavailable(f"Tk 初始化失败: {e}")
+
+    def _run(self, ready):
+        try:
+            import tkinter as tk
+            root = tk.Tk()
+            root.withdraw()
+        except Exception as e:
+            ready.set_exception(e)
+            return
+        ready.set_result(None)
+        try:
+            while True:
+                try:
+                    request = self._requests.get(timeout=self.idle_interval)
+                except queue.Empty:
+                    # 空闲时处理挂起的 Tk 事件（包括其他程序读取剪贴板的请求），避免事件队列堆积
+                    root.update()
+                    continue
+                if request is None:
+                    break
+                future, action = request
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(action(root, tk))
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            root.destroy()
+
+    def _call(self, action):
+        if not self._thread.is_alive():
+            raise ClipboardUnavailable("Tk 线程已退出")
+        future = Future()
+        self._requests.put((future, action))
+        return future.result(timeout=self.timeout)
+
+    @staticmethod
+    def _read(root, tk):
+        try:
+            return root.clipboard_get()
+        except tk.TclError:
+            # 剪贴板为空或其中不是文本
+            return ""
+
+    def read_text(self):
+        return self._call(self._read)
+
+    def write_html(self, fragment, text):
+        def _write(root, tk):
+            # 其他窗口系统中 Tk 的剪贴板只支持纯文本，-type 会被忽略，HTML 源码将被当作文本粘贴
+            if root.tk.call('tk', 'windowingsystem') != 'x11':
+                raise ClipboardUnavailable("Tk 只在 X11 下支持写入 HTML")
+            root.clipboard_clear()
+            root.clipboard_append(fragment, type='text/html')
+            # STRING 类型的内容 Tk 也会以 UTF8_STRING 提供给纯文本目标
+            root.clipboard_append(text)
+            root.update()
+
+        self._call(_write)
+
+    def close(self):
+        if self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join(timeout=2)
+
+
+def _backend_factories():
+    """按当前平台返回依次尝试的后端构造函数"""
+    system = platform.system()
+    if system == 'Windows':
+        return [Win32ClipboardBackend, TkClipboardBackend]
+    if system == 'Darwin':
+        return [lambda: CommandClipboardBackend('pbpaste', ['pbpaste']), TkClipboardBackend]
+    factories = []
+    if os.environ.get('WAYLAND_DISPLAY') and shutil.which('wl-paste'):
+        factories.append(lambda: CommandClipboardBackend('wl-paste', ['wl-paste', '--no-newline', '--type', 'text']))
+    if os.environ.get('DISPLAY'):
+        if shutil.which('xclip'):
+            factories.append(lambda: CommandClipboardBackend('xclip', ['xclip', '-selection', 'clipboard', '-o']))
+        if shutil.which('xsel'):
+            factories.append(lambda: CommandClipboardBackend('xsel', ['xsel', '--clipboard', '--output']))
+    factories.append(TkClipboardBackend)
+    return factories
+
+
+def _html_writer_factory():
+    """读取所用的后端不能写入富文本时改用的后端；Windows 的 win32 后端本身即可写入"""
+    return None if platform.system() == 'Windows' else TkClipboardBackend
+
+
+class ClipboardService:
+    """
+    首次读取时按平台选定后端并一直复用；某个后端失效时自动改用下一个。
+    读取可能在 pywebview 的桥接线程中发生，因此所有后端都避免每次重新初始化。
+    写入富文本时若当前后端不支持（如 wl-paste、xclip），改用常驻的 Tk 后端同时写入 HTML 与纯文本。
+    """
+
+    def __init__(self, factories=None, html_writer_factory=None):
+        self._factories = list(factories) if factories is not None else None
+        self._html_writer_factory = html_writer_factory if factories is not None else _html_writer_factory()
+        self._html_writer = None
+        self._backend = None
+        self._lock = threading.Lock()
+
+    @property
+    def backend_name(self):
+        return self._backend.name if self._backend else None
+
+    def _next_backend_locked(self):
+        if self._factories is None:
+            self._factories = _backend_factories()
+        while self._factories:
+            factory = self._factories.pop(0)
+            try:
+                backend = factory()
+            except ClipboardUnavailable as e:
+                logging.info("剪贴板后端不可用: %s", e)
+                continue
+            logging.info("剪贴板使用 %s 后端", backend.name)
+            return backend
+        return None
+
+    def read_text(self):
+        """返回剪贴板中的文本（统一为 \\n 换行）；没有可用后端或读取失败时返回空字符串"""
+        with self._lock:
+            while True:
+                if self._backend is None:
+                    self._backend = self._next_backend_locked()
+                    if self._backend is None:
+                        logging.error("没有可用的剪贴板后端")
+                        return ""
+                try:
+                    text = self._backend.read_text()
+                    break
+                except ClipboardUnavailable as e:
+                    logging.warning("剪贴板后端 %s 失效，改用下一个: %s", self._backend.name, e)
+                    self._backend.close()
+                    self._backend = None
+                except Exception as e:
+                    logging.error("读取剪贴板失败: %s", e)
+                    return ""
+        # 只有确实含有 \r 时才替换，避免为数 MB 的内容多生成一份副本
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def _html_backends_locked(self):
+        if self._backend is None:
+            self._backend = self._next_backend_locked()
+        if self._backend is not None:
+            yield self._backend
+        if self._html_writer is None and self._html_writer_factory is not None:
+            if isinstance(self._backend, TkClipboardBackend):
+                return
+            try:
+                self._html_writer = self._html_writer_factory()
+            except ClipboardUnavailable as e:
+                logging.info("无法创建写入富文本的剪贴板后端: %s", e)
+                # 不再重复尝试
+                self._html_writer_factory = None
+                return
+        if self._html_writer is not None:
+            yield self._html_writer
+
+    def write_html(self, fragment, text):
+        """
+        把富文本（HTML 片段）与纯文本同时写入剪贴板，成功返回 True；
+        没有后端能同时写入两者或写入失败时返回 False，由调用方改用其他方式复制。
+        """
+        with self._lock:
+            for backend in self._html_backends_locked():
+                try:
+                    backend.write_html(fragment, text)
+                    return True
+                except ClipboardUnavailable as e:
+                    logging.info("%s 后端无法直接写入富文本: %s", backend.name, e)
+                except Exception as e:
+                    logging.error("写入剪贴板失败: %s", e)
+                    return False
+            return False
+
+    def close(self):
+        with self._lock:
+            for backend in (self._backend, self._html_writer):
+                if backend is not None:
+                    backend.close()
+            self._backend = None
+            self._html_writer = None
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_clipboard_service():
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ClipboardService()
+        return _service
+
+
+def shutdown_clipboard_service():
+    with _service_lock:
+        if _service is not None:
+            _service.close()
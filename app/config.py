@@ -1,28 +1,33 @@
 # app/config.py
-import os
+import atexit
+import copy
 import json
 import logging
-import sys
+import os
 import platform
+import tempfile
+import threading
+
 from .utils import get_app_data_dir, get_default_directory
 
+# 连续修改配置时，最后一次修改后等待该时长（秒）再统一写盘
+DEFAULT_SAVE_DELAY = 0.5
+
+
 def get_config_path():
     """获取位于 app data 目录中的配置文件的路径"""
     return os.path.join(get_app_data_dir(), 'config.json')
 
-def save_config(data):
-    """保存配置到 JSON 文件"""
-    try:
-        with open(get_config_path(), 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
-        logging.info(f"配置已保存: {data}")
-    except Exception as e:
-        logging.error(f"保存配置文件失败: {e}")
-
-def load_config():
-    """从 JSON 文件加载配置，并与默认配置合并"""
-    config_path = get_config_path()
-    default_config = {
+
+def _legacy_config_path():
+    """旧版本把配置保存在另一个目录中，首次启动新版本时从这里迁移"""
+    if platform.system() == "Windows":
+        return os.path.join(os.environ.get('APPDATA', ''), 'MarkdownConverter', 'config.json')
+    return os.path.join(os.path.expanduser('~'), '.config', 'MarkdownConverter', 'config.json')
+
+
+def default_config():
+    return {
         "export_directory": get_default_directory(),
         "template_path": "",
         "styles": {
@@ -32,119 +37,203 @@ def load_config():
             "h3": {"font": "黑体", "size": 15, "color": "000000"}
         },
         "last_preset": "general",
+        "docx_engine": "pandoc",
+        "export_formats": ["docx"],
         "text_processing": {
             "remove_separators": False
+        },
+        "pandoc_pool": {
+            "size": 2,
+            "max_jobs": 200,
+            "use_server": True
+        },
+        "office_pool": {
+            "size": 1,
+            "max_operations": 50,
+            "prewarm": ""
+        },
+        "output_cache": {
+            "enabled": True,
+            "max_mb": 256,
+            "max_entries": 200,
+            "hardlink": False
+        },
+        "ast_cache": {
+            "enabled": True,
+            "max_mb": 64,
+            "max_entries": 8
+        },
+        # 复制到 Word/WPS 的方式：auto 直接写入富文本、含公式或图片时经过 Office；native 总是直接写入；office 总是经过 Office
+        "copy_mode": "auto",
+        "scratch": {
+            "slots": 4,
+            "max_idle": 300,
+            "use_ram_disk": True
+        },
+        # 为每次导出、复制采集性能数据，结果写入应用数据目录下的 profiles 文件夹
+        "profiling": {
+            "cprofile": False,
+            "tracemalloc": False
+        },
+        "chunked_conversion": {
+            "enabled": True,
+            "min_kb": 512,
+            "workers": 0
+        },
+        "watch": {
+            "enabled": False,
+            "source_dir": "",
+            "debounce_ms": 500,
+            "workers": 1,
+            "poll_interval": 1.0
+        },
+        "scheduler": {
+            "pandoc": 2,
+            "office": 1,
+            "shell": 2,
+            "background": 1
         }
     }
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                loaded = json.load(f)
-                # 智能合并，防止新版本增加配置项后旧配置文件出错
-                for key, value in loaded.items():
-                    if isinstance(value, dict) and isinstance(default_config.get(key), dict):
-                        default_config[key].update(value)
-                    else:
-                        default_config[key] = value
-                logging.info(f"配置已加载: {default_config}")
-                return default_config
-        except Exception as e:
-            logging.error(f"加载配置文件失败: {e}")
-    return default_config
 
-def get_app_data_dir():
-    """获取应用数据目录，以便存储日志和配置文件"""
-    if platform.system() == "Windows":
-        return os.path.join(os.environ['APPDATA'], 'MarkdownConverter')
-    else: # macOS and Linux
-        return os.path.join(os.path.expanduser('~'), '.config', 'MarkdownConverter')
-
-def setup_logging():
-    """配置日志系统"""
-    log_dir = get_app_data_dir()
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, 'app.log')
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, mode='w', encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
-
-class AppConfig:
-    def __init__(self):
-        app_data_dir = get_app_data_dir()
-        os.makedirs(app_data_dir, exist_ok=True)
-        self.config_path = os.path.join(app_data_dir, 'config.json')
-        self.config = self._load()
+
+def _merge_with_defaults(loaded):
+    """智能合并，防止新版本增加配置项后旧配置文件出错"""
+    merged = default_config()
+    for key, value in loaded.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class ConfigStore:
+    """
+    进程内唯一的配置来源。读写都在内存中完成并由锁保护，可在多个工作线程中同时使用；
+    修改后经过防抖延迟统一写盘，写盘时先写临时文件再原子替换，
+    只有当磁盘上的文件被外部修改（修改时间变化）且内存中没有未保存的修改时才重新加载。
+    """
+
+    def __init__(self, path=None, save_delay=DEFAULT_SAVE_DELAY):
+        self.path = path or get_config_path()
+        self.save_delay = save_delay
+        self._lock = threading.RLock()
+        self._data = None
+        self._mtime = None
+        self._dirty_keys = set()
+        self._timer = None
+        self._load()
+
+    def _stat_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
 
     def _load(self):
-        """从 JSON 文件加载配置，并与默认配置合并"""
-        default_config = {
-            "export_directory": get_default_directory(),
-            "template_path": "",
-            "styles": {
-                "body": {"font": "宋体", "size": 10.5, "color": "000000"},
-                "h1": {"font": "黑体", "size": 18, "color": "000000"},
-                "h2": {"font": "黑体", "size": 16, "color": "000000"},
-                "h3": {"font": "黑体", "size": 15, "color": "000000"}
-            },
-            "last_preset": "general",
-            "text_processing": {
-                "remove_separators": False
-            }
-        }
-        if os.path.exists(self.config_path):
+        source = self.path
+        if not os.path.exists(source) and os.path.exists(_legacy_config_path()):
+            source = _legacy_config_path()
+            logging.info("从旧版配置文件迁移: %s", source)
+        loaded = {}
+        if os.path.exists(source):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
+                with open(source, 'r', encoding='utf-8') as f:
                     loaded = json.load(f)
-                    # 智能合并，防止新版本增加配置项后旧配置文件出错
-                    for key, value in loaded.items():
-                        if isinstance(value, dict) and isinstance(default_config.get(key), dict):
-                            default_config[key].update(value)
-                        else:
-                            default_config[key] = value
-                    logging.info(f"配置已加载: {default_config}")
-                    return default_config
+                logging.info("配置已加载: %s", source)
             except Exception as e:
-                logging.error(f"加载配置文件失败: {e}")
-        return default_config
+                logging.error("加载配置文件失败: %s", e)
+        self._data = _merge_with_defaults(loaded)
+        self._mtime = self._stat_mtime()
 
-    def _save(self):
-        """保存配置到 JSON 文件"""
-        try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
-            logging.info(f"配置已保存至 {self.config_path}")
-        except Exception as e:
-            logging.error(f"保存配置文件失败: {e}")
+    def _reload_if_changed_locked(self):
+        if self._dirty_keys:
+            return
+        mtime = self._stat_mtime()
+        if mtime is not None and mtime != self._mtime:
+            logging.info("配置文件已在外部被修改，重新加载。")
+            self._load()
 
     def get(self, key, default=None):
-        """获取配置项"""
-        return self.config.get(key, default)
+        """读取配置项。返回的是副本，修改它不会影响配置，需通过 set/update 写回"""
+        with self._lock:
+            self._reload_if_changed_locked()
+            return copy.deepcopy(self._data.get(key, default))
+
+    def snapshot(self):
+        """返回全部配置的副本"""
+        with self._lock:
+            self._reload_if_changed_locked()
+            return copy.deepcopy(self._data)
 
     def set(self, key, value):
-        """设置配置项"""
-        self.config[key] = value
-        self._save()
-
-    def _get_default_config(self):
-        """获取默认配置"""
-        return {
-            "version": "3.0",
-            "export_directory": os.path.expanduser('~/Documents'),
-            "template_path": None,
-            "last_preset": "default",
-            "styles": {
-                "body": {"font": "宋体", "size": 12, "color": "000000"},
-                "h1": {"font": "黑体", "size": 22, "color": "000000"},
-                "h2": {"font": "黑体", "size": 18, "color": "000000"},
-                "h3": {"font": "黑体", "size": 15, "color": "000000"}
-            },
-            "text_processing": {
-                "remove_separators": False
-            }
-        }
\ No newline at end of file
+        self.update({key: value})
+
+    def update(self, values=None, **kwargs):
+        """修改一个或多个配置项，并安排一次延迟写盘"""
+        values = dict(values or {}, **kwargs)
+        with self._lock:
+            self._reload_if_changed_locked()
+            changed = [key for key, value in values.items() if self._data.get(key) != value]
+            if not changed:
+                return
+            for key in changed:
+                self._data[key] = copy.deepcopy(values[key])
+            self._dirty_keys.update(changed)
+            self._schedule_save_locked()
+
+    def _schedule_save_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.save_delay <= 0:
+            self._timer = None
+            self._write_locked()
+            return
+        self._timer = threading.Timer(self.save_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """立即写入尚未保存的修改"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._dirty_keys:
+                self._write_locked()
+
+    def _write_locked(self):
+        directory = os.path.dirname(self.path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.config-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, ensure_ascii=False, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            logging.info("配置已保存，修改项: %s", ', '.join(sorted(self._dirty_keys)))
+            self._dirty_keys.clear()
+            self._mtime = self._stat_mtime()
+        except Exception as e:
+            logging.error("保存配置文件失败: %s", e)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_config_store():
+    """获取进程内共享的配置存储，首次调用时从磁盘加载"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ConfigStore()
+            # 防抖期间退出时也要把修改写入磁盘
+            atexit.register(_store.flush)
+        return _store
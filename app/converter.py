@@ -0,0 +1,626 @@
+# app/converter.py
+# 不依赖 GUI（webview / tkinter / pywin32）的转换核心，供桌面端与命令行共用
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .ast_cache import ParsedMarkdown, ParsedMarkdownCache, content_digest
+from .chunked_docx import ChunkMergeError, convert_docx, convert_docx_chunked, should_convert_chunked
+from .disk_cache import DiskLRUCache
+from .native_docx import NATIVE_ENGINE, PANDOC_ENGINE, convert_native_docx
+from .pandoc_engine import MARKDOWN_FORMAT, get_pandoc_version
+from .scratch import get_scratch_workspace
+from .timing import propagate, span
+from .utils import get_app_data_dir
+
+# 样式文件生成逻辑变化时需要递增，使旧的缓存条目失效
+REFERENCE_DOCX_GENERATOR_VERSION = 1
+REFERENCE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+REFERENCE_CACHE_MAX_ENTRIES = 64
+_reference_cache = None
+_reference_cache_lock = threading.Lock()
+
+# 导出结果缓存：键的组成或转换逻辑变化时递增版本号
+OUTPUT_CACHE_VERSION = 2
+OUTPUT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+OUTPUT_CACHE_MAX_ENTRIES = 200
+_output_cache = None
+_output_cache_settings = {'enabled': True, 'max_bytes': OUTPUT_CACHE_MAX_BYTES,
+                          'max_entries': OUTPUT_CACHE_MAX_ENTRIES, 'hardlink': False}
+_output_cache_lock = threading.Lock()
+
+# 解析结果缓存：同一内容换用不同预设、模板导出时直接从 pandoc JSON AST 渲染，跳过预处理与 Markdown 解析
+AST_FORMAT = 'json'
+AST_CACHE_MAX_CHARS = 64 * 1024 * 1024
+AST_CACHE_MAX_ENTRIES = 8
+# JSON AST 通常是源文本的 6~12 倍，按此估算放不进缓存的文档不生成 AST
+AST_EXPANSION_ESTIMATE = 12
+_ast_cache = None
+_ast_cache_settings = {'enabled': True, 'max_chars': AST_CACHE_MAX_CHARS, 'max_entries': AST_CACHE_MAX_ENTRIES}
+_ast_cache_lock = threading.Lock()
+
+# 多格式导出：格式名 -> (pandoc 输出格式, 扩展名)；md 为经 pandoc 规范化后的 Markdown
+EXPORT_FORMATS = {
+    'docx': ('docx', '.docx'),
+    'html': ('html', '.html'),
+    'odt': ('odt', '.odt'),
+    'md': ('markdown', '.md'),
+}
+# 输出会覆盖源文件时（如把 md 导出到源文件所在目录）在扩展名前插入的标记
+NORMALIZED_MARKER = '.normalized'
+
+PRESET_STYLES = {
+    "general": {"body": {"font": "宋体", "size": 12, "color": "000000"},
+                "h1": {"font": "黑体", "size": 22, "color": "000000"},
+                "h2": {"font": "黑体", "size": 16, "color": "000000"},
+                "h3": {"font": "黑体", "size": 14, "color": "000000"}},
+    "academic": {"body": {"font": "Times New Roman", "size": 12, "color": "000000"},
+                 "h1": {"font": "Times New Roman", "size": 16, "color": "000000"},
+                 "h2": {"font": "Times New Roman", "size": 14, "color": "000000"},
+                 "h3": {"font": "Times New Roman", "size": 12, "color": "000000"}},
+    "business": {"body": {"font": "Arial", "size": 11, "color": "000000"},
+                 "h1": {"font": "Arial", "size": 24, "color": "1F497D"},
+                 "h2": {"font": "Arial", "size": 18, "color": "4F81BD"},
+                 "h3": {"font": "Arial", "size": 14, "color": "4F81BD"}},
+    "technical": {"body": {"font": "Courier New", "size": 11, "color": "000000"},
+                  "h1": {"font": "黑体", "size": 18, "color": "000000"},
+                  "h2": {"font": "黑体", "size": 16, "color": "000000"},
+                  "h3": {"font": "黑体", "size": 14, "color": "000000"}},
+    "teaching": {"body": {"font": "楷体", "size": 14, "color": "000000"},
+                 "h1": {"font": "黑体", "size": 22, "color": "000000"},
+                 "h2": {"font": "黑体", "size": 18, "color": "000000"},
+                 "h3": {"font": "楷体", "size": 16, "color": "000000"}},
+    "government": {"body": {"font": "仿宋", "size": 16, "color": "000000"},
+                   "h1": {"font": "黑体", "size": 22, "color": "000000"},
+                   "h2": {"font": "楷体", "size": 16, "color": "000000"},
+                   "h3": {"font": "仿宋", "size": 16, "color": "000000"}},
+    "modern": {"body": {"font": "微软雅黑", "size": 11, "color": "333333"},
+               "h1": {"font": "微软雅黑", "size": 24, "color": "0078D4"},
+               "h2": {"font": "微软雅黑", "size": 18, "color": "0078D4"},
+               "h3": {"font": "微软雅黑", "size": 15, "color": "333333"}}
+}
+
+
+# 预处理所用的正则模式，模块加载时编译一次
+_ORDERED_LIST_RE = re.compile(r'\d+\.\s')
+_TABLE_DELIMITER_RE = re.compile(r'[\s|: -]+')
+
+# 行类型: (是否普通文本行, 是否块级元素起始行, 是否列表项, 是否表格行)
+_LIST_ITEM_KIND = (False, True, True, False)
+_TABLE_KIND = (False, True, False, True)
+_QUOTE_KIND = (False, True, False, False)
+_HEADING_KIND = (False, False, False, False)
+_TEXT_KIND = (True, False, False, False)
+
+
+def _normalize_line(line):
+    """
+    字符级修正。各替换规则都不会跨行，因此既可逐行调用，也可直接作用于整篇文本，结果完全一致。
+    """
+    if '\\' in line:
+        # 修正 LaTex 公式中的多余反斜杠，并将 \<br\> 替换为两个空格
+        line = line.replace('\\\\', '\\').replace('\\<br\\>', '  ')
+    if '<br>' in line:
+        line = line.replace('<br>', '  ')
+    # 替换不间断空格与全角空格
+    if '\u00A0' in line:
+        line = line.replace('\u00A0', ' ')
+    if '\u3000' in line:
+        line = line.replace('\u3000', ' ')
+    return line
+
+
+def _classify_line(stripped):
+    """
+    判断去除首尾空白后的非空行属于哪种块，返回上面定义的行类型之一
+    """
+    first_char = stripped[0]
+    if first_char in '*-+':
+        is_list_item = stripped[1:2] == ' '
+    elif first_char.isdecimal():
+        # 与 \d 一致，只有首字符是数字时才需要正则判断有序列表
+        is_list_item = _ORDERED_LIST_RE.match(stripped) is not None
+    else:
+        is_list_item = False
+    if is_list_item:
+        return _LIST_ITEM_KIND
+    if first_char == '|':
+        return _TABLE_KIND
+    if first_char == '>':
+        return _QUOTE_KIND
+    if first_char == '#':
+        return _HEADING_KIND
+    return _TEXT_KIND
+
+
+def iter_preprocess_markdown(lines, normalized=False):
+    """
+    流式预处理：逐行读入（不含换行符），逐行输出。
+    在普通文本与紧随其后的列表、引用、表格之间，以及列表项与紧随其后的表格之间自动插入空行，
+    以解决因缺少空行导致的 Pandoc 转换失败问题。
+    normalized 为 True 表示调用方已对文本做过字符级修正。
+    """
+    inserted = 0
+    previous = None
+    previous_stripped = ''
+    previous_kind = None
+    for line in lines:
+        if not normalized:
+            line = _normalize_line(line)
+        stripped = line.strip()
+        kind = _classify_line(stripped) if stripped else None
+        if previous is not None:
+            yield previous
+            if previous_kind is not None and kind is not None and \
+                    ((previous_kind[0] and kind[1]) or (previous_kind[2] and kind[3])):
+                # 表格分隔行（如 |---|:---:|）之后不插入空行
+                if not ('|' in previous_stripped and _TABLE_DELIMITER_RE.fullmatch(previous_stripped)):
+                    inserted += 1
+                    yield ''
+        previous = line
+        previous_stripped = stripped
+        previous_kind = kind
+    if previous is not None:
+        yield previous
+    if inserted:
+        logging.info("自动修正：共插入 %s 个空行以确保块级元素格式正确。", inserted)
+
+
+def _preprocess_markdown(text):
+    """对 Markdown 文本进行预处理，以解决因缺少空行导致的 Pandoc 转换失败问题。"""
+    # 整篇文本一次性完成字符级修正（在 C 层完成，比逐行处理快得多），再交给流式状态机
+    return '\n'.join(iter_preprocess_markdown(_normalize_line(text).split('\n'), normalized=True))
+
+
+def build_reference_docx_bytes(styles):
+    """根据传入的样式字典在内存中生成 reference.docx，返回其内容"""
+    # ... (此函数代码与原文件相同，复制到此处即可)
+    try:
+        # python-docx 仅在第一次真正需要生成样式文件时才加载
+        import docx
+        from docx.shared import Pt, RGBColor
+        from docx.oxml.ns import qn
+
+        document = docx.Document()
+
+        def _apply_font_style(style, style_data):
+            font = style.font
+            font_name = style_data.get('font', '宋体')
+            size = float(style_data.get('size', 12))
+            color_hex = style_data.get('color', '000000')
+            font.size = Pt(size)
+            font.color.rgb = RGBColor.from_string(color_hex)
+            font.name = font_name
+            rfonts = font._element.rPr.rFonts
+            rfonts.set(qn('w:eastAsia'), font_name)
+            theme_attrs = ['asciiTheme', 'hAnsiTheme', 'eastAsiaTheme', 'cstheme']
+            for attr in theme_attrs:
+                if rfonts.get(qn(f'w:{attr}')) is not None:
+                    rfonts.attrib.pop(qn(f'w:{attr}'))
+
+        _apply_font_style(document.styles['Normal'], styles.get('body', {}))
+        for i in range(1, 4):
+            _apply_font_style(document.styles[f'Heading {i}'], styles.get(f'h{i}', {}))
+
+        buffer = io.BytesIO()
+        document.save(buffer)
+        return buffer.getvalue()
+    except Exception as e:
+        logging.error("创建动态样式文件失败: %s", e, exc_info=True)
+        return None
+
+
+def create_reference_docx(styles):
+    """根据传入的样式字典动态创建一个 reference.docx 临时文件，由调用方负责删除（供基准测试使用）"""
+    data = build_reference_docx_bytes(styles)
+    if data is None:
+        return None
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
+        temp_file.write(data)
+    logging.info("动态样式文件已创建: %s", temp_file.name)
+    return temp_file.name
+
+
+def _canonical_styles(styles):
+    """把样式字典规范化（只保留生成器实际使用的字段并统一类型），用于计算缓存键"""
+    canonical = {}
+    for element in ('body', 'h1', 'h2', 'h3'):
+        style_data = (styles or {}).get(element) or {}
+        size = style_data.get('size', 12)
+        try:
+            size = float(size)
+        except (TypeError, ValueError):
+            size = str(size)
+        canonical[element] = {
+            'font': style_data.get('font', '宋体'),
+            'size': size,
+            'color': str(style_data.get('color', '000000')).upper(),
+        }
+    return canonical
+
+
+def reference_docx_key(styles):
+    """根据规范化后的样式与生成器版本计算内容哈希"""
+    payload = json.dumps({'generator': REFERENCE_DOCX_GENERATOR_VERSION, 'styles': _canonical_styles(styles)},
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _get_reference_cache():
+    global _reference_cache
+    with _reference_cache_lock:
+        if _reference_cache is None:
+            _reference_cache = DiskLRUCache(os.path.join(get_app_data_dir(), 'cache', 'reference_docx'),
+                                            max_bytes=REFERENCE_CACHE_MAX_BYTES,
+                                            max_entries=REFERENCE_CACHE_MAX_ENTRIES, suffix='.docx')
+        return _reference_cache
+
+
+def get_reference_docx(styles):
+    """
+    返回与样式对应的 reference.docx 路径。
+    样式未变化时直接命中磁盘缓存，完全不调用 python-docx；返回的文件归缓存所有，调用方不得删除。
+    缓存无法写入时文件放在中间文件工作区中（按样式哈希命名，闲置后自动清理），同样不得删除。
+    """
+    cache = _get_reference_cache()
+    key = reference_docx_key(styles)
+    cached_path = cache.get(key)
+    if cached_path:
+        return cached_path
+    # 样式文件在内存中生成后直接写入缓存，不经过临时文件
+    with span('reference_doc'):
+        data = build_reference_docx_bytes(styles)
+    if data is None:
+        return None
+    try:
+        path = cache.put_bytes(key, data)
+    except Exception as e:
+        logging.error("写入样式文件缓存失败，改为写入中间文件工作区: %s", e)
+        try:
+            return get_scratch_workspace().write_named(f'reference-{key[:16]}.docx', data)
+        except OSError as e:
+            logging.error("写入样式文件失败: %s", e)
+            return None
+    logging.info("动态样式文件已创建: %s", path)
+    return path
+
+
+def prebuild_reference_docs(styles_list):
+    """预先生成一组样式对应的 reference.docx，已缓存的条目会被跳过"""
+    cache = _get_reference_cache()
+    built = 0
+    for styles in styles_list:
+        if not cache.contains(reference_docx_key(styles)):
+            if get_reference_docx(styles):
+                built += 1
+    if built:
+        logging.info("已预先生成 %s 个预设样式文件到缓存。", built)
+
+
+def file_digest(path):
+    """计算文件内容的 SHA-256，用于把自定义模板的内容纳入缓存键"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def configure_output_cache(enabled=True, max_bytes=OUTPUT_CACHE_MAX_BYTES, max_entries=OUTPUT_CACHE_MAX_ENTRIES,
+                           hardlink=False):
+    """设置导出结果缓存的容量与命中时的放置方式，下次访问缓存时生效"""
+    global _output_cache
+    with _output_cache_lock:
+        _output_cache_settings.update(enabled=bool(enabled), max_bytes=max_bytes, max_entries=max_entries,
+                                      hardlink=bool(hardlink))
+        _output_cache = None
+
+
+def _get_output_cache():
+    global _output_cache
+    with _output_cache_lock:
+        if not _output_cache_settings['enabled']:
+            return None
+        if _output_cache is None:
+            _output_cache = DiskLRUCache(os.path.join(get_app_data_dir(), 'cache', 'output_docx'),
+                                         max_bytes=_output_cache_settings['max_bytes'],
+                                         max_entries=_output_cache_settings['max_entries'], suffix='.docx')
+        return _output_cache
+
+
+def output_cache_key(source, to, reference_id, extra_args, format=MARKDOWN_FORMAT, engine=PANDOC_ENGINE):
+    """
+    根据预处理后的文本、输出格式、生效的样式文件标识、pandoc 版本、转换引擎与其余参数计算缓存键。
+    --reference-doc 的路径不参与计算（同一样式可能位于不同路径），由 reference_id 代表其内容。
+    """
+    args = [arg for arg in extra_args or [] if not arg.startswith('--reference-doc=')]
+    header = json.dumps({'version': OUTPUT_CACHE_VERSION, 'pandoc': get_pandoc_version(), 'from': format, 'to': to,
+                         'reference': reference_id, 'args': args, 'engine': engine}, sort_keys=True, separators=(',', ':'))
+    digest = hashlib.sha256(header.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(source.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _place_cached_output(cached_path, output_path, hardlink):
+    """
+    把缓存中的文件放到目标位置；硬链接失败（跨分区、文件系统不支持等）时退回复制。
+    硬链接与缓存共享同一份数据，若其他程序原地改写导出文件会连带改变缓存，因此默认关闭。
+    """
+    if hardlink:
+        # 先链接到同目录下的临时名称再原子替换，以便覆盖已存在的目标文件
+        temp_path = f"{output_path}.link-tmp"
+        try:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            os.link(cached_path, temp_path)
+            os.replace(temp_path, output_path)
+            return
+        except OSError as e:
+            logging.info("无法创建硬链接，改为复制: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    shutil.copyfile(cached_path, output_path)
+
+
+def convert_to_file(pool, source, to, output_path, extra_args=None, format=MARKDOWN_FORMAT, engine=PANDOC_ENGINE,
+                    ast=None):
+    """
+    转换并写入 output_path；超过阈值的大文档导出为 docx 时分块并行转换。
+    engine 为 native 时先尝试内置写入器，遇到不支持的语法自动回退到 pandoc。
+    ast 为同一文本的 pandoc JSON AST 时直接从 AST 渲染，不再解析 Markdown（分块转换仍使用文本）。
+    """
+    if to == 'docx':
+        if engine == NATIVE_ENGINE and format == MARKDOWN_FORMAT:
+            with span('native_docx'):
+                if convert_native_docx(source, output_path, extra_args):
+                    return
+        if ast is None or should_convert_chunked(source):
+            with span('pandoc'):
+                convert_docx(pool, source, output_path, format=format, extra_args=extra_args)
+            return
+    if ast is not None:
+        source, format = ast, AST_FORMAT
+    with span('pandoc'):
+        pool.convert_text(source=source, to=to, format=format, outputfile=output_path, extra_args=extra_args)
+
+
+def convert_to_bytes(pool, source, to, extra_args=None, format=MARKDOWN_FORMAT, engine=PANDOC_ENGINE, ast=None):
+    """
+    与 convert_to_file 相同，但结果以字节串返回：内置引擎与分块合并直接写入 BytesIO，
+    pandoc 的输出经标准输出（或 pandoc server 的响应）读回，全程不创建临时文件。
+    """
+    if to == 'docx':
+        if engine == NATIVE_ENGINE and format == MARKDOWN_FORMAT:
+            buffer = io.BytesIO()
+            with span('native_docx'):
+                if convert_native_docx(source, buffer, extra_args):
+                    return buffer.getvalue()
+        if should_convert_chunked(source):
+            buffer = io.BytesIO()
+            try:
+                with span('pandoc'):
+                    converted = convert_docx_chunked(source, buffer, format=format, extra_args=extra_args)
+                if converted:
+                    return buffer.getvalue()
+                logging.info("文档没有可以安全切分的顶层标题，使用整篇转换。")
+            except ChunkMergeError as e:
+                logging.warning("分块转换结果无法合并，改为整篇转换: %s", e)
+            # 与 convert_docx 一样，整篇转换使用文本
+            ast = None
+    if ast is not None:
+        source, format = ast, AST_FORMAT
+    with span('pandoc'):
+        return pool.convert_text(source=source, to=to, format=format, extra_args=extra_args)
+
+
+def convert_with_output_cache(pool, source, to, output_path, reference_id, extra_args=None, format=MARKDOWN_FORMAT,
+                              engine=PANDOC_ENGINE, ast=None):
+    """
+    转换并写入 output_path。内容、样式与参数都未变化时直接复用缓存中的结果而不调用 pandoc。
+    返回是否命中缓存。
+    """
+    cache = _get_output_cache()
+    if cache is None:
+        convert_to_file(pool, source, to, output_path, extra_args=extra_args, format=format, engine=engine, ast=ast)
+        return False
+    with span('output_cache'):
+        key = output_cache_key(source, to, reference_id, extra_args, format=format, engine=engine)
+        cached_path = cache.get(key)
+        if cached_path:
+            _place_cached_output(cached_path, output_path, _output_cache_settings['hardlink'])
+            logging.info("导出结果缓存命中，跳过 pandoc 转换: %s", output_path)
+            return True
+    convert_to_file(pool, source, to, output_path, extra_args=extra_args, format=format, engine=engine, ast=ast)
+    with span('output_cache'):
+        try:
+            cache.put_file(key, output_path)
+        except Exception as e:
+            logging.warning("写入导出结果缓存失败: %s", e)
+    return False
+
+
+def get_output_cache_stats():
+    """返回导出结果缓存的命中/未命中次数与占用情况，缓存被禁用时返回 None"""
+    cache = _get_output_cache()
+    return cache.stats() if cache is not None else None
+
+
+def configure_ast_cache(enabled=True, max_chars=AST_CACHE_MAX_CHARS, max_entries=AST_CACHE_MAX_ENTRIES):
+    """设置解析结果缓存的容量，已缓存的条目随之丢弃"""
+    global _ast_cache
+    with _ast_cache_lock:
+        _ast_cache_settings.update(enabled=bool(enabled), max_chars=max_chars, max_entries=max_entries)
+        _ast_cache = None
+
+
+def _get_ast_cache():
+    global _ast_cache
+    with _ast_cache_lock:
+        if not _ast_cache_settings['enabled']:
+            return None
+        if _ast_cache is None:
+            _ast_cache = ParsedMarkdownCache(max_entries=_ast_cache_settings['max_entries'],
+                                             max_chars=_ast_cache_settings['max_chars'])
+        return _ast_cache
+
+
+def parse_markdown(content):
+    """
+    返回内容对应的 ParsedMarkdown。相同内容再次导出时直接复用上次的预处理结果
+    （以及已经生成的 AST），不再重复预处理；缓存被禁用时每次都重新预处理。
+    """
+    cache = _get_ast_cache()
+    digest = content_digest(content)
+    if cache is not None:
+        parsed = cache.get(digest)
+        if parsed is not None:
+            return parsed
+    with span('preprocess'):
+        parsed = ParsedMarkdown(digest, _preprocess_markdown(content))
+    if cache is not None:
+        cache.put(parsed)
+    return parsed
+
+
+def wants_ast(parsed):
+    """是否值得为该内容生成 AST：缓存被禁用、已有 AST、文档会分块转换或大到放不进缓存时都不需要"""
+    if parsed.ast is not None or not parsed.source.strip() or _get_ast_cache() is None:
+        return False
+    if should_convert_chunked(parsed.source):
+        return False
+    return len(parsed.source) * AST_EXPANSION_ESTIMATE <= _ast_cache_settings['max_chars']
+
+
+def build_ast(pool, parsed):
+    """把预处理后的文本解析为 pandoc JSON AST 并记入缓存，返回 AST"""
+    if parsed.ast is None:
+        start = time.perf_counter()
+        ast = pool.convert_text(source=parsed.source, to=AST_FORMAT, format=MARKDOWN_FORMAT).decode('utf-8')
+        cache = _get_ast_cache()
+        if cache is not None:
+            cache.attach_ast(parsed, ast)
+        else:
+            parsed.ast = ast
+        logging.info("已生成 pandoc AST（%s 字符，耗时 %.0f ms），换用其他样式导出时将直接渲染。",
+                     len(ast), (time.perf_counter() - start) * 1000)
+    return parsed.ast
+
+
+def get_ast_cache_stats():
+    """返回解析结果缓存的命中/未命中次数与占用情况，缓存被禁用时返回 None"""
+    cache = _get_ast_cache()
+    return cache.stats() if cache is not None else None
+
+
+def export_extra_args(fmt, title=None):
+    """docx 以外格式的 pandoc 参数：html 输出带标题、用 MathJax 显示公式的完整网页"""
+    if fmt == 'html':
+        args = ['--standalone', '--mathjax']
+        if title:
+            args.append(f'--variable=pagetitle:{title}')
+        return args
+    return []
+
+
+def _same_file(path, other):
+    try:
+        return os.path.samefile(path, other)
+    except OSError:
+        return os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(other))
+
+
+def export_path(output_stem, fmt, source_path=None):
+    """格式 fmt 的输出路径；会覆盖源文件 source_path 时改为 <output_stem>.normalized.<扩展名>"""
+    suffix = EXPORT_FORMATS[fmt][1]
+    path = output_stem + suffix
+    if source_path and _same_file(path, source_path):
+        path = output_stem + NORMALIZED_MARKER + suffix
+        logging.info("%s 输出会覆盖源文件，改为写入 %s", fmt, path)
+    return path
+
+
+def export_formats(pool, parsed, formats, output_stem, docx_args=None, reference_id=None, engine=PANDOC_ENGINE,
+                   title=None, source_path=None):
+    """
+    把同一份解析结果导出为多种格式，文件名为 output_stem 加各格式的扩展名，各格式并发转换（不超过 CPU 核心数）。
+    给出源文件路径 source_path 时，不会覆盖源文件（见 export_path）。
+    需要 pandoc 渲染的格式不止一种时先生成一次 AST，各格式都从 AST 渲染，Markdown 只解析一次。
+    返回与 formats 顺序一致的结果列表 {'format', 'path', 'seconds', 'cached', 'error'}，单个格式失败不影响其他格式。
+    """
+    pandoc_formats = [fmt for fmt in formats if not (fmt == 'docx' and engine == NATIVE_ENGINE)]
+    if len(pandoc_formats) > 1 and parsed.ast is None:
+        try:
+            with span('build_ast'):
+                build_ast(pool, parsed)
+        except Exception as e:
+            logging.warning("生成 pandoc AST 失败，各格式分别解析 Markdown: %s", e)
+
+    def _export(fmt):
+        to = EXPORT_FORMATS[fmt][0]
+        path = export_path(output_stem, fmt, source_path)
+        start = time.perf_counter()
+        cached = False
+        error = None
+        try:
+            if fmt == 'docx':
+                cached = convert_with_output_cache(pool, parsed.source, 'docx', path, reference_id,
+                                                   extra_args=docx_args, engine=engine, ast=parsed.ast)
+            else:
+                convert_to_file(pool, parsed.source, to, path, extra_args=export_extra_args(fmt, title),
+                                ast=parsed.ast)
+        except Exception as e:
+            logging.error("导出 %s 失败: %s", fmt, e, exc_info=True)
+            error = str(e)
+        return {'format': fmt, 'path': path, 'seconds': time.perf_counter() - start, 'cached': cached,
+                'error': error}
+
+    workers = min(len(formats), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_export(fmt) for fmt in formats]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export') as executor:
+        return list(executor.map(propagate(_export), formats))
+
+
+def convert_markdown_file(pool, src_path, output_stem, docx_args=None, reference_id=None, engine=PANDOC_ENGINE,
+                          formats=('docx',), text_processing=None):
+    """
+    读取并转换单个 Markdown 文件（批量转换与监视文件夹共用），输出为 output_stem 加各格式的扩展名，
+    md 输出与源文件相同时改名为 .normalized.md，不会覆盖源文件。
+    返回 (输出文件列表, 输入字节数)；任一格式失败时抛出 RuntimeError。
+    """
+    with open(src_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    parsed = parse_markdown(process_text(content, text_processing or {}))
+    os.makedirs(os.path.dirname(output_stem) or '.', exist_ok=True)
+    results = export_formats(pool, parsed, list(formats), output_stem, docx_args=docx_args, reference_id=reference_id,
+                             engine=engine, title=os.path.basename(output_stem), source_path=src_path)
+    errors = [f"{result['format']}: {result['error']}" for result in results if result['error']]
+    if errors:
+        raise RuntimeError('; '.join(errors))
+    return [result['path'] for result in results], len(content.encode('utf-8'))
+
+
+def process_text(content, text_processing):
+    """
+    根据文本处理设置处理输入的文本
+    """
+    if not content:
+        return ""
+
+    processed_text = content
+
+    # 删除分隔线
+    if (text_processing or {}).get('remove_separators', False):
+        # 匹配任何三个以上的连字符（---）作为分隔线
+        processed_text = re.sub(r'^---+$', '', processed_text, flags=re.MULTILINE)
+
+    return processed_text
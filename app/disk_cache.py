@@ -0,0 +1,122 @@
+# app/disk_cache.py
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+
+class DiskLRUCache:
+    """
+    简单的磁盘 LRU 缓存：每个条目是目录下的一个文件，文件名即缓存键。
+    以文件的修改时间记录最近访问时间，超出容量或条目数上限时淘汰最久未使用的条目。
+    """
+
+    def __init__(self, directory, max_bytes, max_entries=None, suffix=''):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def get(self, key):
+        """命中时返回缓存文件路径并刷新其访问时间，未命中返回 None"""
+        path = self._path(key)
+        with self._lock:
+            if os.path.isfile(path):
+                try:
+                    os.utime(path, None)
+                except OSError:
+                    pass
+                self.hits += 1
+                return path
+            self.misses += 1
+            return None
+
+    def contains(self, key):
+        return os.path.isfile(self._path(key))
+
+    def put_file(self, key, src_path, move=False):
+        """将已有文件放入缓存，返回缓存文件路径"""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        os.close(fd)
+        try:
+            if move:
+                shutil.move(src_path, temp_path)
+            else:
+                shutil.copyfile(src_path, temp_path)
+            return self._commit(key, temp_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def put_bytes(self, key, data):
+        """将字节内容写入缓存，返回缓存文件路径"""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            return self._commit(key, temp_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _commit(self, key, temp_path):
+        path = self._path(key)
+        with self._lock:
+            # 先写临时文件再原子替换，避免并发读取到写了一半的条目
+            os.replace(temp_path, path)
+            self._evict_locked(keep=path)
+        return path
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith('.tmp-') or not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict_locked(self, keep=None):
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            over_size = self.max_bytes is not None and total > self.max_bytes
+            over_count = self.max_entries is not None and count > self.max_entries
+            if not (over_size or over_count):
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+                count -= 1
+                logging.info("缓存已淘汰: %s", path)
+            except OSError as e:
+                logging.warning("淘汰缓存条目失败 %s: %s", path, e)
+
+    def stats(self):
+        with self._lock:
+            entries = self._entries()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(entries),
+                "bytes": sum(size for _, size, _ in entries),
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+            }
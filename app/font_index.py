@@ -0,0 +1,267 @@
+# app/font_index.py
+import glob
+import json
+import logging
+import os
+import platform
+import re
+import subprocess
+import threading
+
+from .utils import get_app_data_dir
+
+# 索引格式变化时递增，旧索引会被视为失效
+FONT_INDEX_VERSION = 1
+
+# 无论系统是否安装都优先显示的常用字体
+PREFERRED_FONTS = ['宋体', '黑体', '楷体', '仿宋', '微软雅黑', 'Times New Roman', 'Arial', 'Courier New']
+
+# 常见中日韩字体的英文名关键字（小写），用于无法获取语言信息时判断是否支持 CJK
+_CJK_NAME_KEYWORDS = (
+    'simsun', 'simhei', 'simkai', 'kaiti', 'fangsong', 'yahei', 'jhenghei', 'mingliu', 'dengxian', 'stsong',
+    'stheiti', 'stkaiti', 'stfangsong', 'stxihei', 'pingfang', 'hiragino', 'heiti', 'songti', 'noto sans cjk',
+    'noto serif cjk', 'source han', 'wenquanyi', 'wqy', 'ar pl', 'droid sans fallback', 'ms gothic', 'ms mincho',
+    'meiryo', 'yu gothic', 'yu mincho', 'malgun', 'batang', 'gulim', 'dotum', 'gungsuh', 'nanum', 'apple sd gothic',
+    'lisong', 'lihei', 'youyuan', 'lishu', 'fzshuti', 'fzyaoti', 'huawen', 'hanyi',
+)
+_CJK_CHAR_RE = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]')
+# fontconfig 的 lang 属性中代表中日韩语言的标识
+_CJK_LANGS = ('zh', 'ja', 'ko')
+# Windows 注册表中字体名末尾常见的字重/字形后缀
+_STYLE_WORDS = ('Bold', 'Italic', 'Oblique', 'Light', 'Semilight', 'Semibold', 'Regular', 'Black', 'Thin',
+                'Medium', 'Heavy', 'ExtraLight', 'ExtraBold', 'Condensed', 'Narrow')
+
+
+def is_cjk_font_name(name):
+    """根据字体名称粗略判断字体是否支持中日韩文字"""
+    if _CJK_CHAR_RE.search(name):
+        return True
+    lowered = name.lower()
+    return any(keyword in lowered for keyword in _CJK_NAME_KEYWORDS)
+
+
+def _split_family_and_style(name):
+    """把 'Arial Bold Italic' 这样的名称拆分为 ('Arial', 'Bold Italic')"""
+    words = name.split()
+    style_words = []
+    while len(words) > 1 and words[-1] in _STYLE_WORDS:
+        style_words.insert(0, words.pop())
+    return ' '.join(words), ' '.join(style_words) or 'Regular'
+
+
+def _font_directories():
+    system = platform.system()
+    if system == "Windows":
+        return [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')]
+    if system == "Darwin":
+        return ['/System/Library/Fonts', '/Library/Fonts', os.path.expanduser('~/Library/Fonts')]
+    return ['/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts'),
+            os.path.expanduser('~/.local/share/fonts')]
+
+
+def compute_font_signature():
+    """
+    计算判断字体是否变化的签名：字体目录（及其一级子目录）的修改时间，
+    在 Windows 上还包括字体注册表键的最后写入时间。不需要枚举字体本身，开销很小。
+    """
+    signature = {}
+    for directory in _font_directories():
+        if not os.path.isdir(directory):
+            continue
+        paths = [directory] + [p for p in glob.glob(os.path.join(directory, '*')) if os.path.isdir(p)]
+        for path in paths:
+            try:
+                signature[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass
+    if platform.system() == "Windows":
+        import winreg
+        for hive_name, hive in (('HKLM', winreg.HKEY_LOCAL_MACHINE), ('HKCU', winreg.HKEY_CURRENT_USER)):
+            try:
+                with winreg.OpenKey(hive, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts") as key:
+                    signature[f'registry:{hive_name}'] = winreg.QueryInfoKey(key)[2]
+            except OSError:
+                pass
+    return signature
+
+
+def _scan_windows():
+    import winreg
+    fonts = {}
+    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        try:
+            key = winreg.OpenKey(hive, r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Fonts")
+        except OSError:
+            continue
+        with key:
+            i = 0
+            while True:
+                try:
+                    name, _, _ = winreg.EnumValue(key, i)
+                    i += 1
+                except OSError:
+                    break
+                # 例如 "SimSun & NSimSun (TrueType)"、"Arial Bold Italic (TrueType)"
+                for part in name.split(' (')[0].split(' & '):
+                    family, style = _split_family_and_style(part.strip())
+                    if family:
+                        fonts.setdefault(family, set()).add(style)
+    return {family: (styles, None) for family, styles in fonts.items()}
+
+
+def _scan_fontconfig():
+    output = subprocess.check_output(['fc-list', '--format', '%{family[0]}\t%{style[0]}\t%{lang}\n'],
+                                     text=True, encoding='utf-8', errors='replace')
+    fonts = {}
+    for line in output.splitlines():
+        parts = line.split('\t')
+        family = parts[0].strip()
+        if not family:
+            continue
+        style = parts[1].strip() if len(parts) > 1 and parts[1].strip() else 'Regular'
+        langs = parts[2].split('|') if len(parts) > 2 else []
+        cjk = any(lang.split('-')[0] in _CJK_LANGS for lang in langs)
+        styles, known_cjk = fonts.get(family, (set(), False))
+        styles.add(style)
+        fonts[family] = (styles, known_cjk or cjk)
+    return fonts
+
+
+def _scan_macos():
+    output = subprocess.check_output(['system_profiler', 'SPFontsDataType'], text=True, encoding='utf-8')
+    fonts = {}
+    family = None
+    for line in output.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('Family:'):
+            family = stripped[len('Family:'):].strip()
+            fonts.setdefault(family, set())
+        elif stripped.startswith('Style:') and family:
+            fonts[family].add(stripped[len('Style:'):].strip() or 'Regular')
+    return {family: (styles or {'Regular'}, None) for family, styles in fonts.items()}
+
+
+def scan_system_fonts():
+    """完整枚举系统字体，返回 {字体族: {"styles": [...], "cjk": bool}}"""
+    system = platform.system()
+    if system == "Windows":
+        raw = _scan_windows()
+    elif system == "Darwin":
+        # 优先使用 fontconfig（若已安装），它比 system_profiler 快得多且带有语言信息
+        try:
+            raw = _scan_fontconfig()
+        except (OSError, subprocess.CalledProcessError):
+            raw = _scan_macos()
+    else:
+        raw = _scan_fontconfig()
+    fonts = {}
+    for family, (styles, cjk) in raw.items():
+        fonts[family] = {
+            "styles": sorted(styles),
+            "cjk": bool(cjk) or is_cjk_font_name(family),
+        }
+    return fonts
+
+
+class FontIndex:
+    """
+    持久化的系统字体索引。启动时直接读取磁盘上的索引，
+    在窗口显示后由后台线程根据字体目录与注册表的修改时间判断是否需要重新扫描。
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_app_data_dir(), 'font_index.json')
+        self._lock = threading.Lock()
+        self._fonts = None
+        self._signature = None
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != FONT_INDEX_VERSION:
+                return False
+            self._fonts = data['fonts']
+            self._signature = data['signature']
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.warning("读取字体索引失败，将重新扫描: %s", e)
+            return False
+
+    def _save(self):
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': FONT_INDEX_VERSION, 'signature': self._signature, 'fonts': self._fonts},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            logging.error("保存字体索引失败: %s", e)
+
+    def _rescan(self):
+        """返回 (签名, 字体)；扫描失败时返回 None，调用方应保留已有索引，下次再重新尝试"""
+        signature = compute_font_signature()
+        try:
+            fonts = scan_system_fonts()
+        except Exception as e:
+            logging.error("获取系统字体失败: %s. 将仅使用常用字体列表。", e)
+            return None
+        return signature, fonts
+
+    def get_fonts(self):
+        """返回 {字体族: 元数据}。已有索引时直接读取，仅在首次运行时同步扫描。"""
+        with self._lock:
+            if self._fonts is None and not self._load():
+                logging.info("未找到字体索引，正在进行首次扫描...")
+                result = self._rescan()
+                if result is None:
+                    # 本次只使用常用字体，不保存空索引，下次启动（或刷新）时重新扫描
+                    self._signature, self._fonts = None, {}
+                else:
+                    self._signature, self._fonts = result
+                    self._save()
+            return self._fonts
+
+    def refresh(self):
+        """
+        检查字体是否发生变化，如有变化则重新扫描并保存索引。
+        返回 {"added": [...], "removed": [...], "fonts": {新增字体的元数据}}，无变化或扫描失败时返回 None。
+        """
+        old_fonts = self.get_fonts()
+        with self._lock:
+            if compute_font_signature() == self._signature:
+                logging.info("系统字体未发生变化，沿用已有字体索引。")
+                return None
+            result = self._rescan()
+            if result is None:
+                # 扫描失败不代表字体被删除：保留内存与磁盘上的索引
+                return None
+            signature, fonts = result
+            added = sorted(set(fonts) - set(old_fonts))
+            removed = sorted(set(old_fonts) - set(fonts))
+            self._signature, self._fonts = signature, fonts
+            self._save()
+        logging.info("字体索引已更新: 新增 %s 个，移除 %s 个。", len(added), len(removed))
+        if not added and not removed:
+            return None
+        return {"added": added, "removed": removed, "fonts": {name: fonts[name] for name in added}}
+
+
+def build_font_list(fonts):
+    """常用字体在前，其余系统字体按名称排序"""
+    final_list = list(PREFERRED_FONTS)
+    added_fonts = set(PREFERRED_FONTS)
+    for font in sorted(fonts):
+        if font not in added_fonts:
+            final_list.append(font)
+    return final_list
+
+
+def build_font_details(fonts):
+    """为字体列表中的每个字体生成元数据，常用字体即使未安装也会给出 CJK 判断"""
+    details = {name: {"styles": ["Regular"], "cjk": is_cjk_font_name(name)} for name in PREFERRED_FONTS}
+    details.update(fonts)
+    return details
@@ -9,7 +9,9 @@ import darkdetect
 
 from .backend_api import Api
 import app.backend_api as backend_api_module
-from .utils import image_to_base64, set_dark_title_bar
+from .startup_timing import log_startup_report
+from .ui_bundle import ensure_ui_bundle
+from .utils import set_dark_title_bar
 
 # --- 前端HTML模板 ---
 # 再次修正，并对脚本部分进行了格式化以提高可读性
@@ -18,6 +20,15 @@ html_template = """
 <meta charset="UTF-8"><title>Markdown to Word Converter by Youkies</title>
 <link rel="stylesheet" href="static/css/easymde.min.css">
 <link rel="stylesheet" href="static/css/classic.min.css"/>
+<script>
+(function () {
+    // 页面文件是预先生成并缓存的，主题在启动时通过 URL 片段 (#theme=dark) 传入，在首次绘制前应用以避免闪烁
+    var dark = /(?:^#|&)theme=dark(?:&|$)/.test(window.location.hash);
+    document.documentElement.setAttribute('data-theme', dark ? 'dark' : 'light');
+    document.documentElement.style.backgroundColor = dark ? '#252526' : '#f5f5f5';
+    document.documentElement.style.color = dark ? '#d4d4d4' : '#242424';
+})();
+</script>
 <style>
 :root {
     --bg-color: #f5f5f5; --editor-bg: #ffffff; --text-color: #242424; --border-color: #e0e0e0;
@@ -270,11 +281,12 @@ button img {
 .notification.show{opacity:1;} .notification.success{background-color:#28a745;} .notification.error{background-color:#dc3545;} .notification.info{background-color:#17a2b8;}
 .app-footer { padding: 4px 15px; background-color: var(--header-bg); border-top: 1px solid var(--border-color); color: var(--info-text); font-size: 0.8em; display: flex; justify-content: space-between; align-items: center; flex-shrink: 0; height: 14px; }
 #about-btn { cursor: pointer; text-decoration: underline; } #about-btn:hover { color: var(--button-bg); }
+#watch-toggle { cursor: pointer; text-decoration: underline; } #watch-toggle:hover { color: var(--button-bg); }
+#watch-toggle.active { color: var(--button-bg); font-weight: 600; }
 .modal-overlay { position: fixed; top: 0; left: 0; width: 100%; height: 100%; background-color: rgba(0, 0, 0, 0.6); display: none; justify-content: center; align-items: center; z-index: 1001; opacity: 0; transition: opacity 0.3s ease; }
 .modal-overlay.show { display: flex; opacity: 1; }
 .modal-content { background-color: var(--editor-bg); padding: 25px; border-radius: 8px; box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3); width: 90%; max-width: 650px; text-align: left; }
 .modal-content h3 { margin-top: 0; color: var(--text-color); text-align: center; } .modal-content p { color: var(--info-text); word-wrap: break-word; }
-#export-path-display { font-style: italic; font-size: 0.9em; }
 .modal-buttons { margin-top: 20px; display: flex; justify-content: flex-end; flex-wrap: wrap; gap: 10px; }
 .social-qr-codes { display: flex; justify-content: center; gap: 30px; margin-top: 20px; }
 .qr-code-item { text-align: center; } .qr-code-item img { width: 180px; height: auto; border-radius: 8px; border: 1px solid var(--border-color); }
@@ -291,6 +303,14 @@ button img {
 .color-picker-btn-wrapper { position: relative; width: 38px; height: 38px; }
 .pcr-button { width: 100%; height: 100%; border-radius: 5px; border: 1px solid var(--border-color) !important; }
 .pcr-app { z-index: 1002; }
+#engine-select { width: auto; padding-right: 32px; }
+.export-formats { display: flex; align-items: center; gap: 8px; font-size: 13px; color: var(--info-text); white-space: nowrap; }
+.export-formats label { display: flex; align-items: center; gap: 3px; cursor: pointer; }
+.export-path-list { margin: 0 0 10px; padding: 0; list-style: none; text-align: left; font-size: 13px; color: var(--info-text); }
+.export-path-list li { padding: 4px 0; word-break: break-all; }
+.export-path-list .export-format { display: inline-block; min-width: 48px; font-weight: 600; color: var(--text-color); }
+.export-path-list .export-time { margin-left: 6px; white-space: nowrap; }
+.export-path-list .export-error { color: #d9534f; }
 select, input[type="number"] { -webkit-appearance: none; -moz-appearance: none; appearance: none; background-color: var(--input-bg); border: 1px solid var(--border-color); border-radius: 5px; padding: 7px 10px; font-size: 13px; color: var(--text-color); box-sizing: border-box; }
 select { background-image: url("data:image/svg+xml,%3csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 16 16'%3e%3cpath fill='none' stroke='%236c757d' stroke-linecap='round' stroke-linejoin='round' stroke-width='2' d='M2 5l6 6 6-6'/%3e%3c/svg%3e"); background-repeat: no-repeat; background-position: right 0.75rem center; background-size: 16px 12px; }
 @media (prefers-color-scheme: dark){ select { background-image: url("data:image/svg+xml,%3csvg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 16 16'%3e%3cpath fill='none' stroke='%23a0a0a0' stroke-linecap='round' stroke-linejoin='round' stroke-width='2' d='M2 5l6 6 6-6'/%3e%3c/svg%3e"); } }
@@ -308,6 +328,7 @@ input[type=number]::-webkit-inner-spin-button, input[type=number]::-webkit-outer
 .custom-tooltip { position: fixed; display: none; background-color: var(--header-bg); color: var(--text-color); border: 1px solid var(--border-color); border-radius: 5px; padding: 10px; z-index: 1005; box-shadow: 0 4px 8px rgba(0,0,0,0.2); font-size: 12px; pointer-events: none; line-height: 1.6; }
 .tooltip-line { display: flex; align-items: center; gap: 8px; }
 .tooltip-color-swatch { display: inline-block; width: 12px; height: 12px; border: 1px solid var(--border-color); border-radius: 2px; flex-shrink: 0; }
+.font-filter-row { display: flex; align-items: center; gap: 6px; font-size: 13px; color: var(--info-text); margin-bottom: 15px; cursor: pointer; }
 .toolbar-separator {
     width: 1px;
     height: 24px;
@@ -318,20 +339,20 @@ input[type=number]::-webkit-inner-spin-button, input[type=number]::-webkit-outer
 </head><body>
 <script src="static/js/easymde.min.js"></script>
 <script src="static/js/marked.min.js"></script>
+<script src="static/js/incremental-preview.js"></script>
 <script src="static/js/pickr.min.js"></script>
 <script>
+// MathJax 已打包在 static/js/mathjax 中，文档首次出现公式时才加载（见 IncrementalPreview.loadMathJax），
+// 字体等资源按脚本所在目录自动定位，无需联网
 MathJax = {
   tex: { 
     inlineMath: [['$', '$'], ['\\(', '\\)']], 
     displayMath: [['$$', '$$'], ['\\[', '\\]']], 
     processEscapes: true 
   },
-  chtml: {
-    fontURL: 'https://cdn.jsdelivr.net/npm/mathjax@3/es5/output/chtml/fonts/woff-v2'
-  }
+  startup: { typeset: false }
 };
 </script>
-<script type="text/javascript" id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
 <div id="loader"><div class="spinner"></div><p>正在加载...</p></div>
 <div class="app-container">
     <header class="app-header">
@@ -340,6 +361,15 @@ MathJax = {
         <span id="folder-path" title="当前保存路径"></span>
         <span class="toolbar-separator"></span>
         <button id="save-file-btn">保存为 Word</button>
+        <select id="engine-select" title="转换引擎：快速引擎只支持常用语法，遇到公式、脚注等会自动改用 Pandoc">
+            <option value="pandoc">Pandoc 引擎</option>
+            <option value="native">快速引擎</option>
+        </select>
+        <span class="export-formats" title="保存为 Word 时同时导出的其他格式">
+            <label><input type="checkbox" value="html">HTML</label>
+            <label><input type="checkbox" value="odt">ODT</label>
+            <label><input type="checkbox" value="md">MD</label>
+        </span>
         <label for="file-name-input" class="input-label">输出文件名：</label>
         <input type="text" id="file-name-input" placeholder="文件名">
         <span class="toolbar-separator"></span>
@@ -409,13 +439,13 @@ MathJax = {
     </main>
     <footer class="app-footer">
         <span>Markdown to Word Converter by Youkies</span>
-        <div><span id="about-btn">请作者喝一杯咖啡</span><span style="margin: 0 5px;">|</span><span>Version 3.0</span></div>
+        <div><span id="watch-toggle">监视文件夹</span><span style="margin: 0 5px;">|</span><span id="about-btn">请作者喝一杯咖啡</span><span style="margin: 0 5px;">|</span><span>Version 3.0</span></div>
     </footer>
 </div>
 <div id="notification-box" class="notification"></div>
 <div id="export-success-dialog-overlay" class="modal-overlay">
     <div class="modal-content" style="text-align: center;">
-        <h3>导出成功！</h3><p>文件已保存至：<br><span id="export-path-display"></span></p>
+        <h3>导出成功！</h3><p>文件已保存至：</p><ul id="export-path-list" class="export-path-list"></ul>
         <div class="modal-buttons"><button id="open-file-btn-success" class="action-btn">打开文件</button><button id="open-folder-btn-success" class="action-btn">打开文件夹</button><button class="close-btn cancel-btn">关闭</button></div>
     </div>
 </div>
@@ -423,8 +453,8 @@ MathJax = {
     <div class="modal-content" style="text-align: center;">
         <h3>关于本软件</h3><p>这是一款简洁高效的 Markdown 到 Word 转换工具，支持实时预览、自定义 Word 模板和所有标准 LaTeX 数学公式。</p><p>酷安@Youkies</p><p>谢谢你的赞助！</p>
         <div class="social-qr-codes">
-            <div class="qr-code-item"><img src="__WECHAT_QR_PLACEHOLDER__" alt="微信二维码"><p>微信</p></div>
-            <div class="qr-code-item"><img src="__ALIPAY_QR_PLACEHOLDER__" alt="支付宝二维码"><p>支付宝</p></div>
+            <div class="qr-code-item"><img src="images/wechat_qr.png" loading="lazy" decoding="async" alt="微信二维码"><p>微信</p></div>
+            <div class="qr-code-item"><img src="images/alipay_qr.png" loading="lazy" decoding="async" alt="支付宝二维码"><p>支付宝</p></div>
         </div>
         <div class="modal-buttons"><button class="close-btn cancel-btn">关闭</button></div>
     </div>
@@ -432,6 +462,7 @@ MathJax = {
 <div id="style-settings-dialog-overlay" class="modal-overlay">
     <div class="modal-content">
         <h3>样式设置</h3>
+        <label class="font-filter-row"><input type="checkbox" id="cjk-fonts-only-checkbox">仅显示中文字体</label>
         <div class="style-section" data-style-for="body">
             <h4>正文设置</h4>
             <div class="style-grid">
@@ -545,13 +576,15 @@ async function initializeApp() {
             colorPickers: {},
             lastPreset: 'general',
 
+            preview: null,
+
             async renderPreview() {
-                const mdText = this.easyMDE.value();
-                this.previewDiv.innerHTML = marked.parse(mdText, { gfm: true, breaks: true });
-                if (window.MathJax && window.MathJax.typesetPromise) {
-                    try { await window.MathJax.typesetPromise([this.previewDiv]); } 
-                    catch(err) { console.error('MathJax Typesetting Error:', err); }
+                // 只重新解析变化的块并替换对应节点，公式也只对新节点排版
+                if (!this.preview) {
+                    this.preview = new IncrementalPreview(this.previewDiv, { gfm: true, breaks: true },
+                        () => IncrementalPreview.loadMathJax('static/js/mathjax/tex-mml-chtml.js'));
                 }
+                await this.preview.render(this.easyMDE.value());
             },
             async updateFilename() {
                 const content = this.easyMDE.value();
@@ -564,6 +597,21 @@ async function initializeApp() {
                 this.updateFilename(); 
                 this.renderPreview(); 
             },
+            onWatchStatusChanged(status) {
+                const toggle = document.getElementById('watch-toggle');
+                this.watchStatus = status;
+                if (status) {
+                    const baseName = status.source_dir.split(/[\\/]/).pop() || status.source_dir;
+                    toggle.textContent = '监视中：' + baseName;
+                    toggle.title = `正在监视 ${status.source_dir}，Markdown 文件保存后自动转换到 ${status.output_dir}。点击停止监视`;
+                    toggle.classList.add('active');
+                } else {
+                    toggle.textContent = '监视文件夹';
+                    toggle.title = '选择一个文件夹，其中的 Markdown 文件保存后自动转换到当前输出位置';
+                    toggle.classList.remove('active');
+                }
+            },
+            watchStatus: null,
             onTemplateSelected(path) { 
                 const baseName = path.split(/[\\\\/]/).pop();
                 this.templateStatus.textContent = baseName;
@@ -578,23 +626,76 @@ async function initializeApp() {
                 box.textContent = message; box.className = "notification show " + type;
                 setTimeout(() => { box.className = "notification"; }, 4000);
             },
-            showExportSuccessDialog(filePath) {
-                this.currentFilePath = filePath;
-                document.getElementById('export-path-display').textContent = filePath;
+            showExportSuccessDialog(results) {
+                // results: 每种格式一项 {format, path, seconds, cached, error}，第一项为 docx
+                const list = document.getElementById('export-path-list');
+                list.innerHTML = '';
+                results.forEach(result => {
+                    const item = document.createElement('li');
+                    const format = document.createElement('span');
+                    format.className = 'export-format';
+                    format.textContent = result.format.toUpperCase();
+                    const detail = document.createElement('span');
+                    const time = document.createElement('span');
+                    time.className = 'export-time';
+                    if (result.error) {
+                        detail.className = 'export-error';
+                        detail.textContent = '导出失败：' + result.error;
+                    } else {
+                        detail.textContent = result.path;
+                        time.textContent = `${result.seconds.toFixed(2)}s${result.cached ? '（缓存）' : ''}`;
+                    }
+                    item.append(format, detail, time);
+                    list.appendChild(item);
+                });
+                const opened = results.find(result => !result.error);
+                this.currentFilePath = opened ? opened.path : '';
                 document.getElementById('export-success-dialog-overlay').classList.add('show');
             },
+            selectedExportFormats() {
+                const extra = Array.from(document.querySelectorAll('.export-formats input:checked')).map(input => input.value);
+                return ['docx', ...extra];
+            },
             currentFilePath: '',
             loadStylesToForm(styles) {
                 this.styles = JSON.parse(JSON.stringify(styles));
                 for (const el in this.styles) {
                     const styleData = this.styles[el];
                     if(!styleData) continue;
-                    document.getElementById(`${el}-font`).value = styleData.font;
+                    this.selectFont(document.getElementById(`${el}-font`), styleData.font);
                     document.getElementById(`${el}-size`).value = styleData.size;
                     updateCnSizeSelect(el, styleData.size);
                     if(this.colorPickers[el]) { this.colorPickers[el].setColor('#' + styleData.color); }
                 }
             },
+            fontList: [],
+            fontDetails: {},
+            selectFont(select, font) {
+                // 当前字体可能被“仅显示中文字体”筛掉，此时临时补上一个选项
+                if (font && !Array.from(select.options).some(o => o.value === font)) {
+                    select.insertAdjacentHTML('afterbegin', `<option value="${font}">${font}</option>`);
+                }
+                select.value = font;
+            },
+            renderFontOptions() {
+                const cjkOnly = document.getElementById('cjk-fonts-only-checkbox').checked;
+                const fonts = cjkOnly ? this.fontList.filter(f => this.fontDetails[f] && this.fontDetails[f].cjk) : this.fontList;
+                const fontOptionsHtml = fonts.map(font => `<option value="${font}">${font}</option>`).join('');
+                document.querySelectorAll('select[id$="-font"]').forEach(select => {
+                    const current = select.value;
+                    select.innerHTML = fontOptionsHtml;
+                    if (current) this.selectFont(select, current);
+                });
+            },
+            onFontsUpdated(delta) {
+                this.fontList = delta.font_list;
+                Object.assign(this.fontDetails, delta.fonts);
+                delta.removed.forEach(f => { if (!this.fontList.includes(f)) delete this.fontDetails[f]; });
+                this.renderFontOptions();
+                if (delta.added.length) {
+                    this.showNotification(`检测到 ${delta.added.length} 个新字体，字体列表已更新。`, 'info');
+                }
+            },
             readStylesFromForm() {
                 const newStyles = {};
                 const elements = ['body', 'h1', 'h2', 'h3'];
@@ -688,17 +789,19 @@ async function initializeApp() {
             cnSelect.addEventListener('change', () => { if (cnSelect.value !== 'custom') ptInput.value = cnSelect.value; });
         });
 
-        const [initialInfo, systemFonts, presetStyles] = await Promise.all([
+        const [initialInfo, systemFonts, fontDetails, presetStyles] = await Promise.all([
             window.pywebview.api.get_initial_info(),
             window.pywebview.api.get_system_fonts(),
+            window.pywebview.api.get_font_details(),
             window.pywebview.api.get_preset_styles()
         ]);
 
         window.app.styles = initialInfo.styles;
         window.app.lastPreset = initialInfo.last_preset || 'general';
-        const fontSelects = document.querySelectorAll('select[id$="-font"]');
-        const fontOptionsHtml = systemFonts.map(font => `<option value="${font}">${font}</option>`).join('');
-        fontSelects.forEach(select => select.innerHTML = fontOptionsHtml);
+        window.app.fontList = systemFonts;
+        window.app.fontDetails = fontDetails;
+        window.app.renderFontOptions();
+        document.getElementById('cjk-fonts-only-checkbox').addEventListener('change', () => window.app.renderFontOptions());
 
         styleElements.forEach(el => {
             const picker = Pickr.create({
@@ -724,6 +827,10 @@ async function initializeApp() {
         window.app.folderPathEl.textContent = initialInfo.export_directory;
         window.app.folderPathEl.title = initialInfo.export_directory;
         window.app.fileNameInputEl.value = "无标题";
+        window.app.engineSelect = document.getElementById('engine-select');
+        window.app.engineSelect.value = initialInfo.docx_engine === 'native' ? 'native' : 'pandoc';
+        const exportFormats = initialInfo.export_formats || ['docx'];
+        document.querySelectorAll('.export-formats input').forEach(input => { input.checked = exportFormats.includes(input.value); });
 
         if (initialInfo.last_preset === 'custom') {
             if (initialInfo.template_path) {
@@ -757,8 +864,7 @@ async function initializeApp() {
         document.getElementById('template-presets-btn').addEventListener('click', () => { document.getElementById('template-dialog-overlay').classList.add('show'); });
         document.getElementById('clear-btn').addEventListener('click', () => { window.app.easyMDE.value(''); window.app.easyMDE.codemirror.focus(); });
         document.getElementById('paste-btn').addEventListener('click', async () => {
-            const content = await window.pywebview.api.get_clipboard_content();
-            const processedContent = await window.pywebview.api.process_text(content);
+            const processedContent = await window.pywebview.api.paste_and_process();
             window.app.easyMDE.value(processedContent);
             window.app.renderPreview();
             await window.app.updateFilename();
@@ -770,9 +876,9 @@ async function initializeApp() {
                 window.app.showNotification("内容为空，无法复制。", "info");
                 return;
             }
-            window.app.showNotification(`正在通过 ${targetApp.toUpperCase()} 后台处理，请稍候...`, "info");
+            window.app.showNotification(`正在复制到 ${targetApp.toUpperCase()}，请稍候...`, "info");
             const currentStyles = window.app.readStylesFromForm();
-            window.pywebview.api.copy_via_office_app(content, currentStyles, targetApp);
+            window.pywebview.api.copy_via_office_app(content, currentStyles, targetApp, window.app.engineSelect.value);
         };
 
         document.getElementById('copy-to-word-btn').addEventListener('click', () => copyHandler('word'));
@@ -794,7 +900,8 @@ async function initializeApp() {
                 return;
             }
             const currentStyles = window.app.readStylesFromForm();
-            window.pywebview.api.save_word_document(content, directory, filename, currentStyles);
+            window.pywebview.api.save_word_document(content, directory, filename, currentStyles, window.app.engineSelect.value,
+                                                    window.app.selectedExportFormats());
         });
 
         function setupModal(overlayId, openBtnId) {
@@ -809,6 +916,18 @@ async function initializeApp() {
             });
         }
         setupModal('about-dialog-overlay', 'about-btn');
+        window.app.onWatchStatusChanged(await window.pywebview.api.get_watch_status());
+        document.getElementById('watch-toggle').addEventListener('click', async () => {
+            if (window.app.watchStatus) {
+                window.app.onWatchStatusChanged(await window.pywebview.api.stop_watch());
+                window.app.showNotification("已停止监视文件夹。", "info");
+            } else {
+                const status = await window.pywebview.api.start_watch();
+                if (status) {
+                    window.app.showNotification(`开始监视 ${status.source_dir}，转换结果保存到 ${status.output_dir}`, "success");
+                }
+            }
+        });
         setupModal('export-success-dialog-overlay');
 
         document.getElementById('open-file-btn-success').addEventListener('click', () => {
@@ -966,46 +1085,18 @@ def create_and_run_gui():
     else:
         main_script_dir = os.getcwd()  # 默认使用当前工作目录
 
-    index_html_path = None
     try:
-        wechat_qr_base64 = image_to_base64("wechat_qr.png")
-        alipay_qr_base64 = image_to_base64("alipay_qr.png")
-
         # 检测系统主题
         is_dark = False
         try:
             is_dark = darkdetect.isDark()
-            logging.info(f"检测到系统主题: {'暗色' if is_dark else '亮色'}")
+            logging.info("检测到系统主题: %s", '暗色' if is_dark else '亮色')
         except Exception as e:
-            logging.warning(f"无法检测系统主题: {e}")
+            logging.warning("无法检测系统主题: %s", e)
 
-        # 动态插入暗色主题相关的脚本
-        theme_script = """
-        <script>
-            // 在文档加载前标记主题以避免闪烁
-            document.documentElement.setAttribute('data-theme', '%(theme)s');
-            document.documentElement.style.backgroundColor = '%(bg_color)s';
-            document.documentElement.style.color = '%(text_color)s';
-        </script>
-        """ % {
-            'theme': 'dark' if is_dark else 'light',
-            'bg_color': '#252526' if is_dark else '#f5f5f5',
-            'text_color': '#d4d4d4' if is_dark else '#242424'
-        }
-        
-        final_html_content = html_template.replace(
-            "__WECHAT_QR_PLACEHOLDER__", wechat_qr_base64
-        ).replace(
-            "__ALIPAY_QR_PLACEHOLDER__", alipay_qr_base64
-        )
-        
-        # 在<head>标签末尾插入主题初始化脚本
-        final_html_content = final_html_content.replace('</head>', f'{theme_script}</head>')
-
-        index_html_path = os.path.join(main_script_dir, 'index.html')
-        with open(index_html_path, 'w', encoding='utf-8') as f:
-            f.write(final_html_content)
-        logging.info(f"动态创建HTML文件于: {index_html_path}")
+        # 界面文件只在版本变化时生成一次，运行时只通过 URL 片段注入主题
+        index_html_path = ensure_ui_bundle(main_script_dir, html_template)
+        index_url = f"{index_html_path}#theme={'dark' if is_dark else 'light'}"
 
         api = Api()
         
@@ -1014,7 +1105,7 @@ def create_and_run_gui():
         # 先创建隐藏的窗口
         window = webview.create_window(
             'Markdown to Word Converter by Youkies',
-            url=index_html_path,
+            url=index_url,
             js_api=api,
             width=1400,
             height=900,
@@ -1037,19 +1128,19 @@ def create_and_run_gui():
                     hwnd = None
                     try:
                         hwnd = ctypes.windll.user32.FindWindowW(None, window.title)
-                        logging.info(f"通过FindWindowW获取句柄: {hwnd}")
+                        logging.info("通过FindWindowW获取句柄: %s", hwnd)
                     except Exception:
                         logging.warning("通过FindWindowW获取窗口句柄失败")
             
                     # 如果已找到句柄，应用暗色主题
                     if hwnd:
                         set_dark_title_bar(hwnd)
-                        logging.info(f"成功应用暗色标题栏到窗口 {hwnd}")
+                        logging.info("成功应用暗色标题栏到窗口 %s", hwnd)
                     else:
                         logging.warning("无法找到窗口句柄，将继续但不应用暗色标题栏")
                 except Exception as e:
                     # 即使出错也继续程序
-                    logging.error(f"应用暗色标题栏时出错: {e}", exc_info=True)
+                    logging.error("应用暗色标题栏时出错: %s", e, exc_info=True)
                     logging.info("继续程序执行，忽略暗色标题栏应用错误")
 
         def on_loaded():
@@ -1069,7 +1160,7 @@ def create_and_run_gui():
                         document.body.style.color = '#d4d4d4';
                     """)
                 except Exception as e:
-                    logging.warning(f"应用JS暗色样式失败: {e}")
+                    logging.warning("应用JS暗色样式失败: %s", e)
             
             # 不使用复杂的JS回调机制，直接显示窗口
             # 这样可以避免潜在的回调问题导致窗口不显示
@@ -1078,6 +1169,9 @@ def create_and_run_gui():
                 # 这里简化窗口显示逻辑，直接调用show()
                 window.show()
                 logging.info("窗口显示命令已执行")
+                log_startup_report("窗口显示")
+                # 窗口可见后再在后台检查字体变化，避免阻塞启动
+                api.refresh_fonts_in_background()
                 
                 # 在窗口显示后，设置适当的加载状态
                 try:
@@ -1092,20 +1186,14 @@ def create_and_run_gui():
                         }, 100);
                     """)
                 except Exception as e:
-                    logging.warning(f"设置窗口显示状态失败: {e}")
+                    logging.warning("设置窗口显示状态失败: %s", e)
             except Exception as e:
-                logging.error(f"显示窗口失败: {e}", exc_info=True)
+                logging.error("显示窗口失败: %s", e, exc_info=True)
 
         def on_closed():
             """窗口关闭时的清理工作"""
             logging.info("窗口关闭，开始执行清理任务...")
             api.cleanup_on_exit()
-            if index_html_path and os.path.exists(index_html_path):
-                try:
-                    os.unlink(index_html_path)
-                    logging.info(f"已删除临时HTML文件: {index_html_path}")
-                except Exception as e:
-                    logging.error(f"删除临时HTML文件失败 {index_html_path}: {e}")
 
         # 注册事件
         window.events.loaded += on_loaded
@@ -1116,6 +1204,4 @@ def create_and_run_gui():
 
     except Exception as e:
         logging.critical("GUI 创建过程中发生致命错误: ", exc_info=True)
-        if index_html_path and os.path.exists(index_html_path):
-            os.unlink(index_html_path)
         raise e
\ No newline at end of file
@@ -0,0 +1,432 @@
+# app/http_service.py
+# 本地 HTTP 转换服务：其他工具无需启动界面即可使用相同的预设样式与模板导出文档，只依赖标准库
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from .converter import (EXPORT_FORMATS, PRESET_STYLES, convert_to_bytes, export_extra_args, get_reference_docx,
+                        parse_markdown, process_text)
+from .native_docx import DOCX_ENGINES, PANDOC_ENGINE
+
+CONTENT_TYPES = {
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'html': 'text/html; charset=utf-8',
+    'odt': 'application/vnd.oasis.opendocument.text',
+    'md': 'text/markdown; charset=utf-8',
+}
+# 延迟直方图的桶上限（秒）
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+MAX_BODY_BYTES = 32 * 1024 * 1024
+_COLOR_RE = re.compile(r'[0-9A-Fa-f]{6}')
+_TEMPLATE_ID_RE = re.compile(r'[\w.-]+')
+_STYLE_ELEMENTS = ('body', 'h1', 'h2', 'h3')
+
+
+class ServiceError(Exception):
+    """以指定 HTTP 状态码返回给客户端的错误"""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+# ---------------------------------------------------------------- 指标
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{value}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+class Histogram:
+    """Prometheus 风格的累积直方图，按标签分组"""
+
+    def __init__(self, name, help_text, label_names=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        with self._lock:
+            series = self._series.setdefault(labels, {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0})
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][i] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series['counts']):
+                    label_str = _format_labels(self.label_names + ('le',), labels + (f'{bound:g}',))
+                    lines.append(f'{self.name}_bucket{label_str} {count}')
+                label_str = _format_labels(self.label_names + ('le',), labels + ('+Inf',))
+                lines.append(f'{self.name}_bucket{label_str} {series["count"]}')
+                base = _format_labels(self.label_names, labels)
+                lines.append(f'{self.name}_sum{base} {series["sum"]:.6f}')
+                lines.append(f'{self.name}_count{base} {series["count"]}')
+        return lines
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.label_names, labels)} {value}')
+        return lines
+
+
+class ServiceMetrics:
+    def __init__(self):
+        self.requests = Counter('md2word_http_requests_total', "按接口与状态码统计的请求数", ('endpoint', 'status'))
+        self.request_seconds = Histogram('md2word_http_request_duration_seconds', "请求处理总耗时",
+                                         ('endpoint',))
+        self.queue_wait_seconds = Histogram('md2word_conversion_queue_wait_seconds', "转换任务排队等待时间")
+        self.conversion_seconds = Histogram('md2word_conversion_duration_seconds', "转换耗时（不含排队）",
+                                            ('format', 'engine'))
+
+
+# ---------------------------------------------------------------- 转换
+
+def _validate_styles(styles):
+    """检查客户端传入的样式字典，格式与界面保存的 styles 相同"""
+    if not isinstance(styles, dict) or not styles:
+        raise ServiceError(400, "styles 必须是非空对象")
+    for element, style_data in styles.items():
+        if element not in _STYLE_ELEMENTS or not isinstance(style_data, dict):
+            raise ServiceError(400, f"styles 只能包含 {', '.join(_STYLE_ELEMENTS)}，且每项为对象")
+        if 'size' in style_data:
+            try:
+                size = float(style_data['size'])
+            except (TypeError, ValueError):
+                raise ServiceError(400, f"{element}.size 必须是数字")
+            if not 1 <= size <= 400:
+                raise ServiceError(400, f"{element}.size 超出范围")
+        if 'color' in style_data and not _COLOR_RE.fullmatch(str(style_data['color'])):
+            raise ServiceError(400, f"{element}.color 必须是 6 位十六进制颜色")
+        if 'font' in style_data and not isinstance(style_data['font'], str):
+            raise ServiceError(400, f"{element}.font 必须是字符串")
+    return styles
+
+
+class ConversionService:
+    """
+    在有界的线程池中执行转换。正在执行与排队的任务总数达到 workers + queue_size 时立即拒绝新请求（429），
+    而不是无限排队；模板来自 template_dir 中的 .docx 文件，以文件名（不含扩展名）作为模板 id。
+    """
+
+    def __init__(self, pool, workers=2, queue_size=8, template_dir=None, timeout=300):
+        self.pool = pool
+        self.workers = max(1, workers)
+        self.capacity = self.workers + max(0, queue_size)
+        self.template_dir = os.path.abspath(template_dir) if template_dir else None
+        self.timeout = timeout
+        self.metrics = ServiceMetrics()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='http-convert')
+        self._admitted = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def templates(self):
+        if not self.template_dir or not os.path.isdir(self.template_dir):
+            return {}
+        return {os.path.splitext(name)[0]: os.path.join(self.template_dir, name)
+                for name in sorted(os.listdir(self.template_dir))
+                if name.lower().endswith('.docx') and not name.startswith('~$')}
+
+    def load(self):
+        with self._lock:
+            return {'workers': self.workers, 'capacity': self.capacity, 'running': self._running,
+                    'queued': self._admitted - self._running}
+
+    def resolve_reference(self, options):
+        """按 template、styles 或 preset（默认 general）返回 docx 的 pandoc 参数"""
+        chosen = [key for key in ('template', 'styles', 'preset') if options.get(key)]
+        if len(chosen) > 1:
+            raise ServiceError(400, "template、styles 与 preset 只能指定其中一个")
+        if options.get('template'):
+            template_id = options['template']
+            if not isinstance(template_id, str):
+                raise ServiceError(400, "template 必须是字符串")
+            path = self.templates().get(template_id) if _TEMPLATE_ID_RE.fullmatch(template_id) else None
+            if not path:
+                raise ServiceError(404, f"模板不存在: {template_id}")
+            return [f'--reference-doc={path}']
+        if options.get('styles'):
+            styles = _validate_styles(options['styles'])
+        else:
+            preset = options.get('preset') or 'general'
+            # JSON 请求中的值可能是数组或对象，不能直接用于字典查找
+            if not isinstance(preset, str) or preset not in PRESET_STYLES:
+                raise ServiceError(400, f"未知的预设: {preset}")
+            styles = PRESET_STYLES[preset]
+        ref_path = get_reference_docx(styles)
+        if not ref_path:
+            raise ServiceError(500, "样式文件生成失败")
+        return [f'--reference-doc={ref_path}']
+
+    def convert(self, options):
+        """执行一次转换并返回 (输出字节, Content-Type)；队列已满时抛出 429"""
+        fmt = options.get('format') or 'docx'
+        if not isinstance(fmt, str) or fmt not in EXPORT_FORMATS:
+            raise ServiceError(400, f"不支持的格式: {fmt}")
+        engine = options.get('engine') or PANDOC_ENGINE
+        if not isinstance(engine, str) or engine not in DOCX_ENGINES:
+            raise ServiceError(400, f"未知的转换引擎: {engine}")
+        markdown = options.get('markdown')
+        if not isinstance(markdown, str) or not markdown.strip():
+            raise ServiceError(400, "markdown 不能为空")
+        with self._lock:
+            if self._admitted >= self.capacity:
+                raise ServiceError(429, "转换队列已满，请稍后重试", {'Retry-After': '1'})
+            self._admitted += 1
+        try:
+            future = self._executor.submit(self._convert, options, fmt, engine, markdown, time.perf_counter())
+        except RuntimeError:
+            self._release()
+            raise ServiceError(503, "转换服务正在停止")
+        # 名额在任务真正结束（或被取消）时才归还，超时返回的请求不会让执行中的转换数超过上限
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ServiceError(504, "转换超时")
+
+    def _release(self):
+        with self._lock:
+            self._admitted -= 1
+
+    def _convert(self, options, fmt, engine, markdown, queued_at):
+        started = time.perf_counter()
+        self.metrics.queue_wait_seconds.observe(started - queued_at)
+        with self._lock:
+            self._running += 1
+        try:
+            docx_args = self.resolve_reference(options)
+            text_processing = {'remove_separators': bool(options.get('remove_separators'))}
+            parsed = parse_markdown(process_text(markdown, text_processing))
+            if fmt == 'docx':
+                extra_args = docx_args
+            else:
+                extra_args, engine = export_extra_args(fmt, options.get('title') or 'document'), PANDOC_ENGINE
+            # 结果直接在内存中生成并返回，不经过任何临时文件
+            try:
+                data = convert_to_bytes(self.pool, parsed.source, EXPORT_FORMATS[fmt][0], extra_args=extra_args,
+                                        engine=engine, ast=parsed.ast)
+            except Exception as e:
+                logging.error("转换服务导出 %s 失败: %s", fmt, e, exc_info=True)
+                raise ServiceError(500, f"转换失败: {e}")
+            self.metrics.conversion_seconds.observe(time.perf_counter() - started, fmt, engine)
+            return data, CONTENT_TYPES[fmt]
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+
+# ---------------------------------------------------------------- HTTP
+
+class _ConversionHandler(BaseHTTPRequestHandler):
+    server_version = 'md2word'
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, format, *args):
+        logging.info("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send(status, body, 'application/json; charset=utf-8', headers)
+
+    def _check_token(self):
+        token = self.server.token
+        if token and self.headers.get('Authorization') != f'Bearer {token}':
+            raise ServiceError(401, "缺少或错误的访问令牌", {'WWW-Authenticate': 'Bearer'})
+
+    def _has_unread_body(self):
+        if self._body_consumed:
+            return False
+        return bool(self.headers.get('Transfer-Encoding')) or (self.headers.get('Content-Length') or '0').strip() != '0'
+
+    def _error_headers(self, headers=None):
+        # 请求体未读取（如令牌错误、路径不存在、请求体过大）时它仍留在连接中，会被当作下一个请求解析，只能关闭连接
+        headers = dict(headers or {})
+        if self._has_unread_body():
+            headers['Connection'] = 'close'
+        return headers
+
+    def _dispatch(self, handler, endpoint):
+        start = time.perf_counter()
+        status = 500
+        self._body_consumed = False
+        try:
+            self._check_token()
+            status = handler()
+        except ServiceError as e:
+            status = e.status
+            self._send_json(status, {'error': str(e)}, self._error_headers(e.headers))
+        except Exception as e:
+            logging.error("处理请求失败 %s: %s", self.path, e, exc_info=True)
+            self._send_json(500, {'error': str(e)}, self._error_headers())
+        finally:
+            if self._has_unread_body():
+                self.close_connection = True
+            metrics = self.service.metrics
+            metrics.requests.inc(endpoint, str(status))
+            metrics.request_seconds.observe(time.perf_counter() - start, endpoint)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        routes = {
+            '/health': self._get_health,
+            '/metrics': self._get_metrics,
+            '/presets': self._get_presets,
+            '/templates': self._get_templates,
+        }
+        handler = routes.get(path)
+        if handler is None:
+            self._dispatch(lambda: self._not_found(), 'other')
+        elif path == '/metrics':
+            # 抓取指标不需要令牌，也不计入请求统计，避免自我干扰
+            handler()
+        else:
+            self._dispatch(handler, path.strip('/'))
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path == '/convert':
+            self._dispatch(self._post_convert, 'convert')
+        else:
+            self._dispatch(lambda: self._not_found(), 'other')
+
+    def _not_found(self):
+        raise ServiceError(404, f"未知的路径: {self.path}")
+
+    def _get_health(self):
+        self._send_json(200, {'status': 'ok', **self.service.load()})
+        return 200
+
+    def _get_metrics(self):
+        metrics = self.service.metrics
+        load = self.service.load()
+        lines = []
+        for metric in (metrics.requests, metrics.request_seconds, metrics.queue_wait_seconds,
+                       metrics.conversion_seconds):
+            lines.extend(metric.render())
+        for name, help_text, value in (('md2word_conversions_running', "正在执行的转换数", load['running']),
+                                       ('md2word_conversions_queued', "排队等待的转换数", load['queued']),
+                                       ('md2word_conversion_capacity', "同时接受的转换上限（执行 + 排队）",
+                                        load['capacity'])):
+            lines.extend([f'# HELP {name} {help_text}', f'# TYPE {name} gauge', f'{name} {value}'])
+        self._send(200, ('\n'.join(lines) + '\n').encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8')
+        return 200
+
+    def _get_presets(self):
+        self._send_json(200, PRESET_STYLES)
+        return 200
+
+    def _get_templates(self):
+        self._send_json(200, sorted(self.service.templates()))
+        return 200
+
+    def _content_length(self):
+        if self.headers.get('Transfer-Encoding'):
+            raise ServiceError(411, "请求需要指定 Content-Length，不支持分块传输")
+        value = self.headers.get('Content-Length') or '0'
+        try:
+            length = int(value)
+        except ValueError:
+            raise ServiceError(400, f"无效的 Content-Length: {value}")
+        if length < 0:
+            raise ServiceError(400, f"无效的 Content-Length: {value}")
+        if length > MAX_BODY_BYTES:
+            raise ServiceError(413, "请求体过大")
+        return length
+
+    def _read_options(self):
+        """
+        解析转换请求：JSON 请求体（markdown 与各选项同在一个对象中），
+        或以 Markdown 文本为请求体、选项放在查询参数中。
+        """
+        body = self.rfile.read(self._content_length())
+        self._body_consumed = True
+        content_type = (self.headers.get('Content-Type') or '').split(';')[0].strip().lower()
+        try:
+            if content_type == 'application/json':
+                options = json.loads(body.decode('utf-8'))
+                if not isinstance(options, dict):
+                    raise ServiceError(400, "JSON 请求体必须是对象")
+                return options
+            options = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+            options['remove_separators'] = options.get('remove_separators') in ('1', 'true', 'yes')
+            options['markdown'] = body.decode('utf-8')
+            return options
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ServiceError(400, f"无法解析请求体: {e}")
+
+    def _post_convert(self):
+        options = self._read_options()
+        data, content_type = self.service.convert(options)
+        fmt = options.get('format') or 'docx'
+        filename = f"{options.get('title') or 'document'}{EXPORT_FORMATS[fmt][1]}"
+        self._send(200, data, content_type,
+                   {'Content-Disposition': f"attachment; filename*=UTF-8''{quote(filename)}"})
+        return 200
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service, token=None):
+        super().__init__(address, _ConversionHandler)
+        self.service = service
+        self.token = token
+
+
+def create_server(service, host='127.0.0.1', port=8765, token=None):
+    """创建（尚未开始服务的）HTTP 服务器；port 为 0 时由系统分配端口，实际端口见 server.server_address"""
+    return ConversionHTTPServer((host, port), service, token=token)
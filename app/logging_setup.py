@@ -0,0 +1,135 @@
+# app/logging_setup.py
+# 非阻塞日志：业务线程只把日志记录放入队列，格式化与写文件都在专用的监听线程中完成
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(threadName)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+
+_listener = None
+_rate_filter = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    标准 QueueHandler 会在入队前格式化消息，这里改为原样入队，把格式化也推迟到监听线程。
+    队列只在进程内使用，记录对象无需可序列化；调用方不应在记录日志后修改作为参数传入的对象。
+    """
+
+    def prepare(self, record):
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    限制同一位置（同一行代码）的重复日志：每个时间窗口内最多放行 burst 条，
+    其余计数后丢弃，并在该位置下一条被放行的日志末尾注明被省略的条数。ERROR 及以上级别从不限制。
+    """
+
+    _MAX_TRACKED = 1024
+
+    def __init__(self, burst=20, window=10.0):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._lock = threading.Lock()
+        # (文件, 行号) -> [窗口开始时间, 窗口内已放行条数, 被省略条数, 消息模板]
+        self._state = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.ERROR:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                self._state[key] = [now, 1, 0, record.msg]
+                if len(self._state) > self._MAX_TRACKED:
+                    self._prune_locked(now)
+            elif state[1] < self.burst:
+                state[1] += 1
+                return True
+            else:
+                state[2] += 1
+                return False
+        if suppressed:
+            self._annotate(record, suppressed)
+        return True
+
+    def _annotate(self, record, suppressed):
+        # 先按原参数格式化，再附加说明，避免说明文字干扰 % 格式化
+        record.msg = f"{record.getMessage()}（此前 {self.window:.0f} 秒内另有 {suppressed} 条相同日志被省略）"
+        record.args = None
+
+    def _prune_locked(self, now):
+        for key in [k for k, state in self._state.items() if now - state[0] >= self.window and not state[2]]:
+            del self._state[key]
+
+    def pending_summaries(self):
+        """返回仍有被省略计数的 (文件, 行号, 消息模板, 条数) 并清空计数，用于关闭日志系统前输出汇总"""
+        with self._lock:
+            summaries = [(*key, state[3], state[2]) for key, state in self._state.items() if state[2]]
+            self._state.clear()
+        return summaries
+
+
+def setup_logging(log_file_path, level=logging.INFO, max_bytes=DEFAULT_MAX_BYTES, backup_count=DEFAULT_BACKUP_COUNT,
+                  console=True, rate_limit=True):
+    """
+    配置根日志记录器：按大小轮转的日志文件（追加写入，不再在启动时清空）与可选的标准输出，
+    二者都挂在 QueueListener 上，由专用线程完成格式化与 I/O。
+    """
+    global _listener, _rate_filter
+    if _listener is not None:
+        return _listener
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    handlers = []
+    file_handler = logging.handlers.RotatingFileHandler(log_file_path, maxBytes=max_bytes,
+                                                        backupCount=backup_count, encoding='utf-8')
+    handlers.append(file_handler)
+    if console and sys.stdout is not None:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    if rate_limit:
+        _rate_filter = RateLimitFilter()
+        queue_handler.addFilter(_rate_filter)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # logging 模块自身的 atexit 清理晚于此处注册的函数执行，确保队列中的日志先写完
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """输出被省略日志的汇总，等待队列中的日志全部写出后停止监听线程"""
+    global _listener, _rate_filter
+    if _listener is None:
+        return
+    if _rate_filter is not None:
+        for pathname, lineno, msg, count in _rate_filter.pending_summaries():
+            logging.info("以下日志在最后一个时间窗口内被省略了 %s 条: %s (%s:%s)", count, msg, pathname, lineno)
+        _rate_filter = None
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
@@ -0,0 +1,813 @@
+# app/native_docx.py
+# 内置的 docx 写入器：在进程内解析 Markdown，直接把 WordprocessingML 写入参考文档的副本，
+# 省去启动 pandoc 的开销。只覆盖常用子集（标题、段落、强调、链接、列表、引用、代码块、简单表格、分隔线），
+# 遇到公式、脚注、图片、HTML 等不支持的语法时由调用方改用 pandoc。
+# 输出的段落样式、列表编号与文字处理（智能引号、破折号、标题书签）都与 pandoc 的 docx 输出保持一致。
+import functools
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import zipfile
+from urllib.parse import unquote
+
+PANDOC_ENGINE = 'pandoc'
+NATIVE_ENGINE = 'native'
+DOCX_ENGINES = (PANDOC_ENGINE, NATIVE_ENGINE)
+
+_DOCUMENT_PART = 'word/document.xml'
+_DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+_STYLES_PART = 'word/styles.xml'
+_NUMBERING_PART = 'word/numbering.xml'
+_CONTENT_TYPES_PART = '[Content_Types].xml'
+_REL_TYPE_PREFIX = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+_NUMBERING_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml'
+_W_NAMESPACE = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+# 正文中用到的命名空间：超链接需要 r，分隔线需要 v 与 o
+_REQUIRED_NAMESPACES = {
+    'w': _W_NAMESPACE,
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'v': 'urn:schemas-microsoft-com:vml',
+    'o': 'urn:schemas-microsoft-com:office:office',
+}
+# 与 pandoc 默认的 --columns 一致：表格源码中有行超过该宽度时按分隔行的横线数分配列宽
+_PANDOC_COLUMNS = 72
+# pandoc 在 docx 中假定的正文宽度（twip），用于计算表格列宽
+_TABLE_TEXT_WIDTH = 7920
+
+# pandoc 的 Markdown 扩展中 commonmark 解析器无法正确处理的语法，出现时改用 pandoc
+_UNSUPPORTED_SOURCE_PATTERNS = [
+    (re.compile(r'\A(?:---|%)'), "文档元数据块"),
+    (re.compile(r'^ {0,3}\[\^[^\]]+\]:', re.MULTILINE), "脚注"),
+    (re.compile(r'^ {0,3}:::', re.MULTILINE), "fenced div"),
+    (re.compile(r'^ {0,3}[:~](?: {1,3}|\t)\S', re.MULTILINE), "定义列表"),
+    (re.compile(r'^ {0,3}\+[-=:+]+\+[ \t]*$|^ {0,3}-{3,}(?:[ \t]+-{3,})+[ \t]*$', re.MULTILINE), "网格表格或简单表格"),
+    (re.compile(r'^ *(?:[-+*]|\d+[.)])[ \t]+\[[ xX]\][ \t]', re.MULTILINE), "任务列表"),
+    (re.compile(r'^ *(?:\(?(?:[a-zA-Z]|[ivxlcdmIVXLCDM]+|#|@[\w-]*)[.)]|\((?:\d+|@[\w-]*)\))[ \t]+\S', re.MULTILINE),
+     "字母、罗马数字或示例编号列表"),
+]
+# 段落内容（尚未解析的行内源码）中的不支持语法：公式、原始 TeX、脚注与上标、下标、属性块（含行内代码的属性），
+# 以及段落末尾的反斜杠（pandoc 视为换行，commonmark 保留为文字）
+_UNSUPPORTED_INLINE_RE = re.compile(r'\$|\\[(\[a-zA-Z]|\^|(?<!~)~(?!~)|[\])`]\{|(?<!\\)(?:\\\\)*\\\Z')
+_HEADING_ATTRIBUTES_RE = re.compile(r'\{[#.][^}]*\}\s*$')
+
+_QUOTE_RE = re.compile(r'["\']')
+_SPACES_RE = re.compile(r'[ \t]+')
+_INVALID_XML_CHARS_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+_CJK_RE = re.compile('[\u1100-\u11ff\u2e80-\u2fdf\u2ff0-\u9fff\ua000-\ua4cf\uac00-\ud7af\uf900-\ufaff'
+                     '\ufe30-\ufe4f\uff00-\uffef\U00020000-\U0002fa1f]')
+# pandoc 默认的缩写表：缩写后面的空格会被替换为不间断空格
+_ABBREVIATIONS = (
+    'aet. aetat. al. Apr. Aug. bk. Bros. c. Capt. cf. ch. chap. chs. Co. col. Corp. cp. d. Dec. Dr. e.g. ed. eds. '
+    'esp. f. fasc. Feb. ff. fig. fl. fol. fols. Fr. Gen. Gov. Hon. i.e. ill. Inc. incl. Jan. Jr. Jul. Jun. Ltd. '
+    'M.A. M.D. Mar. Mr. Mrs. Ms. n. n.b. nn. No. Nov. Oct. p. Ph.D. pp. Pres. Prof. pt. q.v. Rep. Rev. s.v. s.vv. '
+    'saec. sec. Sen. Sep. Sept. Sgt. Sr. St. univ. viz. vol. vs.'
+).split()
+_ABBREVIATION_RE = re.compile(r'(?<![\w.])(?:%s) (?=[^\s@])' % '|'.join(
+    re.escape(abbr) for abbr in sorted(_ABBREVIATIONS, key=len, reverse=True)))
+_MARKUP = '\x00'
+
+# 参考文档中缺少时需要补充的样式（与 pandoc 输出代码块时补充的定义一致）
+_SOURCE_CODE_STYLE = ('<w:style w:type="paragraph" w:customStyle="1" w:styleId="SourceCode">'
+                      '<w:name w:val="Source Code" /><w:basedOn w:val="Normal" /><w:link w:val="VerbatimChar" />'
+                      '<w:pPr><w:wordWrap w:val="off" /></w:pPr></w:style>')
+_HORIZONTAL_RULE = ('<w:p><w:r><w:pict><v:rect style="width:0;height:1.5pt" o:hralign="center" o:hrstd="t" '
+                    'o:hr="t" /></w:pict></w:r></w:p>')
+_BULLET_LEVELS = (('\uf0b7', 'Symbol'), ('o', 'Courier New'), ('\uf0a7', 'Wingdings'))
+
+_parser = None
+_parser_lock = threading.Lock()
+
+
+class UnsupportedMarkdown(Exception):
+    """文档包含内置写入器不支持的语法，应改用 pandoc 转换"""
+
+
+def _get_parser():
+    """按需创建 markdown-it 解析器；未安装 markdown-it-py 时返回 None"""
+    global _parser
+    with _parser_lock:
+        if _parser is None:
+            try:
+                from markdown_it import MarkdownIt
+            except ImportError:
+                _parser = False
+                logging.info("未安装 markdown-it-py，内置 docx 引擎不可用，将始终使用 pandoc。")
+            else:
+                # 保留转义字符为独立的 text_special 记号，智能引号据此跳过被转义的引号
+                _parser = MarkdownIt('commonmark', {'html': True}).enable(['table', 'strikethrough'])
+                _parser.disable('text_join', ignoreInvalid=True)
+        return _parser or None
+
+
+def native_engine_available():
+    return _get_parser() is not None
+
+
+def _escape(text):
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;')
+    return _INVALID_XML_CHARS_RE.sub('', text)
+
+
+# ---------------------------------------------------------------------------
+# 与 pandoc smart 扩展一致的文字处理
+# ---------------------------------------------------------------------------
+
+def _after_string(text, i):
+    """i 之前紧挨着的是否为单词（pandoc 的 Str），引号在单词之后不能作为左引号"""
+    if i == 0:
+        return False
+    previous = text[i - 1]
+    if previous.isalnum():
+        return True
+    return previous == '.' and (i < 2 or text[i - 2] != '.')
+
+
+def _smart_quotes(text):
+    """
+    按 pandoc 的规则解析直引号，返回 {位置: 弯引号}。
+    左引号必须不紧跟在单词之后、后面不是空白，且能找到对应的右引号；
+    找不到时双引号视为左引号、单引号视为撇号；不能作为左引号的双引号一律视为右引号。
+    """
+    positions = [match.start() for match in _QUOTE_RE.finditer(text)]
+    count = len(positions)
+    length = len(text)
+
+    def can_open(i):
+        return not _after_string(text, i) and i + 1 < length and not text[i + 1].isspace()
+
+    def parse(k, end, depth):
+        result = {}
+        while k < count:
+            i = positions[k]
+            char = text[i]
+            if char == end and (char == '"' or i + 1 >= length or not text[i + 1].isalnum()):
+                return k, result
+            if char != end and depth < 32 and can_open(i):
+                close, inner = parse(k + 1, char, depth + 1)
+                if close is not None:
+                    result.update(inner)
+                    result[i] = '“' if char == '"' else '‘'
+                    result[positions[close]] = '”' if char == '"' else '’'
+                    k = close + 1
+                    continue
+                result[i] = '“' if char == '"' else '’'
+            else:
+                result[i] = '”' if char == '"' else '’'
+            k += 1
+        return None, result
+
+    return parse(0, None, 0)[1]
+
+
+def _smarten(children):
+    """对一段行内记号做智能标点处理：合并空白、弯引号、缩写后的不间断空格、破折号与省略号"""
+    pieces = []
+    needs_context = False
+    for token in children:
+        if token.type == 'text':
+            token.content = _SPACES_RE.sub(' ', token.content)
+            pieces.append(token.content)
+            if '"' in token.content or "'" in token.content or '. ' in token.content:
+                needs_context = True
+        elif token.type in ('softbreak', 'hardbreak'):
+            pieces.append(' ')
+        else:
+            pieces.append(_MARKUP)
+    if needs_context:
+        # 引号的配对跨越强调、链接等记号，因此在整段文字上统一计算
+        text = ''.join(pieces)
+        replacements = _smart_quotes(text)
+        for match in _ABBREVIATION_RE.finditer(text):
+            replacements[match.end() - 1] = '\xa0'
+        if replacements:
+            offset = 0
+            for token, piece in zip(children, pieces):
+                if token.type == 'text':
+                    chars = [replacements.get(offset + j, char) for j, char in enumerate(piece)]
+                    token.content = ''.join(chars)
+                offset += len(piece)
+    for token in children:
+        if token.type == 'text' and ('--' in token.content or '...' in token.content):
+            token.content = token.content.replace('---', '—').replace('--', '–').replace('...', '…')
+
+
+def _identifier(text, used):
+    """按 pandoc 的 auto_identifiers 规则由标题文字生成书签名，并在全文范围内去重"""
+    text = ''.join(char for char in text.lower() if char.isspace() or char.isalnum() or char in '-_.')
+    text = '-'.join(text.split())
+    start = 0
+    while start < len(text) and not text[start].isalpha():
+        start += 1
+    base = text[start:] or 'section'
+    name = base
+    suffix = 0
+    while name in used:
+        suffix += 1
+        name = f"{base}-{suffix}"
+    used.add(name)
+    return name
+
+
+# ---------------------------------------------------------------------------
+# 参考文档
+# ---------------------------------------------------------------------------
+
+class _ReferenceTemplate:
+    """解析一次即可复用的参考文档：原样复制的部件、正文前后的 XML、关系表、编号与样式定义"""
+
+    def __init__(self, path):
+        with zipfile.ZipFile(path) as archive:
+            self.entries = [(info.filename, archive.read(info.filename)) for info in archive.infolist()]
+        parts = dict(self.entries)
+        for name in (_DOCUMENT_PART, _DOCUMENT_RELS_PART, _STYLES_PART, _CONTENT_TYPES_PART):
+            if name not in parts:
+                raise UnsupportedMarkdown(f"参考文档缺少部件 {name}")
+        document = parts[_DOCUMENT_PART].decode('utf-8')
+        body_start = document.find('<w:body>')
+        body_end = document.rfind('</w:body>')
+        if body_start < 0 or body_end < 0:
+            raise UnsupportedMarkdown("参考文档中没有找到正文")
+        prefix = _ensure_namespaces(document[:body_start + len('<w:body>')])
+        body = document[body_start + len('<w:body>'):body_end]
+        # 与 pandoc 一样丢弃参考文档的正文内容，只保留最后的节属性（页面大小、页边距等）
+        sect_start = body.rfind('<w:sectPr')
+        sect_pr = body[sect_start:] if sect_start >= 0 and body.rstrip().endswith('</w:sectPr>') else ''
+        self.document_prefix = prefix.encode('utf-8')
+        self.document_suffix = (sect_pr + document[body_end:]).encode('utf-8')
+
+        self.rels_xml = parts[_DOCUMENT_RELS_PART].decode('utf-8')
+        self.max_rid = max((int(value) for value in re.findall(r'Id="rId(\d+)"', self.rels_xml)), default=0)
+        self.styles_xml = parts[_STYLES_PART].decode('utf-8')
+        self.style_ids = set(re.findall(r'w:styleId="([^"]+)"', self.styles_xml))
+        self.content_types_xml = parts[_CONTENT_TYPES_PART].decode('utf-8')
+        numbering = parts.get(_NUMBERING_PART)
+        self.has_numbering = numbering is not None
+        if numbering is None:
+            self.numbering_xml = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                                  f'<w:numbering xmlns:w="{_W_NAMESPACE}"></w:numbering>')
+        else:
+            self.numbering_xml = numbering.decode('utf-8')
+        self.max_abstract_num = max((int(value) for value in
+                                     re.findall(r'w:abstractNumId="(\d+)"', self.numbering_xml)), default=0)
+        self.max_num = max((int(value) for value in re.findall(r'<w:num w:numId="(\d+)"', self.numbering_xml)),
+                           default=0)
+
+
+def _ensure_namespaces(prefix):
+    root = re.search(r'<w:document\b[^>]*>', prefix)
+    if root is None:
+        raise UnsupportedMarkdown("参考文档的正文格式无法识别")
+    missing = ''.join(f' xmlns:{name}="{uri}"' for name, uri in _REQUIRED_NAMESPACES.items()
+                      if f'xmlns:{name}=' not in root.group(0))
+    if not missing:
+        return prefix
+    return prefix[:root.end() - 1] + missing + prefix[root.end() - 1:]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(path, mtime_ns, size):
+    return _ReferenceTemplate(path)
+
+
+def _get_template(path):
+    # 以修改时间与大小作为缓存键的一部分，模板文件被替换后自动重新解析
+    st = os.stat(path)
+    return _load_template(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+# ---------------------------------------------------------------------------
+# 列表编号
+# ---------------------------------------------------------------------------
+
+class _Numbering:
+    """在参考文档已有的编号定义之后追加列表所需的定义，编号不与参考文档冲突"""
+
+    def __init__(self, template):
+        self.template = template
+        self.next_abstract = max(template.max_abstract_num + 1, 990)
+        self.next_num = max(template.max_num + 1, 1000)
+        self.abstract_nums = []
+        self.nums = []
+        self.abstract_ids = {}
+        self.continuation = None
+
+    def _abstract(self, key):
+        if key in self.abstract_ids:
+            return self.abstract_ids[key]
+        abstract_id = self.next_abstract
+        self.next_abstract += 1
+        levels = []
+        for level in range(9):
+            indent = f'<w:pPr><w:ind w:left="{720 * (level + 1)}" w:hanging="360" /></w:pPr>'
+            if key == 'continuation':
+                levels.append(f'<w:lvl w:ilvl="{level}"><w:numFmt w:val="bullet" /><w:lvlText w:val=" " />'
+                              f'<w:lvlJc w:val="left" />{indent}</w:lvl>')
+            elif key == 'bullet':
+                char, font = _BULLET_LEVELS[level % 3]
+                levels.append(f'<w:lvl w:ilvl="{level}"><w:numFmt w:val="bullet" /><w:lvlText w:val="{char}" />'
+                              f'<w:lvlJc w:val="left" />{indent}<w:rPr><w:rFonts w:ascii="{font}" '
+                              f'w:hAnsi="{font}" w:cs="{font}" w:hint="default" /></w:rPr></w:lvl>')
+            else:
+                levels.append(f'<w:lvl w:ilvl="{level}"><w:start w:val="1" /><w:numFmt w:val="decimal" />'
+                              f'<w:lvlText w:val="%{level + 1}{key[1]}" /><w:lvlJc w:val="left" />{indent}</w:lvl>')
+        self.abstract_nums.append(f'<w:abstractNum w:abstractNumId="{abstract_id}">'
+                                  f'<w:nsid w:val="{abstract_id:08X}" /><w:multiLevelType w:val="multilevel" />'
+                                  f'{"".join(levels)}</w:abstractNum>')
+        self.abstract_ids[key] = abstract_id
+        return abstract_id
+
+    def _num(self, abstract_id, start=None):
+        num_id = self.next_num
+        self.next_num += 1
+        overrides = ''
+        if start is not None:
+            overrides = ''.join(f'<w:lvlOverride w:ilvl="{level}"><w:startOverride w:val="{start}" />'
+                                f'</w:lvlOverride>' for level in range(9))
+        self.nums.append(f'<w:num w:numId="{num_id}"><w:abstractNumId w:val="{abstract_id}" />{overrides}</w:num>')
+        return num_id
+
+    def new_list(self, ordered, start=1, delimiter='.'):
+        """每个列表（包括嵌套的子列表）使用独立的编号实例，有序列表从各自的起始值开始编号"""
+        if ordered:
+            return self._num(self._abstract(('decimal', delimiter)), start)
+        return self._num(self._abstract('bullet'))
+
+    def continuation_id(self):
+        """列表项中第二个及之后的段落使用不显示符号的编号，只继承缩进"""
+        if self.continuation is None:
+            self.continuation = self._num(self._abstract('continuation'))
+        return self.continuation
+
+    def to_xml(self):
+        xml = self.template.numbering_xml
+        if not self.nums:
+            return xml
+        # 按照架构要求，抽象编号定义必须位于所有编号实例之前
+        first_num = xml.find('<w:num ')
+        end = xml.rfind('</w:numbering>')
+        insert_at = first_num if first_num >= 0 else end
+        return (xml[:insert_at] + ''.join(self.abstract_nums) + xml[insert_at:end] + ''.join(self.nums)
+                + xml[end:])
+
+
+# ---------------------------------------------------------------------------
+# 正文
+# ---------------------------------------------------------------------------
+
+def _run_properties(style=None, bold=False, italic=False, strike=False, east_asia=False):
+    props = []
+    if style:
+        props.append(f'<w:rStyle w:val="{style}" />')
+    if east_asia:
+        props.append('<w:rFonts w:hint="eastAsia" />')
+    if bold:
+        props.append('<w:b /><w:bCs />')
+    if italic:
+        props.append('<w:i /><w:iCs />')
+    if strike:
+        props.append('<w:strike />')
+    return f'<w:rPr>{"".join(props)}</w:rPr>' if props else ''
+
+
+def _paragraph(content, style=None, num=None, align=None):
+    props = []
+    if style:
+        props.append(f'<w:pStyle w:val="{style}" />')
+    if num is not None:
+        props.append(f'<w:numPr><w:ilvl w:val="{num[0]}" /><w:numId w:val="{num[1]}" /></w:numPr>')
+    if align:
+        props.append(f'<w:jc w:val="{align}" />')
+    ppr = f'<w:pPr>{"".join(props)}</w:pPr>' if props else ''
+    return f'<w:p>{ppr}{content}</w:p>'
+
+
+class _BodyWriter:
+    """把 markdown-it 的记号流转换为正文 XML，同时登记超链接关系、列表编号与用到的样式"""
+
+    def __init__(self, template, source_lines):
+        self.template = template
+        self.source_lines = source_lines
+        self.numbering = _Numbering(template)
+        self.hyperlinks = {}
+        self.next_rid = template.max_rid + 1
+        self.bookmark_id = 0
+        self.used_identifiers = set()
+        self.uses_source_code = False
+        # pandoc 把标题、列表、代码块、引用、分隔线之后的第一个段落标为 FirstParagraph
+        self.first_paragraph = True
+        self.previous_table = False
+        self._paragraph_end = None
+
+    # -- 行内 --------------------------------------------------------------
+
+    def _text_runs(self, text, bold, italic, strike, style=None):
+        if not text:
+            return ''
+        if not _CJK_RE.search(text):
+            return f'<w:r>{_run_properties(style, bold, italic, strike)}<w:t xml:space="preserve">{_escape(text)}</w:t></w:r>'
+        # 与 pandoc 一样只给含中日韩字符的词加 eastAsia 提示，使其中的引号等标点使用中文字体
+        runs = []
+        current, current_cjk = [], None
+        for word in re.split(r'( )', text):
+            is_cjk = bool(word.strip()) and _CJK_RE.search(word) is not None
+            if current and is_cjk != current_cjk:
+                runs.append((''.join(current), current_cjk))
+                current = []
+            current.append(word)
+            current_cjk = is_cjk
+        if current:
+            runs.append((''.join(current), current_cjk))
+        return ''.join(f'<w:r>{_run_properties(style, bold, italic, strike, cjk)}'
+                       f'<w:t xml:space="preserve">{_escape(part)}</w:t></w:r>' for part, cjk in runs if part)
+
+    def _hyperlink_open(self, href):
+        if href.startswith('#'):
+            return f'<w:hyperlink w:anchor="{_escape(unquote(href[1:]))}">'
+        rid = self.hyperlinks.get(href)
+        if rid is None:
+            rid = f'rId{self.next_rid}'
+            self.next_rid += 1
+            self.hyperlinks[href] = rid
+        return f'<w:hyperlink r:id="{rid}">'
+
+    def inline(self, token):
+        """返回 (XML, 纯文本)，纯文本用于生成标题书签名"""
+        if _UNSUPPORTED_INLINE_RE.search(token.content):
+            raise UnsupportedMarkdown("公式、脚注、上下标、属性块或段末反斜杠")
+        children = token.children or []
+        _smarten(children)
+        parts = []
+        plain = []
+        bold = italic = strike = 0
+        link_style = None
+        for child in children:
+            kind = child.type
+            if kind in ('text', 'text_special'):
+                parts.append(self._text_runs(child.content, bold, italic, strike, link_style))
+                plain.append(child.content)
+            elif kind == 'softbreak':
+                parts.append(self._text_runs(' ', bold, italic, strike, link_style))
+                plain.append(' ')
+            elif kind == 'hardbreak':
+                parts.append('<w:r><w:br /></w:r>')
+                plain.append(' ')
+            elif kind == 'code_inline':
+                parts.append(f'<w:r>{_run_properties("VerbatimChar", bold, italic, strike)}'
+                             f'<w:t xml:space="preserve">{_escape(child.content)}</w:t></w:r>')
+                plain.append(child.content)
+            elif kind in ('strong_open', 'strong_close'):
+                bold += 1 if kind == 'strong_open' else -1
+            elif kind in ('em_open', 'em_close'):
+                italic += 1 if kind == 'em_open' else -1
+            elif kind in ('s_open', 's_close'):
+                strike += 1 if kind == 's_open' else -1
+            elif kind == 'link_open':
+                if link_style is not None:
+                    raise UnsupportedMarkdown("嵌套链接")
+                parts.append(self._hyperlink_open(child.attrGet('href') or ''))
+                link_style = 'Hyperlink'
+            elif kind == 'link_close':
+                parts.append('</w:hyperlink>')
+                link_style = None
+            else:
+                raise UnsupportedMarkdown(f"行内语法 {kind}")
+        return ''.join(parts), ''.join(plain)
+
+    # -- 块 ----------------------------------------------------------------
+
+    def blocks(self, tokens):
+        """逐个产出顶层块的 XML，调用方可边生成边写入"""
+        i = 0
+        count = len(tokens)
+        while i < count:
+            token = tokens[i]
+            kind = token.type
+            if self._paragraph_end is not None and token.map and token.map[0] == self._paragraph_end:
+                raise UnsupportedMarkdown("块级元素与前一段落之间缺少空行")
+            self._paragraph_end = None
+            is_table = False
+            if kind == 'heading_open':
+                xml, i = self._heading(tokens, i)
+            elif kind == 'paragraph_open':
+                self._paragraph_end = token.map[1] if token.map else None
+                xml, i = self._top_paragraph(tokens, i)
+            elif kind in ('bullet_list_open', 'ordered_list_open'):
+                out = []
+                i = self._list(tokens, i, 0, out)
+                xml = ''.join(out)
+                self.first_paragraph = True
+            elif kind == 'blockquote_open':
+                xml, i = self._blockquote(tokens, i)
+            elif kind in ('fence', 'code_block'):
+                xml = self._code(token)
+                i += 1
+            elif kind == 'hr':
+                xml = _HORIZONTAL_RULE
+                self.first_paragraph = True
+                i += 1
+            elif kind == 'table_open':
+                xml, i = self._table(tokens, i)
+                # 相邻的两个表格之间必须有段落，否则 Word 会把它们合并为一个表格
+                if self.previous_table:
+                    xml = '<w:p />' + xml
+                is_table = True
+            else:
+                raise UnsupportedMarkdown(f"块级语法 {kind}")
+            self.previous_table = is_table
+            yield xml
+
+    def _heading(self, tokens, i):
+        token = tokens[i]
+        content, plain = self.inline(tokens[i + 1])
+        if _HEADING_ATTRIBUTES_RE.search(tokens[i + 1].content):
+            raise UnsupportedMarkdown("标题属性")
+        level = int(token.tag[1:])
+        name = _identifier(plain, self.used_identifiers)
+        bookmark_id = self.bookmark_id
+        self.bookmark_id += 1
+        self.first_paragraph = True
+        xml = (f'<w:bookmarkStart w:id="{bookmark_id}" w:name="{_escape(name)}" />'
+               f'{_paragraph(content, f"Heading{level}")}<w:bookmarkEnd w:id="{bookmark_id}" />')
+        return xml, i + 3
+
+    def _top_paragraph(self, tokens, i):
+        inline = tokens[i + 1]
+        if inline.content.startswith('|'):
+            # 不构成表格的竖线开头的行在 pandoc 中是 line block
+            raise UnsupportedMarkdown("line block")
+        content, _ = self.inline(inline)
+        style = 'FirstParagraph' if self.first_paragraph else 'BodyText'
+        self.first_paragraph = False
+        return _paragraph(content, style), i + 3
+
+    @staticmethod
+    def _closing(tokens, i):
+        close_type = tokens[i].type.replace('_open', '_close')
+        level = tokens[i].level
+        j = i + 1
+        while tokens[j].type != close_type or tokens[j].level != level:
+            j += 1
+        return j
+
+    def _list_groups(self, tokens, i):
+        """
+        返回 [(开始, 结束)] 与列表是否松散。换用另一种项目符号时 commonmark 会开始新列表，
+        pandoc 则仍视为同一个列表，因此相邻的项目符号列表合并处理；其间有空行时整个列表是松散的。
+        """
+        groups = [(i, self._closing(tokens, i))]
+        while tokens[i].type == 'bullet_list_open' and groups[-1][1] + 1 < len(tokens) and \
+                tokens[groups[-1][1] + 1].type == 'bullet_list_open':
+            start = groups[-1][1] + 1
+            groups.append((start, self._closing(tokens, start)))
+        loose = False
+        for index, (start, end) in enumerate(groups):
+            item_level = tokens[start].level + 2
+            if any(token.type == 'paragraph_open' and token.level == item_level and not token.hidden
+                   for token in tokens[start:end]):
+                loose = True
+            if index and tokens[start].map and not self.source_lines[tokens[start].map[0] - 1].strip():
+                loose = True
+        return groups, loose
+
+    def _list(self, tokens, i, level, out):
+        token = tokens[i]
+        if token.type == 'ordered_list_open':
+            num_id = self.numbering.new_list(True, int(token.attrGet('start') or 1), tokens[i + 1].markup or '.')
+        else:
+            num_id = self.numbering.new_list(False)
+        groups, loose = self._list_groups(tokens, i)
+        for start, end in groups:
+            i = start + 1
+            while i < end:
+                if tokens[i].type != 'list_item_open':
+                    raise UnsupportedMarkdown(f"列表中的 {tokens[i].type}")
+                i += 1
+                if tokens[i].type == 'list_item_close':
+                    # 空列表项会影响 commonmark 对列表松紧的判断，与 pandoc 不一致
+                    raise UnsupportedMarkdown("空列表项")
+                first_block = True
+                while tokens[i].type != 'list_item_close':
+                    kind = tokens[i].type
+                    if kind == 'paragraph_open':
+                        content, _ = self.inline(tokens[i + 1])
+                        num = (level, num_id) if first_block else (level, self.numbering.continuation_id())
+                        out.append(_paragraph(content, None if loose else 'Compact', num))
+                        i += 3
+                    elif kind in ('bullet_list_open', 'ordered_list_open') and not first_block:
+                        i = self._list(tokens, i, level + 1, out)
+                    else:
+                        raise UnsupportedMarkdown(f"列表项中的 {kind}")
+                    first_block = False
+                i += 1
+        return groups[-1][1] + 1
+
+    def _blockquote(self, tokens, i):
+        out = []
+        i += 1
+        while tokens[i].type != 'blockquote_close':
+            if tokens[i].type != 'paragraph_open':
+                raise UnsupportedMarkdown(f"引用中的 {tokens[i].type}")
+            content, _ = self.inline(tokens[i + 1])
+            out.append(_paragraph(content, 'BlockText'))
+            i += 3
+        self.first_paragraph = True
+        return ''.join(out), i + 1
+
+    def _code(self, token):
+        self.uses_source_code = True
+        self.first_paragraph = True
+        text = token.content[:-1] if token.content.endswith('\n') else token.content
+        runs = []
+        for index, line in enumerate(text.split('\n')):
+            if index:
+                runs.append('<w:r><w:br /></w:r>')
+            line = line.expandtabs(4)
+            if line:
+                runs.append(f'<w:r><w:rPr><w:rStyle w:val="VerbatimChar" /></w:rPr>'
+                            f'<w:t xml:space="preserve">{_escape(line)}</w:t></w:r>')
+        return _paragraph(''.join(runs), 'SourceCode')
+
+    def _table(self, tokens, i):
+        start = i
+        while tokens[i].type != 'table_close':
+            i += 1
+        table_tokens = tokens[start:i]
+        rows = []
+        current = None
+        header_rows = 0
+        for position, token in enumerate(table_tokens):
+            if token.type == 'tr_open':
+                current = []
+            elif token.type == 'tr_close':
+                rows.append(current)
+            elif token.type in ('th_open', 'td_open'):
+                style = token.attrGet('style') or ''
+                align = style.split(':', 1)[1] if style.startswith('text-align:') else None
+                current.append((table_tokens[position + 1], align))
+            elif token.type == 'thead_close':
+                header_rows = len(rows)
+        columns = len(rows[0]) if rows else 0
+        # pandoc 会丢弃全部为空的表头行
+        if header_rows and all(not cell.content.strip() for cell, _ in rows[0]):
+            rows = rows[1:]
+            header_rows = 0
+        table_pr = '<w:tblStyle w:val="Table" />'
+        widths = self._column_widths(tokens[start], columns)
+        if widths is None:
+            table_pr += '<w:tblW w:type="auto" w:w="0" />'
+            grid = [_TABLE_TEXT_WIDTH // max(columns, 1)] * columns
+        else:
+            table_pr += '<w:tblW w:type="pct" w:w="5000" /><w:tblLayout w:type="fixed" />'
+            grid = [int(_TABLE_TEXT_WIDTH * width) for width in widths]
+        table_pr += ('<w:tblLook w:firstRow="1" w:lastRow="0" w:firstColumn="0" w:lastColumn="0" '
+                     'w:noHBand="0" w:noVBand="0" w:val="0020" />')
+        out = [f'<w:tbl><w:tblPr>{table_pr}</w:tblPr><w:tblGrid>',
+               ''.join(f'<w:gridCol w:w="{width}" />' for width in grid), '</w:tblGrid>']
+        for index, row in enumerate(rows):
+            out.append('<w:tr><w:trPr><w:tblHeader w:val="on" /></w:trPr>' if index < header_rows else '<w:tr>')
+            for cell, align in row:
+                content, _ = self.inline(cell)
+                if not content:
+                    align = None
+                out.append(f'<w:tc><w:tcPr />{_paragraph(content, "Compact", align=align)}</w:tc>')
+            out.append('</w:tr>')
+        out.append('</w:tbl>')
+        self.first_paragraph = False
+        return ''.join(out), i + 1
+
+    def _column_widths(self, token, columns):
+        """源码中有行超过 pandoc 的列宽时，按分隔行中每列的横线数分配相对宽度；否则返回 None"""
+        lines = self.source_lines[token.map[0]:token.map[1]] if token.map else []
+        if not lines or max(len(line) for line in lines) <= _PANDOC_COLUMNS or len(lines) < 2:
+            return None
+        cells = lines[1].strip().strip('|').split('|')
+        dashes = [cell.count('-') for cell in cells]
+        total = sum(dashes)
+        if len(dashes) != columns or not total:
+            return None
+        return [count / total for count in dashes]
+
+    # -- 输出 --------------------------------------------------------------
+
+    def rels_xml(self):
+        xml = self.template.rels_xml
+        extra = []
+        if not self.template.has_numbering:
+            extra.append(f'<Relationship Id="rId{self.next_rid}" Type="{_REL_TYPE_PREFIX}numbering" '
+                         f'Target="numbering.xml" />')
+        for target, rid in self.hyperlinks.items():
+            extra.append(f'<Relationship Id="{rid}" Type="{_REL_TYPE_PREFIX}hyperlink" '
+                         f'Target="{_escape(target)}" TargetMode="External" />')
+        if not extra:
+            return xml
+        end = xml.rfind('</Relationships>')
+        if end < 0:
+            # 没有关系时根元素是自闭合的
+            return re.sub(r'<Relationships\b([^>]*?)\s*/>', lambda m: f'<Relationships{m.group(1)}>'
+                          + ''.join(extra) + '</Relationships>', xml, count=1)
+        return xml[:end] + ''.join(extra) + xml[end:]
+
+    def styles_xml(self):
+        xml = self.template.styles_xml
+        if self.uses_source_code and 'SourceCode' not in self.template.style_ids:
+            end = xml.rfind('</w:styles>')
+            xml = xml[:end] + _SOURCE_CODE_STYLE + xml[end:]
+        return xml
+
+
+def _content_types_xml(template):
+    xml = template.content_types_xml
+    if template.has_numbering:
+        return xml
+    end = xml.rfind('</Types>')
+    return (xml[:end] + f'<Override PartName="/{_NUMBERING_PART}" ContentType="{_NUMBERING_CONTENT_TYPE}" />'
+            + xml[end:])
+
+
+def _find_unsupported_source(source):
+    for pattern, reason in _UNSUPPORTED_SOURCE_PATTERNS:
+        if pattern.search(source):
+            return reason
+    return None
+
+
+def _reference_doc_from_args(extra_args):
+    """只接受 --reference-doc 与 --mathjax（后者在没有公式时不起作用），其余参数交给 pandoc 处理"""
+    reference_doc = None
+    for arg in extra_args or []:
+        if arg.startswith('--reference-doc='):
+            reference_doc = arg[len('--reference-doc='):]
+        elif arg != '--mathjax':
+            raise UnsupportedMarkdown(f"参数 {arg}")
+    if not reference_doc:
+        raise UnsupportedMarkdown("没有样式文件")
+    return reference_doc
+
+
+def write_native_docx(source, output, reference_doc):
+    """
+    把 Markdown 写成 docx。output 为路径时正文边生成边写入压缩包，全部成功后才原子地替换该文件；
+    output 也可以是可写的二进制文件对象（如 BytesIO），此时整个文档在内存中生成。
+    文档包含不支持的语法时抛出 UnsupportedMarkdown，不会留下输出文件。
+    """
+    parser = _get_parser()
+    if parser is None:
+        raise UnsupportedMarkdown("未安装 markdown-it-py")
+    reason = _find_unsupported_source(source)
+    if reason:
+        raise UnsupportedMarkdown(reason)
+    template = _get_template(reference_doc)
+    tokens = parser.parse(source)
+    writer = _BodyWriter(template, source.split('\n'))
+    if hasattr(output, 'write'):
+        _write_archive(output, template, writer, tokens)
+        return
+
+    fd, temp_path = tempfile.mkstemp(suffix='.docx.tmp', dir=os.path.dirname(os.path.abspath(output)))
+    os.close(fd)
+    try:
+        _write_archive(temp_path, template, writer, tokens)
+        os.replace(temp_path, output)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _write_archive(target, template, writer, tokens):
+    overridden = {_DOCUMENT_PART, _DOCUMENT_RELS_PART, _STYLES_PART, _NUMBERING_PART, _CONTENT_TYPES_PART}
+    with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(_CONTENT_TYPES_PART, _content_types_xml(template))
+        for name, data in template.entries:
+            if name not in overridden:
+                archive.writestr(name, data)
+        with archive.open(_DOCUMENT_PART, 'w') as stream:
+            stream.write(template.document_prefix)
+            for block in writer.blocks(tokens):
+                stream.write(block.encode('utf-8'))
+            stream.write(template.document_suffix)
+        archive.writestr(_DOCUMENT_RELS_PART, writer.rels_xml())
+        archive.writestr(_NUMBERING_PART, writer.numbering.to_xml())
+        archive.writestr(_STYLES_PART, writer.styles_xml())
+
+
+def convert_native_docx(source, output, extra_args=None):
+    """
+    尝试用内置引擎转换，output 为路径或可写的二进制文件对象。
+    返回 False 表示文档或参数超出其支持范围（或未安装 markdown-it-py），调用方应改用 pandoc；
+    此时不会留下输出文件（文件对象中可能已有部分内容，应丢弃）。
+    """
+    start = time.perf_counter()
+    try:
+        write_native_docx(source, output, _reference_doc_from_args(extra_args))
+    except UnsupportedMarkdown as e:
+        logging.info("内置 docx 引擎不支持该文档（%s），改用 pandoc 转换。", e)
+        return False
+    except Exception as e:
+        logging.error("内置 docx 引擎转换失败，改用 pandoc 转换: %s", e, exc_info=True)
+        return False
+    logging.info("内置 docx 引擎转换完成，耗时 %.1f ms: %s", (time.perf_counter() - start) * 1000,
+                 output if isinstance(output, str) else '内存')
+    return True
@@ -0,0 +1,260 @@
+# app/office_automation.py
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .timing import propagate, span
+
+# WPS Office 不同版本注册的 ProgID 不同，依次尝试
+WPS_PROG_IDS = ["wps.application", "kwps.application"]
+WORD_PROG_ID = "Word.Application"
+
+
+class OfficeBackend:
+    """
+    Office 自动化接口。实例池只通过这些方法操作 Office，
+    因此可以用 FakeOfficeBackend 在没有 Office 的环境中测试和压测池化逻辑。
+    """
+
+    def init_thread(self):
+        """在持有 Office 实例的线程启动时调用"""
+
+    def uninit_thread(self):
+        """在持有 Office 实例的线程退出前调用"""
+
+    def launch(self, target_app):
+        raise NotImplementedError
+
+    def is_healthy(self, instance):
+        raise NotImplementedError
+
+    def new_document(self, instance):
+        raise NotImplementedError
+
+    def insert_file(self, document, path):
+        raise NotImplementedError
+
+    def copy_document(self, document):
+        raise NotImplementedError
+
+    def close_document(self, document):
+        raise NotImplementedError
+
+    def quit(self, instance):
+        raise NotImplementedError
+
+
+class ComOfficeBackend(OfficeBackend):
+    """基于 pywin32 COM 的 Word / WPS 自动化实现"""
+
+    def init_thread(self):
+        import pythoncom
+        pythoncom.CoInitialize()
+
+    def uninit_thread(self):
+        import pythoncom
+        pythoncom.CoUninitialize()
+
+    def launch(self, target_app):
+        import win32com.client
+        import pywintypes
+        if target_app == 'word':
+            logging.info("正在尝试启动后台应用: %s", WORD_PROG_ID)
+            office_app = win32com.client.DispatchEx(WORD_PROG_ID)
+        else:
+            office_app = None
+            logging.info("正在尝试连接 WPS Office, 将依次尝试: %s", WPS_PROG_IDS)
+            for prog_id in WPS_PROG_IDS:
+                try:
+                    office_app = win32com.client.DispatchEx(prog_id)
+                    logging.info("成功连接到 WPS Office: %s", prog_id)
+                    break
+                except pywintypes.com_error:
+                    logging.warning("尝试连接 %s 失败, 正在尝试下一个...", prog_id)
+            if not office_app:
+                raise Exception("无法连接到 WPS Office。请确认 WPS 已正确安装并注册了 COM 组件。")
+        office_app.Visible = False
+        return office_app
+
+    def is_healthy(self, instance):
+        try:
+            # 访问任意属性即可确认 COM 服务器仍然存活
+            _ = instance.Documents.Count
+            return True
+        except Exception:
+            return False
+
+    def new_document(self, instance):
+        # 新建内存文档后再插入文件内容，避免在"最近文件"列表中留下痕迹
+        return instance.Documents.Add()
+
+    def insert_file(self, document, path):
+        document.Content.InsertFile(FileName=path, ConfirmConversions=False, Link=False)
+
+    def copy_document(self, document):
+        document.Content.Select()
+        document.Content.Copy()
+
+    def close_document(self, document):
+        document.Close(SaveChanges=False)
+
+    def quit(self, instance):
+        instance.Quit()
+
+
+class FakeOfficeBackend(OfficeBackend):
+    """用于测试与基准的模拟实现，可配置启动/操作耗时并注入故障"""
+
+    class _Instance:
+        def __init__(self, target_app):
+            self.target_app = target_app
+            self.alive = True
+            self.documents = 0
+
+    def __init__(self, launch_delay=0.0, operation_delay=0.0, fail_every=0):
+        self.launch_delay = launch_delay
+        self.operation_delay = operation_delay
+        self.fail_every = fail_every
+        self.launches = 0
+        self.quits = 0
+        self.operations = 0
+        self._lock = threading.Lock()
+
+    def launch(self, target_app):
+        time.sleep(self.launch_delay)
+        with self._lock:
+            self.launches += 1
+        return self._Instance(target_app)
+
+    def is_healthy(self, instance):
+        return instance.alive
+
+    def new_document(self, instance):
+        instance.documents += 1
+        return instance
+
+    def insert_file(self, document, path):
+        time.sleep(self.operation_delay)
+        with self._lock:
+            self.operations += 1
+            fail = self.fail_every and self.operations % self.fail_every == 0
+        if fail:
+            document.alive = False
+            raise RuntimeError("模拟的 COM 错误")
+
+    def copy_document(self, document):
+        pass
+
+    def close_document(self, document):
+        document.documents -= 1
+
+    def quit(self, instance):
+        instance.alive = False
+        with self._lock:
+            self.quits += 1
+
+
+class _Slot:
+    """池中的一个位置：一个专用线程以及该线程上创建的 Office 实例（COM 对象只能在创建它的线程中使用）"""
+
+    def __init__(self, index, backend):
+        self.index = index
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'Office-{index}',
+                                           initializer=backend.init_thread)
+        self.instance = None
+        self.target_app = None
+        self.operations = 0
+
+
+class OfficeInstancePool:
+    """
+    常驻的隐藏 Office 实例池。实例在首次使用（或预热）时启动并在多次复制之间复用；
+    使用前做健康检查，处理 max_operations 次后或发生错误时回收，程序退出时统一关闭。
+    """
+
+    def __init__(self, backend, size=1, max_operations=50):
+        self.backend = backend
+        self.max_operations = max(1, int(max_operations))
+        self._slots = [_Slot(i, backend) for i in range(max(1, int(size)))]
+        self._free = queue.Queue()
+        for slot in self._slots:
+            self._free.put(slot)
+        self._closed = False
+
+    def _recycle(self, slot, reason):
+        if slot.instance is None:
+            return
+        logging.info("正在回收 Office 实例 #%s (%s)", slot.index, reason)
+        try:
+            self.backend.quit(slot.instance)
+        except Exception as e:
+            logging.warning("关闭 Office 实例失败 (可忽略): %s", e)
+        slot.instance = None
+        slot.target_app = None
+        slot.operations = 0
+
+    def _ensure_instance(self, slot, target_app):
+        if slot.instance is not None:
+            if slot.target_app != target_app:
+                self._recycle(slot, f"切换到 {target_app}")
+            elif not self.backend.is_healthy(slot.instance):
+                self._recycle(slot, "健康检查失败")
+        if slot.instance is None:
+            start = time.perf_counter()
+            with span('office_launch'):
+                slot.instance = self.backend.launch(target_app)
+            slot.target_app = target_app
+            slot.operations = 0
+            logging.info("Office 实例 #%s (%s) 已启动，耗时 %.2fs", slot.index, target_app,
+                         time.perf_counter() - start)
+        return slot.instance
+
+    def _run_in_slot(self, slot, target_app, func):
+        instance = self._ensure_instance(slot, target_app)
+        try:
+            result = func(instance)
+        except Exception:
+            self._recycle(slot, "操作出错")
+            raise
+        slot.operations += 1
+        if slot.operations >= self.max_operations:
+            self._recycle(slot, f"已处理 {slot.operations} 次操作")
+        return result
+
+    def run(self, target_app, func):
+        """
+        在池中某个实例的专用线程上执行 func(instance) 并返回其结果。
+        所有实例都忙时会阻塞等待。
+        """
+        if self._closed:
+            raise RuntimeError("Office 实例池已关闭。")
+        with span('office_wait'):
+            slot = self._free.get()
+        try:
+            return slot.executor.submit(propagate(self._run_in_slot), slot, target_app, func).result()
+        finally:
+            self._free.put(slot)
+
+    def prewarm(self, target_app):
+        """预先启动一个实例，通常在程序启动后的后台线程中调用"""
+        slot = self._free.get()
+        try:
+            slot.executor.submit(self._ensure_instance, slot, target_app).result()
+        except Exception as e:
+            logging.warning("预热 %s 实例失败: %s", target_app, e)
+        finally:
+            self._free.put(slot)
+
+    def shutdown(self):
+        """关闭全部实例及其线程"""
+        self._closed = True
+        for slot in self._slots:
+            try:
+                slot.executor.submit(self._recycle, slot, "程序退出").result(timeout=10)
+                slot.executor.submit(self.backend.uninit_thread).result(timeout=5)
+            except Exception as e:
+                logging.warning("关闭 Office 实例 #%s 时出错: %s", slot.index, e)
+            slot.executor.shutdown(wait=False)
+        logging.info("Office 实例池已关闭。")
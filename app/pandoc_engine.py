@@ -0,0 +1,343 @@
+# app/pandoc_engine.py
+import base64
+import functools
+import http.client
+import json
+import logging
+import os
+import queue
+import re
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# 保存与复制共用的 Markdown 输入格式
+MARKDOWN_FORMAT = 'markdown+tex_math_dollars+tex_math_single_backslash'
+
+_SERVER_REFERENCE_NAME = 'reference.docx'
+_BINARY_FORMATS = ('docx', 'odt', 'epub', 'pptx')
+# pypandoc 能直接从标准输出读回字节串的二进制格式
+_STDOUT_BINARY_FORMATS = ('docx', 'odt', 'epub')
+# 引用图片（Markdown、HTML 或 JSON AST 中）的内容：pandoc server 在沙箱中无法读取本地文件或网络，这类内容改用子进程
+_IMAGE_REFERENCE_RE = re.compile(r'!\[|<img\b|"t":"Image"', re.IGNORECASE)
+
+
+def _find_free_port():
+    """向系统申请一个空闲的本地端口"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _encoded_reference_doc(path):
+    """返回模板文件的 base64 内容；文件未变化（路径、大小、修改时间相同）时复用上次编码的结果"""
+    st = os.stat(path)
+    return _encode_reference_doc(path, st.st_size, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _encode_reference_doc(path, size, mtime_ns):
+    with open(path, 'rb') as f:
+        return base64.b64encode(f.read()).decode('ascii')
+
+
+def _build_server_options(extra_args):
+    """
+    将 pypandoc 风格的命令行参数翻译为 pandoc server 的 JSON 选项。
+    遇到无法翻译的参数时返回 None，由调用方回退到子进程模式。
+    """
+    options = {}
+    files = {}
+    for arg in extra_args or []:
+        if arg == '--mathjax':
+            options['html-math-method'] = {'method': 'mathjax'}
+        elif arg in ('-s', '--standalone'):
+            options['standalone'] = True
+        elif arg.startswith('--variable='):
+            key, _, value = arg.split('=', 1)[1].partition(':')
+            options.setdefault('variables', {})[key] = value or True
+        elif arg.startswith('--reference-doc='):
+            # pandoc server 运行在沙箱中无法读取磁盘，需要把模板内容随请求一起发送
+            files[_SERVER_REFERENCE_NAME] = _encoded_reference_doc(arg.split('=', 1)[1])
+            options['reference-doc'] = _SERVER_REFERENCE_NAME
+        else:
+            return None
+    if files:
+        options['files'] = files
+    return options
+
+
+def convert_with_subprocess(source, to, format=MARKDOWN_FORMAT, outputfile=None, extra_args=None):
+    """
+    通过 pypandoc 启动一次性的 pandoc 子进程完成转换，不占用工作进程池的名额。
+    指定 outputfile 时写入文件并返回 None，否则返回输出内容的字节串。
+    """
+    import pypandoc
+    extra_args = list(extra_args or [])
+    if outputfile is not None:
+        pypandoc.convert_text(source=source, to=to, format=format,
+                              outputfile=outputfile, extra_args=extra_args)
+        return None
+    if to in _STDOUT_BINARY_FORMATS:
+        # 输出文件为 "-" 时 pandoc 把二进制结果写到标准输出，pypandoc 原样返回字节串，无需落盘
+        return pypandoc.convert_text(source=source, to=to, format=format, outputfile='-', extra_args=extra_args)
+    if to in _BINARY_FORMATS:
+        # 其余二进制格式 pypandoc 要求必须指定输出文件，借助临时文件中转
+        fd, temp_path = tempfile.mkstemp(suffix=f'.{to}', prefix='md_pandoc_')
+        os.close(fd)
+        try:
+            pypandoc.convert_text(source=source, to=to, format=format,
+                                  outputfile=temp_path, extra_args=extra_args)
+            with open(temp_path, 'rb') as f:
+                return f.read()
+        finally:
+            os.remove(temp_path)
+    output = pypandoc.convert_text(source=source, to=to, format=format, extra_args=extra_args)
+    return output.encode('utf-8')
+
+
+class PandocServerWorker:
+    """一个常驻的 `pandoc server` 进程，通过本地 HTTP 接口接收转换任务。"""
+
+    def __init__(self, pandoc_path, startup_timeout=10.0, request_timeout=120):
+        self.pandoc_path = pandoc_path
+        self.startup_timeout = startup_timeout
+        self.request_timeout = request_timeout
+        self.process = None
+        self.port = None
+        self.jobs_done = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """启动 pandoc server 并等待其可以响应请求"""
+        self.port = _find_free_port()
+        creationflags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        self.process = subprocess.Popen(
+            [self.pandoc_path, 'server', '--port', str(self.port), '--timeout', str(self.request_timeout)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            creationflags=creationflags
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                break
+            try:
+                with urllib.request.urlopen(f"{self.url}/version", timeout=1) as resp:
+                    version = resp.read().decode('utf-8', 'replace').strip()
+                logging.info("pandoc server 已启动 (端口 %s, 版本 %s)", self.port, version)
+                return
+            except http.client.HTTPException as e:
+                # 端口已在监听但无法正常应答（例如 pandoc 未编译 server 支持），无需继续等待
+                logging.warning("pandoc server 无法正常应答: %r", e)
+                break
+            except (urllib.error.URLError, ConnectionError, OSError):
+                time.sleep(0.05)
+        self.stop()
+        raise RuntimeError("pandoc server 启动失败或未能在限定时间内响应。")
+
+    @staticmethod
+    def _log_messages(result):
+        # pandoc 的警告（如资源无法读取）随响应返回，不会出现在进程输出中
+        for message in result.get('messages') or []:
+            if isinstance(message, dict):
+                logging.warning("pandoc server: [%s] %s", message.get('verbosity', 'WARNING'),
+                                message.get('message', ''))
+            else:
+                logging.warning("pandoc server: %s", message)
+
+    def convert(self, source, to, format, options):
+        """提交一次转换任务，返回输出内容的字节串"""
+        payload = dict(options)
+        payload.update({'text': source, 'from': format, 'to': to})
+        request = urllib.request.Request(
+            f"{self.url}/", data=json.dumps(payload).encode('utf-8'), method='POST',
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+        )
+        with urllib.request.urlopen(request, timeout=self.request_timeout) as resp:
+            result = json.loads(resp.read().decode('utf-8'))
+        self.jobs_done += 1
+        if isinstance(result, dict) and 'output' in result:
+            self._log_messages(result)
+            if result.get('base64'):
+                return base64.b64decode(result['output'])
+            return result['output'].encode('utf-8')
+        raise RuntimeError(f"pandoc server 返回了无法识别的响应: {str(result)[:200]}")
+
+    def stop(self):
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+class PandocWorkerPool:
+    """
+    常驻 pandoc 工作进程池，供保存与复制两条路径共享。
+    每个工作进程处理 max_jobs 个任务后会被回收重启；
+    当 pandoc server 不可用时，自动回退到 pypandoc 的一次性子进程模式。
+    """
+
+    def __init__(self, size=2, max_jobs=200, use_server=True):
+        self.size = max(1, int(size))
+        self.max_jobs = max(1, int(max_jobs))
+        self.use_server = use_server
+        self._slots = queue.Queue()
+        for _ in range(self.size):
+            self._slots.put(None)
+        self._lock = threading.Lock()
+        self._all_workers = set()
+        self._closed = False
+
+    def _server_available(self):
+        return self.use_server and not self._closed
+
+    def _disable_server(self, reason):
+        with self._lock:
+            if self.use_server:
+                self.use_server = False
+                logging.warning("pandoc server 不可用 (%s)，后续转换将回退到子进程模式。", reason)
+
+    def _start_worker(self):
+        import pypandoc
+        worker = PandocServerWorker(pypandoc.get_pandoc_path())
+        worker.start()
+        with self._lock:
+            self._all_workers.add(worker)
+        return worker
+
+    def _retire(self, worker):
+        if worker is None:
+            return
+        worker.stop()
+        with self._lock:
+            self._all_workers.discard(worker)
+
+    def warm_up(self):
+        """预先启动全部工作进程，通常在后台线程中调用"""
+        if not self._server_available():
+            return
+        acquired = []
+        try:
+            for _ in range(self.size):
+                worker = self._slots.get()
+                acquired.append(worker)
+                if worker is None or not worker.is_alive():
+                    self._retire(worker)
+                    acquired[-1] = self._start_worker()
+        except Exception as e:
+            self._disable_server(e)
+        finally:
+            for worker in acquired:
+                self._slots.put(worker)
+
+    def convert_text(self, source, to, format=MARKDOWN_FORMAT, outputfile=None, extra_args=None):
+        """
+        转换文本。指定 outputfile 时写入文件并返回 None，否则返回输出内容的字节串。
+        """
+        extra_args = list(extra_args or [])
+        # 含图片的文档交给子进程转换，图片才能从磁盘或网络读取并嵌入输出
+        if self._server_available() and not _IMAGE_REFERENCE_RE.search(source):
+            options = _build_server_options(extra_args)
+            if options is not None:
+                output = self._convert_with_server(source, to, format, options)
+                if output is not None:
+                    if outputfile is None:
+                        return output
+                    with open(outputfile, 'wb') as f:
+                        f.write(output)
+                    return None
+        return self._convert_with_subprocess(source, to, format, outputfile, extra_args)
+
+    def _convert_with_server(self, source, to, format, options):
+        worker = self._slots.get()
+        try:
+            if worker is None or not worker.is_alive():
+                self._retire(worker)
+                worker = None
+                worker = self._start_worker()
+            output = worker.convert(source, to, format, options)
+            if worker.jobs_done >= self.max_jobs:
+                logging.info("pandoc 工作进程已处理 %s 个任务，正在回收。", worker.jobs_done)
+                self._retire(worker)
+                worker = None
+            return output
+        except Exception as e:
+            if worker is None:
+                self._disable_server(e)
+            else:
+                logging.warning("pandoc server 转换失败，本次回退到子进程模式: %s", e)
+                self._retire(worker)
+                worker = None
+            return None
+        finally:
+            self._slots.put(worker)
+
+    @staticmethod
+    def _convert_with_subprocess(source, to, format, outputfile, extra_args):
+        return convert_with_subprocess(source, to, format=format, outputfile=outputfile, extra_args=extra_args)
+
+    def shutdown(self):
+        """停止所有工作进程"""
+        self._closed = True
+        with self._lock:
+            workers = list(self._all_workers)
+            self._all_workers.clear()
+        for worker in workers:
+            worker.stop()
+        logging.info("pandoc 工作进程池已关闭。")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_pandoc_version = None
+
+
+def get_pandoc_version():
+    """返回 pandoc 版本号字符串，首次调用后缓存在进程内"""
+    global _pandoc_version
+    if _pandoc_version is None:
+        import pypandoc
+        _pandoc_version = pypandoc.get_pandoc_version()
+    return _pandoc_version
+
+
+def configure_pandoc_pool(size=2, max_jobs=200, use_server=True):
+    """按配置（重新）创建全局共享的工作进程池"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = PandocWorkerPool(size=size, max_jobs=max_jobs, use_server=use_server)
+        return _pool
+
+
+def get_pandoc_pool():
+    """获取全局共享的工作进程池，不存在时按默认参数创建"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PandocWorkerPool()
+        return _pool
+
+
+def shutdown_pandoc_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
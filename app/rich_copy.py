@@ -0,0 +1,97 @@
+# app/rich_copy.py
+# 不经过 Word/WPS 的富文本复制：pandoc 生成 HTML 片段，按样式设置写入内联样式，再封装为剪贴板的 HTML 格式。
+# 本模块只做纯文本处理，不依赖 pywin32，可以在任何平台上测试与基准测量。
+import re
+
+# Windows 剪贴板中 HTML 格式（CF_HTML）的注册名
+CF_HTML_FORMAT_NAME = "HTML Format"
+# Office 才能正确粘贴公式与图片（HTML 中的图片只是路径，粘贴后无法显示），含这些内容的文档改用 Office 复制
+_OFFICE_ONLY_RE = re.compile(r'<span class="math (?:inline|display)">|<img\b', re.IGNORECASE)
+_STYLED_TAG_RE = re.compile(r'<(p|h[1-6]|li|td|th|table|blockquote|pre|code)\b([^>]*)>')
+_STYLE_ATTR_RE = re.compile(r'\sstyle="([^"]*)"')
+_CF_HTML_HEADER = ("Version:0.9\r\nStartHTML:{:010d}\r\nEndHTML:{:010d}\r\n"
+                   "StartFragment:{:010d}\r\nEndFragment:{:010d}\r\n")
+_CF_HTML_PREFIX = '<html><head><meta charset="utf-8"></head><body><!--StartFragment-->'
+_CF_HTML_SUFFIX = '<!--EndFragment--></body></html>'
+_CF_HTML_OFFSET_RE = re.compile(rb'^(StartHTML|EndHTML|StartFragment|EndFragment):(-?\d+)\r?$', re.MULTILINE)
+_MONOSPACE_FONTS = "Consolas,'Courier New',monospace"
+
+
+def _font_css(style_data, bold=False):
+    """把界面样式（字体、字号、颜色）转换为 CSS；同时指定东亚字体，Word 粘贴中文时才会使用该字体"""
+    font = str(style_data.get('font', '宋体')).replace("'", '').replace('"', '')
+    try:
+        size = float(style_data.get('size', 12))
+    except (TypeError, ValueError):
+        size = 12.0
+    color = str(style_data.get('color', '000000'))
+    css = f"font-family:'{font}';mso-fareast-font-family:'{font}';font-size:{size:g}pt;color:#{color}"
+    if bold:
+        css += ';font-weight:bold'
+    return css
+
+
+def build_tag_styles(styles):
+    """返回各标签的内联样式，正文、列表、表格与引用使用 body 样式，h1-h3 使用各自的样式"""
+    styles = styles or {}
+    body = _font_css(styles.get('body') or {})
+    tag_styles = {tag: body for tag in ('p', 'li', 'blockquote')}
+    for level in range(1, 7):
+        heading = styles.get(f'h{level}') if level <= 3 else None
+        tag_styles[f'h{level}'] = _font_css(heading or styles.get('body') or {}, bold=True)
+    cell = f"{body};border:1px solid #000000;padding:2pt 5pt"
+    tag_styles.update({
+        'td': cell,
+        'th': f"{cell};font-weight:bold",
+        'table': "border-collapse:collapse",
+        'pre': f"font-family:{_MONOSPACE_FONTS};margin:0",
+        'code': f"font-family:{_MONOSPACE_FONTS}",
+    })
+    return tag_styles
+
+
+def apply_inline_styles(fragment, styles):
+    """为 HTML 片段中的块级标签加上内联样式；标签已有的样式（如表格对齐）排在后面，优先生效"""
+    tag_styles = build_tag_styles(styles)
+
+    def _replace(match):
+        tag, attrs = match.group(1), match.group(2)
+        css = tag_styles[tag]
+        existing = _STYLE_ATTR_RE.search(attrs)
+        if existing:
+            attrs = attrs[:existing.start()] + attrs[existing.end():]
+            css = f"{css};{existing.group(1)}"
+        return f'<{tag}{attrs} style="{css}">'
+
+    return _STYLED_TAG_RE.sub(_replace, fragment)
+
+
+def build_cf_html(fragment):
+    """
+    把 HTML 片段封装为 CF_HTML：描述头中记录完整 HTML 与片段在 UTF-8 字节流中的起止偏移。
+    偏移固定为 10 位数字，因此描述头的长度与偏移的数值无关，只需计算一次。
+    """
+    prefix = _CF_HTML_PREFIX.encode('utf-8')
+    body = fragment.encode('utf-8')
+    suffix = _CF_HTML_SUFFIX.encode('utf-8')
+    start_html = len(_CF_HTML_HEADER.format(0, 0, 0, 0))
+    start_fragment = start_html + len(prefix)
+    end_fragment = start_fragment + len(body)
+    end_html = end_fragment + len(suffix)
+    header = _CF_HTML_HEADER.format(start_html, end_html, start_fragment, end_fragment).encode('ascii')
+    return b''.join((header, prefix, body, suffix))
+
+
+def extract_cf_html_fragment(data):
+    """按描述头中的偏移取出 CF_HTML 中的片段，用于校验 build_cf_html 的结果"""
+    offsets = {name.decode('ascii'): int(value) for name, value in _CF_HTML_OFFSET_RE.findall(data)}
+    return data[offsets['StartFragment']:offsets['EndFragment']].decode('utf-8')
+
+
+def needs_office(fragment):
+    """
+    片段中含有公式或图片时返回 True：公式只有经 Office 转换后才能粘贴为可编辑的公式，
+    图片需要嵌入 docx 后才能随内容一起粘贴。
+    """
+    return _OFFICE_ONLY_RE.search(fragment) is not None
+
@@ -0,0 +1,295 @@
+# app/scheduler.py
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+
+# 优先级数值越小越先执行
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+# 每类任务的默认并发上限：pandoc 转换、Office 复制（共用剪贴板，必须串行）、打开文件/目录、后台维护
+DEFAULT_KIND_LIMITS = {'pandoc': 2, 'office': 1, 'shell': 2, 'background': 1}
+# 每类任务保留的延迟样本数，用于计算分位数
+_LATENCY_SAMPLES = 200
+
+_current = threading.local()
+
+
+class Job:
+    """提交给 JobScheduler 的一个任务，可用于查询状态、等待完成或取消"""
+
+    PENDING, RUNNING, DONE, FAILED, CANCELLED = 'pending', 'running', 'done', 'failed', 'cancelled'
+
+    def __init__(self, kind, name, func, key, priority):
+        self.kind = kind
+        self.name = name
+        self.func = func
+        self.key = key
+        self.priority = priority
+        self.state = Job.PENDING
+        self.result = None
+        self.error = None
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        # 任务函数是否经 current_job_cancelled() 看到了取消标志（并据此提前结束）；没有看到的任务仍算作已完成
+        self._cancel_observed = False
+
+    @property
+    def cancelled(self):
+        """任务是否已被取消或被更新的同类任务取代。运行中的任务应在耗时步骤之间检查该标志"""
+        return self._cancel_event.is_set()
+
+    @property
+    def is_background(self):
+        return self.priority >= PRIORITY_BACKGROUND
+
+    def wait(self, timeout=None):
+        """等待任务结束（完成、失败或取消），返回是否已结束"""
+        return self._done_event.wait(timeout)
+
+
+def current_job():
+    """返回当前线程正在执行的任务，不在调度器线程中时返回 None"""
+    return getattr(_current, 'job', None)
+
+
+def current_job_cancelled():
+    """当前任务是否已被取消；供任务函数在开始耗时或有副作用的步骤前检查"""
+    job = current_job()
+    if job is None or not job.cancelled:
+        return False
+    job._cancel_observed = True
+    return True
+
+
+class _KindQueue:
+    """一类任务的优先队列、工作线程与统计信息"""
+
+    def __init__(self, kind, max_workers):
+        self.kind = kind
+        self.max_workers = max(1, int(max_workers))
+        # 后台任务最多占用的线程数，保证有多个线程时总有一个留给交互任务
+        self.background_limit = max(1, self.max_workers - 1)
+        self.heap = []
+        self.pending_by_key = {}
+        self.running_by_key = {}
+        self.running = 0
+        self.running_background = 0
+        self.workers = []
+        self.idle = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.coalesced = 0
+        self.wait_times = deque(maxlen=_LATENCY_SAMPLES)
+        self.run_times = deque(maxlen=_LATENCY_SAMPLES)
+
+
+def _latency_summary(samples):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean_ms': sum(ordered) / len(ordered) * 1000,
+        'p50_ms': ordered[len(ordered) // 2] * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'max_ms': ordered[-1] * 1000,
+    }
+
+
+class JobScheduler:
+    """
+    按任务类别划分的有界调度器。每类任务有独立的工作线程上限和优先队列：
+    交互任务（保存、复制）优先于后台任务（预热、批量）；带 key 的任务会合并，
+    同一 key 只保留最新提交的待执行任务，并通知正在运行的旧任务放弃后续步骤。
+    """
+
+    def __init__(self, kind_limits=None):
+        limits = dict(DEFAULT_KIND_LIMITS)
+        limits.update(kind_limits or {})
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._queues = {kind: _KindQueue(kind, size) for kind, size in limits.items()}
+        self._sequence = itertools.count()
+        self._closed = False
+
+    def submit(self, kind, func, name=None, key=None, priority=PRIORITY_INTERACTIVE, supersede_running=True):
+        """
+        提交任务并立即返回 Job。
+        key 不为 None 时启用合并：尚未开始的同 key 任务会被取消并由本任务取代；
+        supersede_running 为 True 时还会把正在运行的同 key 任务标记为已取消（协作式，需任务自行检查）。
+        同一 key 的任务不会并发执行。
+        """
+        job = Job(kind, name or getattr(func, '__name__', 'job'), func, key, priority)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("任务调度器已关闭。")
+            q = self._queues[kind]
+            if key is not None:
+                superseded = q.pending_by_key.pop(key, None)
+                if superseded is not None:
+                    self._finish_cancelled_locked(q, superseded)
+                    q.coalesced += 1
+                    logging.info("任务 %s 尚未开始即被更新的同类任务取代。", superseded.name)
+                running = q.running_by_key.get(key)
+                if running is not None and supersede_running:
+                    running._cancel_event.set()
+                q.pending_by_key[key] = job
+            heapq.heappush(q.heap, (priority, next(self._sequence), job))
+            q.submitted += 1
+            if q.idle == 0 and len(q.workers) < q.max_workers:
+                worker = threading.Thread(target=self._worker_loop, args=(q,), daemon=True,
+                                          name=f"{kind}-worker-{len(q.workers) + 1}")
+                q.workers.append(worker)
+                worker.start()
+            self._condition.notify_all()
+        return job
+
+    def cancel(self, job):
+        """取消任务：未开始的任务直接移出队列，运行中的任务只设置取消标志。返回任务是否尚未开始"""
+        with self._condition:
+            job._cancel_event.set()
+            if job.state != Job.PENDING:
+                return False
+            q = self._queues[job.kind]
+            if job.key is not None and q.pending_by_key.get(job.key) is job:
+                del q.pending_by_key[job.key]
+            self._finish_cancelled_locked(q, job)
+            return True
+
+    def _finish_cancelled_locked(self, q, job):
+        # 堆中的条目在弹出时按状态跳过，这里无需立即删除
+        job._cancel_event.set()
+        job.state = Job.CANCELLED
+        job.finished_at = time.perf_counter()
+        q.cancelled += 1
+        job._done_event.set()
+
+    def _next_job_locked(self, q):
+        """取出优先级最高且当前可以执行的任务；同 key 任务正在运行或后台名额已满时暂缓"""
+        deferred = []
+        chosen = None
+        while q.heap:
+            entry = heapq.heappop(q.heap)
+            job = entry[2]
+            if job.state != Job.PENDING:
+                continue
+            if job.key is not None and job.key in q.running_by_key:
+                deferred.append(entry)
+                continue
+            if job.is_background and q.running_background >= q.background_limit:
+                deferred.append(entry)
+                continue
+            chosen = job
+            break
+        for entry in deferred:
+            heapq.heappush(q.heap, entry)
+        return chosen
+
+    def _worker_loop(self, q):
+        while True:
+            with self._condition:
+                job = None
+                while job is None:
+                    if self._closed:
+                        return
+                    job = self._next_job_locked(q)
+                    if job is None:
+                        q.idle += 1
+                        self._condition.wait()
+                        q.idle -= 1
+                job.state = Job.RUNNING
+                job.started_at = time.perf_counter()
+                if job.key is not None:
+                    if q.pending_by_key.get(job.key) is job:
+                        del q.pending_by_key[job.key]
+                    q.running_by_key[job.key] = job
+                q.running += 1
+                if job.is_background:
+                    q.running_background += 1
+            self._run(q, job)
+
+    def _run(self, q, job):
+        _current.job = job
+        try:
+            job.result = job.func()
+            # 运行中被取代的任务只有在检查过取消标志后才算作取消，否则它已完整执行（如保存已写入文件）
+            state = Job.CANCELLED if job._cancel_observed else Job.DONE
+        except Exception as e:
+            job.error = e
+            state = Job.FAILED
+            logging.error("任务 %s 执行失败: %s", job.name, e, exc_info=True)
+        finally:
+            _current.job = None
+        with self._condition:
+            job.state = state
+            job.finished_at = time.perf_counter()
+            wait_time = job.started_at - job.submitted_at
+            run_time = job.finished_at - job.started_at
+            q.wait_times.append(wait_time)
+            q.run_times.append(run_time)
+            q.running -= 1
+            if job.is_background:
+                q.running_background -= 1
+            if job.key is not None and q.running_by_key.get(job.key) is job:
+                del q.running_by_key[job.key]
+            if state == Job.DONE:
+                q.completed += 1
+            elif state == Job.FAILED:
+                q.failed += 1
+            else:
+                q.cancelled += 1
+            depth = sum(1 for _, _, pending in q.heap if pending.state == Job.PENDING)
+            # 同 key 或后台任务可能在等待本任务结束
+            self._condition.notify_all()
+        job._done_event.set()
+        logging.info("任务 %s (%s) 结束: %s，排队 %.1f ms，执行 %.1f ms，队列中还有 %s 个任务。",
+                     job.name, job.kind, state, wait_time * 1000, run_time * 1000, depth)
+
+    def stats(self):
+        """每类任务的队列深度、运行数、计数与延迟分位数"""
+        with self._condition:
+            result = {}
+            for kind, q in self._queues.items():
+                result[kind] = {
+                    'queue_depth': sum(1 for _, _, job in q.heap if job.state == Job.PENDING),
+                    'running': q.running,
+                    'max_workers': q.max_workers,
+                    'submitted': q.submitted,
+                    'completed': q.completed,
+                    'failed': q.failed,
+                    'cancelled': q.cancelled,
+                    'coalesced': q.coalesced,
+                    'wait': _latency_summary(q.wait_times),
+                    'run': _latency_summary(q.run_times),
+                }
+            return result
+
+    def shutdown(self, wait=False, timeout=5.0):
+        """停止接收新任务并取消全部待执行任务；wait 为 True 时等待运行中的任务结束"""
+        with self._condition:
+            self._closed = True
+            workers = []
+            for q in self._queues.values():
+                for _, _, job in q.heap:
+                    if job.state == Job.PENDING:
+                        self._finish_cancelled_locked(q, job)
+                q.heap.clear()
+                q.pending_by_key.clear()
+                for job in q.running_by_key.values():
+                    job._cancel_event.set()
+                workers.extend(q.workers)
+            self._condition.notify_all()
+        if wait:
+            deadline = time.monotonic() + timeout
+            for worker in workers:
+                worker.join(max(0.0, deadline - time.monotonic()))
+        logging.info("任务调度器已关闭。")
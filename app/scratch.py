@@ -0,0 +1,174 @@
+# app/scratch.py
+# 必须落盘的中间文件（如交给 Office InsertFile 的 docx）使用的受管工作区
+import contextlib
+import logging
+import os
+import platform
+import queue
+import tempfile
+import threading
+import time
+
+DEFAULT_SLOTS = 4
+# 超过该秒数未使用的中间文件会被清理
+DEFAULT_MAX_IDLE = 300
+DEFAULT_SWEEP_INTERVAL = 60
+
+
+def default_scratch_dir(use_ram_disk=True):
+    """
+    优先放在内存文件系统（Linux 的 /dev/shm）中，否则放在系统临时目录下。
+    目录按用户区分，同一用户的多个进程共用，文件名中带有进程号。
+    """
+    base = tempfile.gettempdir()
+    if use_ram_disk and platform.system() == 'Linux' and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        base = '/dev/shm'
+    owner = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(base, f'md2word-scratch-{owner}')
+
+
+class ScratchWorkspace:
+    """
+    固定数量的可复用中间文件。reserve() 借出一个文件路径，用完归还后留给下一次使用（内容被覆盖），
+    因此中间文件的数量始终有上限；闲置超过 max_idle 秒的文件由定时任务删除，
+    启动时也会清除以前的进程（包括异常退出的进程）遗留的过期文件。
+    """
+
+    def __init__(self, directory=None, slots=DEFAULT_SLOTS, max_idle=DEFAULT_MAX_IDLE,
+                 sweep_interval=DEFAULT_SWEEP_INTERVAL):
+        self.directory = directory or default_scratch_dir()
+        self.max_idle = max_idle
+        self.sweep_interval = sweep_interval
+        self._prefix = f'{os.getpid()}-'
+        self._free = queue.LifoQueue()
+        for slot in range(max(1, slots)):
+            self._free.put(slot)
+        self._in_use = set()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._closed = False
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self.sweep()
+        self._schedule_sweep()
+
+    @contextlib.contextmanager
+    def reserve(self, suffix='', timeout=None):
+        """借出一个中间文件路径；所有文件都在使用中时等待归还（超时抛出 TimeoutError）"""
+        try:
+            slot = self._free.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("没有空闲的中间文件")
+        path = os.path.join(self.directory, f'{self._prefix}{slot}{suffix}')
+        with self._lock:
+            self._in_use.add(path)
+        try:
+            # 内存文件系统可能已被系统清空
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            yield path
+        finally:
+            with self._lock:
+                self._in_use.discard(path)
+            self._free.put(slot)
+
+    def write_named(self, name, data):
+        """
+        把内容确定的数据（同名即同内容，如按样式哈希命名的样式文件）写入工作区并返回路径。
+        文件已存在时只更新修改时间；它与借出的中间文件一样在闲置 max_idle 秒后被清理，关闭工作区时删除。
+        """
+        path = os.path.join(self.directory, f'{self._prefix}{name}')
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        if os.path.exists(path):
+            os.utime(path)
+            return path
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return path
+
+    def sweep(self):
+        """删除闲置超过 max_idle 秒且未被借出的中间文件"""
+        cutoff = time.time() - self.max_idle
+        removed = 0
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        for name in names:
+            path = os.path.join(self.directory, name)
+            with self._lock:
+                if path in self._in_use:
+                    continue
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                # 已被其他进程删除，或仍被 Office 打开
+                continue
+        if removed:
+            logging.info("已清理 %s 个过期的中间文件。", removed)
+        return removed
+
+    def _schedule_sweep(self):
+        if self._closed:
+            return
+        self._timer = threading.Timer(self.sweep_interval, self._sweep_and_reschedule)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _sweep_and_reschedule(self):
+        try:
+            self.sweep()
+        finally:
+            self._schedule_sweep()
+
+    def close(self):
+        """停止定时清理并删除本进程的全部中间文件"""
+        self._closed = True
+        if self._timer is not None:
+            self._timer.cancel()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.startswith(self._prefix):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError as e:
+                    logging.warning("删除中间文件失败 %s: %s", name, e)
+
+
+_workspace = None
+_workspace_lock = threading.Lock()
+
+
+def configure_scratch_workspace(slots=DEFAULT_SLOTS, max_idle=DEFAULT_MAX_IDLE, use_ram_disk=True):
+    """按配置（重新）创建全局共享的中间文件工作区"""
+    global _workspace
+    with _workspace_lock:
+        if _workspace is not None:
+            _workspace.close()
+        _workspace = ScratchWorkspace(default_scratch_dir(use_ram_disk), slots=slots, max_idle=max_idle)
+        return _workspace
+
+
+def get_scratch_workspace():
+    global _workspace
+    with _workspace_lock:
+        if _workspace is None:
+            _workspace = ScratchWorkspace()
+        return _workspace
+
+
+def shutdown_scratch_workspace():
+    global _workspace
+    with _workspace_lock:
+        if _workspace is not None:
+            _workspace.close()
+            _workspace = None
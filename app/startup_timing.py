@@ -0,0 +1,69 @@
+# app/startup_timing.py
+# 启动阶段的导入耗时统计，效果类似 `python -X importtime`，但以摘要形式写入日志
+import builtins
+import logging
+import sys
+import threading
+import time
+
+_real_import = builtins.__import__
+_records = {}
+_local = threading.local()
+_start_time = None
+_installed = False
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # 已加载的模块和相对导入直接放行，只统计首次加载的绝对导入
+    if level or name in sys.modules:
+        return _real_import(name, globals, locals, fromlist, level)
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _real_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - start
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        if name not in _records:
+            _records[name] = (elapsed, elapsed - children, not stack)
+
+
+def install_import_timer():
+    """开始记录导入耗时，应在导入任何重量级模块之前调用"""
+    global _start_time, _installed
+    if _installed:
+        return
+    _start_time = time.perf_counter()
+    builtins.__import__ = _timed_import
+    _installed = True
+
+
+def uninstall_import_timer():
+    global _installed
+    if _installed:
+        builtins.__import__ = _real_import
+        _installed = False
+
+
+def log_startup_report(stage, top_n=10):
+    """
+    记录从启动到 stage 阶段的总耗时以及导入耗时摘要，并停止统计。
+    摘要列出累计耗时最长的模块（累计耗时包含其间接导入的模块）。
+    """
+    uninstall_import_timer()
+    if _start_time is None:
+        return
+    total = time.perf_counter() - _start_time
+    records = dict(_records)
+    import_total = sum(cumulative for cumulative, _, top_level in records.values() if top_level)
+    logging.info("启动耗时报告: 启动至%s共 %.1f ms，其中模块导入 %.1f ms（%s 个模块）。",
+                 stage, total * 1000, import_total * 1000, len(records))
+    slowest = sorted(records.items(), key=lambda item: item[1][0], reverse=True)[:top_n]
+    for name, (cumulative, self_time, _) in slowest:
+        logging.info("  导入 %-30s 累计 %8.1f ms  自身 %8.1f ms", name, cumulative * 1000, self_time * 1000)
+    _records.clear()
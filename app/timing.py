@@ -0,0 +1,239 @@
+# app/timing.py
+# 按阶段计时：每次导出、复制各输出一条结构化的耗时记录，并可按需为单个任务采集 cProfile / tracemalloc 数据
+import contextlib
+import cProfile
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+
+from .utils import get_app_data_dir
+
+# 例如 MD2WORD_PROFILE=cprofile,tracemalloc（或 all），与配置中的 profiling 开关任一开启即生效
+PROFILE_ENV_VAR = 'MD2WORD_PROFILE'
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+# 前端桥接调用超过该耗时（毫秒）时以 INFO 级别记录，否则只记 DEBUG 日志
+SLOW_BRIDGE_CALL_MS = 100
+TRACEMALLOC_FRAMES = 10
+
+_local = threading.local()
+_profile_settings = None
+_profile_lock = threading.Lock()
+_cprofile_lock = threading.Lock()
+_tracemalloc_users = 0
+_bridge_stats = {}
+_bridge_lock = threading.Lock()
+
+
+class JobTimer:
+    """
+    一次任务（导出、复制）的计时器。各阶段的耗时按名称累加，同一阶段多次出现（如多个格式各调用一次 pandoc）时合并；
+    并行执行的阶段分别计入，因此各阶段之和可能大于总耗时。
+    """
+
+    def __init__(self, job, **fields):
+        self.job = job
+        self.status = 'ok'
+        self.fields = dict(fields)
+        self.spans = {}
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        with self._lock:
+            self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    def set(self, **fields):
+        with self._lock:
+            self.fields.update(fields)
+
+    def record(self):
+        total = time.perf_counter() - self.started
+        with self._lock:
+            spans = {name: round(seconds * 1000, 1) for name, seconds in self.spans.items()}
+            return {'job': self.job, 'status': self.status, 'total_ms': round(total * 1000, 1), 'spans': spans,
+                    **self.fields}
+
+
+def current_timer():
+    return getattr(_local, 'timer', None)
+
+
+@contextlib.contextmanager
+def activate(timer):
+    """在当前线程中把 timer 设为正在进行的任务，之后的 span() 都计入该任务"""
+    previous = current_timer()
+    _local.timer = timer
+    try:
+        yield timer
+    finally:
+        _local.timer = previous
+
+
+@contextlib.contextmanager
+def span(name):
+    """计时一个阶段并计入当前线程正在进行的任务；没有任务时几乎没有开销"""
+    timer = current_timer()
+    if timer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.add(name, time.perf_counter() - start)
+
+
+def propagate(func):
+    """把调用方线程当前的任务带到 func 实际执行的线程（导出线程池、Office 实例线程等）"""
+    timer = current_timer()
+    if timer is None:
+        return func
+
+    @functools.wraps(func)
+    def _wrapper(*args, **kwargs):
+        with activate(timer):
+            return func(*args, **kwargs)
+
+    return _wrapper
+
+
+@contextlib.contextmanager
+def job(name, **fields):
+    """
+    计时一次任务，结束时输出一条“耗时记录”日志（JSON）；开启性能分析时同时采集 cProfile / tracemalloc。
+    调用方可以通过返回的 JobTimer 补充字段或修改 status，任务抛出异常时 status 为 error。
+    """
+    timer = JobTimer(name, **fields)
+    with activate(timer), _profiled(name):
+        try:
+            yield timer
+        except BaseException:
+            timer.status = 'error'
+            raise
+        finally:
+            logging.info("耗时记录 %s", json.dumps(timer.record(), ensure_ascii=False))
+
+
+# ---------------------------------------------------------------- 性能分析
+
+def configure_profiling(cprofile=False, tracemalloc=False, directory=None):
+    """设置是否为每个任务采集性能数据；环境变量 MD2WORD_PROFILE 中列出的方式总是开启"""
+    global _profile_settings
+    modes = {mode.strip().lower() for mode in os.environ.get(PROFILE_ENV_VAR, '').split(',') if mode.strip()}
+    if 'all' in modes:
+        modes = set(PROFILE_MODES)
+    settings = {'cprofile': bool(cprofile) or 'cprofile' in modes,
+                'tracemalloc': bool(tracemalloc) or 'tracemalloc' in modes,
+                'directory': directory or os.path.join(get_app_data_dir(), 'profiles')}
+    with _profile_lock:
+        _profile_settings = settings
+    if settings['cprofile'] or settings['tracemalloc']:
+        logging.info("已开启性能分析（cProfile: %s，tracemalloc: %s），结果写入 %s",
+                     settings['cprofile'], settings['tracemalloc'], settings['directory'])
+    return settings
+
+
+def _get_profile_settings():
+    with _profile_lock:
+        settings = _profile_settings
+    return settings if settings is not None else configure_profiling()
+
+
+def _start_tracemalloc():
+    global _tracemalloc_users
+    with _profile_lock:
+        # 多个任务同时采集时共用一次跟踪，最后一个任务结束时才停止
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        _tracemalloc_users += 1
+
+
+def _stop_tracemalloc():
+    global _tracemalloc_users
+    with _profile_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0:
+            tracemalloc.stop()
+
+
+@contextlib.contextmanager
+def _profiled(name):
+    settings = _get_profile_settings()
+    if not (settings['cprofile'] or settings['tracemalloc']):
+        yield
+        return
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    base_path = os.path.join(settings['directory'], f"{name}-{stamp}-{threading.get_ident()}")
+    profiler = None
+    # cProfile 同一时间只能有一个分析器处于启用状态，并发的其他任务不采集
+    if settings['cprofile']:
+        if _cprofile_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                logging.info("无法启动 cProfile: %s", e)
+                profiler = None
+                _cprofile_lock.release()
+        else:
+            logging.info("另一个任务正在采集 cProfile，本次任务 %s 不采集。", name)
+    if settings['tracemalloc']:
+        _start_tracemalloc()
+    try:
+        yield
+    finally:
+        os.makedirs(settings['directory'], exist_ok=True)
+        if profiler is not None:
+            profiler.disable()
+            _cprofile_lock.release()
+            try:
+                profiler.dump_stats(base_path + '.prof')
+                logging.info("cProfile 结果已写入 %s.prof", base_path)
+            except OSError as e:
+                logging.error("写入 cProfile 结果失败: %s", e)
+        if settings['tracemalloc']:
+            try:
+                snapshot = tracemalloc.take_snapshot()
+                snapshot.dump(base_path + '.tracemalloc')
+                logging.info("tracemalloc 快照已写入 %s.tracemalloc（峰值 %.1f MB）", base_path,
+                             tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+            except (OSError, RuntimeError) as e:
+                logging.error("写入 tracemalloc 快照失败: %s", e)
+            finally:
+                _stop_tracemalloc()
+
+
+# ---------------------------------------------------------------- 前端桥接调用
+
+def timed_bridge(func):
+    """统计前端经 pywebview 桥接调用的方法耗时；较慢的调用写入日志"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def _wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with _bridge_lock:
+                stats = _bridge_stats.setdefault(name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+                stats['count'] += 1
+                stats['total_ms'] += elapsed_ms
+                stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            level = logging.INFO if elapsed_ms >= SLOW_BRIDGE_CALL_MS else logging.DEBUG
+            logging.log(level, "桥接调用 %s 耗时 %.1f ms", name, elapsed_ms)
+
+    return _wrapper
+
+
+def get_bridge_stats():
+    """各桥接方法的调用次数、平均与最大耗时（毫秒）"""
+    with _bridge_lock:
+        return {name: {'count': stats['count'], 'avg_ms': round(stats['total_ms'] / stats['count'], 2),
+                       'max_ms': round(stats['max_ms'], 2)}
+                for name, stats in _bridge_stats.items()}
@@ -0,0 +1,99 @@
+# app/ui_bundle.py
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from .utils import get_app_data_dir
+
+# 打包方式变化时递增，使旧的界面缓存失效
+UI_BUNDLE_FORMAT_VERSION = 1
+# 复制到界面目录中的资源：静态目录与二维码图片（相对于程序目录）
+UI_STATIC_DIR = 'static'
+UI_IMAGES = ('wechat_qr.png', 'alipay_qr.png')
+_COMPLETE_MARKER = '.complete'
+# 超过该时长（秒）仍未完成的临时目录视为中断残留，可以清理
+_STALE_TEMP_SECONDS = 3600
+
+
+def _iter_source_files(source_dir):
+    static_root = os.path.join(source_dir, UI_STATIC_DIR)
+    for root, dirs, files in os.walk(static_root):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            yield os.path.relpath(path, source_dir), path
+    for name in UI_IMAGES:
+        path = os.path.join(source_dir, name)
+        if os.path.exists(path):
+            yield os.path.join('images', name), path
+
+
+def compute_ui_version(source_dir, html):
+    """根据页面内容与各资源文件的大小、修改时间计算版本号，只需 stat 而无需读取资源内容"""
+    digest = hashlib.sha256(f"{UI_BUNDLE_FORMAT_VERSION}\0".encode('utf-8'))
+    digest.update(html.encode('utf-8'))
+    for relpath, path in _iter_source_files(source_dir):
+        st = os.stat(path)
+        digest.update(f"\0{relpath}\0{st.st_size}\0{st.st_mtime_ns}".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _build_bundle(source_dir, html, target_dir):
+    parent = os.path.dirname(target_dir)
+    temp_dir = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+    try:
+        for relpath, path in _iter_source_files(source_dir):
+            destination = os.path.join(temp_dir, relpath)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            shutil.copy2(path, destination)
+        with open(os.path.join(temp_dir, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write(html)
+        open(os.path.join(temp_dir, _COMPLETE_MARKER), 'w').close()
+        try:
+            os.replace(temp_dir, target_dir)
+        except OSError:
+            # 另一个实例已抢先生成了同一版本（目标目录非空时无法替换）
+            if not os.path.exists(os.path.join(target_dir, _COMPLETE_MARKER)):
+                raise
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+
+def _prune_old_versions(bundles_dir, keep):
+    for name in os.listdir(bundles_dir):
+        if name == keep:
+            continue
+        path = os.path.join(bundles_dir, name)
+        if not os.path.isdir(path):
+            continue
+        # 其他实例可能正在生成界面文件，只清理明显中断残留的临时目录
+        if name.startswith('.tmp-') and time.time() - os.path.getmtime(path) < _STALE_TEMP_SECONDS:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def ensure_ui_bundle(source_dir, html, bundles_dir=None):
+    """
+    返回界面入口 index.html 的路径。界面文件只在页面或资源变化后的首次启动时生成一次，
+    保存在 app data 目录下按版本号区分的子目录中，之后的启动直接复用。
+    """
+    bundles_dir = bundles_dir or os.path.join(get_app_data_dir(), 'ui')
+    os.makedirs(bundles_dir, exist_ok=True)
+    version = compute_ui_version(source_dir, html)
+    target_dir = os.path.join(bundles_dir, version)
+    index_path = os.path.join(target_dir, 'index.html')
+    if os.path.exists(os.path.join(target_dir, _COMPLETE_MARKER)):
+        logging.info("复用已生成的界面文件 (版本 %s)", version)
+        return index_path
+    if os.path.isdir(target_dir):
+        # 上次生成被中断，残留的目录不完整
+        shutil.rmtree(target_dir, ignore_errors=True)
+    _build_bundle(source_dir, html, target_dir)
+    _prune_old_versions(bundles_dir, keep=version)
+    logging.info("界面文件已生成: %s", target_dir)
+    return index_path
@@ -5,7 +5,6 @@ import sys
 import traceback
 import platform
 import ctypes
-from ctypes import wintypes
 import re
 import base64
 import subprocess
@@ -51,13 +50,14 @@ def get_default_directory():
     """获取Windows下的'文档'目录或通用的用户主目录"""
     try:
         if platform.system() == "Windows":
+            from ctypes import wintypes
             CSIDL_PERSONAL = 5
-            buf = ctypes.create_unicode_buffer(ctypes.wintypes.MAX_PATH)
+            buf = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
             ctypes.windll.shell32.SHGetFolderPathW(None, CSIDL_PERSONAL, None, 0, buf)
             if os.path.isdir(buf.value):
                 return buf.value
     except Exception as e:
-        logging.warning(f"无法获取 '文档' 文件夹路径, 错误: {e}")
+        logging.warning("无法获取 '文档' 文件夹路径, 错误: %s", e)
     return os.path.expanduser("~")
 
 
@@ -85,7 +85,7 @@ def image_to_base64(file_path):
             encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
         return f"data:image/png;base64,{encoded_string}"
     except (FileNotFoundError, AttributeError):
-        logging.error(f"资源图片未找到: {file_path}")
+        logging.error("资源图片未找到: %s", file_path)
         # 返回一个表示“未找到”的SVG图像
         return "data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxNDAiIGhlaWdodD0iMTQwIiB2aWV3Qm94PSIwIDAgMTQwIDE0MCI+PHJlY3Qgd2lkdGg9IjE0MCIgaGVpZ2h0PSIxNDAiIGZpbGw9IiNlZWVlZWUiLz48dGV4dCB4PSI1MCUiIHk9IjUwJSIgZm9udC1mYW1pbHk9InNhbnMtc2VyaWYiIGZvbnQtc2l6ZT0iMTYiIGZpbGw9IiNhYWFhYWEiIHRleHQtYW5jaGyPSJtaWRkbGUiIGR5PSIuM2VtIj5Ob3QgRm91bmQ8L3RleHQ+PC9zdmc+"
 
@@ -99,6 +99,6 @@ def set_dark_title_bar(hwnd: int):
         value = ctypes.c_int(1)
         ctypes.windll.dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(value),
                                                    ctypes.sizeof(value))
-        logging.info(f"已为窗口句柄 {hwnd} 应用暗色标题栏。")
+        logging.info("已为窗口句柄 %s 应用暗色标题栏。", hwnd)
     except Exception as e:
-        logging.error(f"设置暗色标题栏失败: {e}")
\ No newline at end of file
+        logging.error("设置暗色标题栏失败: %s", e)
\ No newline at end of file
@@ -0,0 +1,341 @@
+# app/watcher.py
+# 监视文件夹：目录树中的 Markdown 文件内容变化后自动转换到输出目录
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .converter import file_digest
+from .utils import get_app_data_dir
+
+MARKDOWN_EXTENSIONS = ('.md', '.markdown')
+# 清单格式变化时递增，旧清单会被忽略（即全部重新转换一次）
+MANIFEST_VERSION = 1
+
+
+def default_manifest_path(source_dir, output_dir):
+    """每对 (监视目录, 输出目录) 在应用数据目录中各有一份清单"""
+    pair = f"{os.path.normcase(os.path.abspath(source_dir))}\0{os.path.normcase(os.path.abspath(output_dir))}"
+    key = hashlib.sha256(pair.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(get_app_data_dir(), 'watch', f'{key}.json')
+
+
+class WatchManifest:
+    """
+    记录每个源文件上次成功转换时的内容哈希、转换设置标识与输出文件。
+    哈希与设置都未变化且输出文件仍然存在的文件不会重新转换，因此重启监视后不必全部重转。
+    """
+
+    def __init__(self, path, settings_id):
+        self.path = path
+        self.settings_id = settings_id
+        self._files = {}
+        # 监视过程中写出的全部输出文件；删除源文件后其输出仍保留在这里，不会被当作新的源文件
+        self._outputs = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _path_key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self._files = data.get('files', {})
+                self._outputs = {self._path_key(path) for entry in self._files.values() for path in entry['outputs']}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning("监视清单无法读取，将重新转换全部文件: %s", e)
+
+    def is_current(self, rel_path, digest):
+        with self._lock:
+            entry = self._files.get(rel_path)
+        return (entry is not None and entry['hash'] == digest and entry['settings'] == self.settings_id
+                and all(os.path.exists(path) for path in entry['outputs']))
+
+    def is_output(self, path):
+        """path 是否是本监视写出的文件（输出目录与监视目录相同时，导出的 .md 不能再触发转换）"""
+        with self._lock:
+            return self._path_key(path) in self._outputs
+
+    def record(self, rel_path, digest, outputs):
+        with self._lock:
+            self._outputs.update(self._path_key(path) for path in outputs)
+            self._files[rel_path] = {'hash': digest, 'settings': self.settings_id, 'outputs': outputs,
+                                     'converted_at': time.time()}
+            self._dirty = True
+
+    def forget(self, rel_path):
+        with self._lock:
+            if self._files.pop(rel_path, None) is not None:
+                self._dirty = True
+
+    def save(self):
+        """有变化时原子写盘"""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps({'version': MANIFEST_VERSION, 'files': self._files}, ensure_ascii=False, indent=1)
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.manifest-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logging.error("写入监视清单失败: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+class FolderWatcher:
+    """
+    监视 source_dir 下的 Markdown 文件，变化后调用 convert(源文件, 输出路径前缀) 转换到 output_dir 的对应位置。
+    优先使用 watchdog（inotify / ReadDirectoryChangesW / FSEvents），未安装时改为定时轮询。
+    同一文件的连续写入在 debounce 秒内合并为一次；转换在最多 workers 个线程中进行，
+    同一文件不会并发转换，转换期间又发生变化时在完成后再转换一次。
+    """
+
+    def __init__(self, source_dir, output_dir, convert, settings_id='', debounce=0.5, workers=1, poll_interval=1.0,
+                 use_watchdog=True, manifest_path=None, on_result=None):
+        self.source_dir = os.path.abspath(source_dir)
+        self.output_dir = os.path.abspath(output_dir)
+        self.convert = convert
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_watchdog = use_watchdog
+        # on_result(源文件, 输出文件列表, 错误信息) 在每次转换完成或失败后调用
+        self.on_result = on_result
+        self.manifest = WatchManifest(manifest_path or default_manifest_path(source_dir, output_dir), settings_id)
+        self.backend = None
+        self.converted = 0
+        self.skipped = 0
+        self.failed = 0
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='watch-convert')
+        self._due = {}
+        self._active = set()
+        self._changed_while_active = set()
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._threads = []
+        self._observer = None
+
+    # ------------------------------------------------------------ 生命周期
+
+    def start(self):
+        """加载清单、扫描一遍现有文件（只转换有变化的），然后开始监视"""
+        if not os.path.isdir(self.source_dir):
+            raise FileNotFoundError(f"监视目录不存在: {self.source_dir}")
+        self.manifest.load()
+        self._start_thread(self._debounce_loop, 'watch-debounce')
+        snapshot = self._snapshot()
+        for path in snapshot:
+            self._submit(path)
+        if not (self.use_watchdog and self._start_watchdog()):
+            self.backend = 'polling'
+            self._start_thread(lambda: self._poll_loop(snapshot), 'watch-poll')
+        logging.info("开始监视 %s（%s），输出到 %s", self.source_dir, self.backend, self.output_dir)
+
+    def stop(self):
+        """停止监视并等待进行中的转换完成"""
+        self._stopped.set()
+        with self._condition:
+            self._due.clear()
+            self._condition.notify_all()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._executor.shutdown(wait=True)
+        self.manifest.save()
+        logging.info("已停止监视 %s", self.source_dir)
+
+    def stats(self):
+        with self._condition:
+            pending = len(self._due) + len(self._active)
+        return {'source_dir': self.source_dir, 'output_dir': self.output_dir, 'backend': self.backend,
+                'converted': self.converted, 'skipped': self.skipped, 'failed': self.failed, 'pending': pending}
+
+    def _start_thread(self, target, name):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    # ------------------------------------------------------------ 发现变化
+
+    def _is_candidate(self, path):
+        if not path.lower().endswith(MARKDOWN_EXTENSIONS):
+            return False
+        path = os.path.abspath(path)
+        if not path.startswith(self.source_dir + os.sep):
+            return False
+        # 输出目录是监视目录的子目录时忽略其中的文件；与监视目录相同时只忽略本监视写出的文件，
+        # 两种情况下导出的 .md 都不会再次触发转换
+        if self.output_dir != self.source_dir and path.startswith(self.output_dir + os.sep):
+            return False
+        if self.manifest.is_output(path):
+            return False
+        # 忽略 .git 等隐藏目录中的文件
+        return not any(part.startswith('.') for part in os.path.relpath(path, self.source_dir).split(os.sep)[:-1])
+
+    def _walk(self, directory):
+        for root, dirs, files in os.walk(directory):
+            # 跳过 .git 等隐藏目录与输出目录
+            dirs[:] = [name for name in dirs
+                       if not name.startswith('.') and os.path.join(root, name) != self.output_dir]
+            for name in files:
+                path = os.path.join(root, name)
+                if self._is_candidate(path):
+                    yield path
+
+    def _snapshot(self):
+        """返回 {路径: (修改时间, 大小)}，用于首次扫描与轮询比较"""
+        snapshot = {}
+        for path in self._walk(self.source_dir):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _start_watchdog(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logging.info("未安装 watchdog，改用轮询方式监视文件夹。")
+            return False
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type in ('opened', 'closed_no_write'):
+                    return
+                paths = [event.src_path, getattr(event, 'dest_path', '')]
+                for path in filter(None, paths):
+                    if event.is_directory:
+                        # 整个目录被移入或创建时扫描其中的文件
+                        if event.event_type in ('created', 'moved') and os.path.isdir(path):
+                            for child in watcher._walk(path):
+                                watcher.schedule(child)
+                    elif watcher._is_candidate(path):
+                        watcher.schedule(path)
+
+        try:
+            observer = Observer()
+            observer.schedule(_Handler(), self.source_dir, recursive=True)
+            observer.start()
+        except Exception as e:
+            logging.warning("watchdog 启动失败，改用轮询方式监视文件夹: %s", e)
+            return False
+        self._observer = observer
+        self.backend = f'watchdog/{type(observer).__name__}'
+        return True
+
+    def _poll_loop(self, snapshot):
+        while not self._stopped.wait(self.poll_interval):
+            try:
+                current = self._snapshot()
+            except OSError as e:
+                logging.warning("轮询监视目录失败: %s", e)
+                continue
+            for path, signature in current.items():
+                if snapshot.get(path) != signature:
+                    self.schedule(path)
+            for path in snapshot.keys() - current.keys():
+                self.schedule(path)
+            snapshot = current
+
+    # ------------------------------------------------------------ 防抖与转换
+
+    def schedule(self, path):
+        """登记一次变化；debounce 秒内没有新的变化时才开始转换"""
+        if self._stopped.is_set():
+            return
+        with self._condition:
+            self._due[os.path.abspath(path)] = time.monotonic() + self.debounce
+            self._condition.notify_all()
+
+    def _debounce_loop(self):
+        with self._condition:
+            while not self._stopped.is_set():
+                now = time.monotonic()
+                ready = [path for path, due in self._due.items() if due <= now]
+                for path in ready:
+                    del self._due[path]
+                    self._submit_locked(path)
+                timeout = min(self._due.values()) - now if self._due else None
+                self._condition.wait(timeout)
+
+    def _submit(self, path):
+        with self._condition:
+            self._submit_locked(path)
+
+    def _submit_locked(self, path):
+        if path in self._active:
+            self._changed_while_active.add(path)
+            return
+        self._active.add(path)
+        try:
+            self._executor.submit(self._process, path)
+        except RuntimeError:
+            # 线程池已关闭（监视正在停止）
+            self._active.discard(path)
+
+    def _count(self, name):
+        with self._condition:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _process(self, path):
+        rel_path = os.path.relpath(path, self.source_dir)
+        try:
+            # 输出文件可能在转换完成、记入清单之前就已被发现
+            if self._stopped.is_set() or self.manifest.is_output(path):
+                return
+            if not os.path.isfile(path):
+                # 源文件被删除或移走：只从清单中移除，已导出的文件保留
+                self.manifest.forget(rel_path)
+                self.manifest.save()
+                return
+            digest = file_digest(path)
+            if self.manifest.is_current(rel_path, digest):
+                self._count('skipped')
+                return
+            output_stem = os.path.join(self.output_dir, os.path.splitext(rel_path)[0])
+            start = time.perf_counter()
+            try:
+                outputs = self.convert(path, output_stem)
+            except Exception as e:
+                self._count('failed')
+                logging.error("自动转换失败 %s: %s", path, e)
+                if self.on_result:
+                    self.on_result(path, [], str(e))
+                return
+            self.manifest.record(rel_path, digest, outputs)
+            self.manifest.save()
+            self._count('converted')
+            logging.info("已自动转换 %s，耗时 %.2fs", path, time.perf_counter() - start)
+            if self.on_result:
+                self.on_result(path, outputs, None)
+        except Exception as e:
+            logging.error("处理监视事件失败 %s: %s", path, e, exc_info=True)
+        finally:
+            with self._condition:
+                self._active.discard(path)
+                if path in self._changed_while_active:
+                    self._changed_while_active.discard(path)
+                    if not self._stopped.is_set():
+                        self._due[path] = time.monotonic() + self.debounce
+                        self._condition.notify_all()
@@ -0,0 +1,129 @@
+# benchmarks/bench_chunked.py
+"""
+大文档分块并行转换的基准：比较整篇转换与不同并行进程数下分块转换的总耗时，
+并核对两种方式输出的段落样式与文字完全一致。
+
+    python benchmarks/bench_chunked.py                          # 默认 2MB 混合语料，进程数 2、4 …… 直到 CPU 核心数
+    python benchmarks/bench_chunked.py --size 8MB --workers 2 4 8
+    python benchmarks/bench_chunked.py --input manual.md -o results.json
+
+注意：加速比受 CPU 核心数限制，进程数超过核心数时不会再变快。
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.chunked_docx import convert_docx_chunked, split_markdown  # noqa: E402
+from app.converter import PRESET_STYLES, _preprocess_markdown, create_reference_docx  # noqa: E402
+from app.pandoc_engine import MARKDOWN_FORMAT, convert_with_subprocess  # noqa: E402
+from corpus import CORPUS_KINDS, format_size, generate_corpus, parse_size  # noqa: E402
+
+_PARAGRAPH_RE = re.compile(r'<w:p>.*?</w:p>|<w:p .*?</w:p>', re.DOTALL)
+_STYLE_RE = re.compile(r'<w:pStyle w:val="([^"]*)"')
+_TEXT_RE = re.compile(r'<w:t(?: [^>]*)?>([^<]*)</w:t>')
+
+
+def _default_workers():
+    cpus = os.cpu_count() or 1
+    workers = [2]
+    while workers[-1] * 2 <= cpus:
+        workers.append(workers[-1] * 2)
+    if workers[-1] < cpus:
+        workers.append(cpus)
+    return workers
+
+
+def _outline(docx_path):
+    """按段落提取 (样式, 文字)，用于核对两种转换方式的内容是否一致"""
+    with zipfile.ZipFile(docx_path) as archive:
+        document = archive.read('word/document.xml').decode('utf-8')
+    outline = []
+    for paragraph in _PARAGRAPH_RE.findall(document):
+        style = _STYLE_RE.search(paragraph)
+        outline.append((style.group(1) if style else '', ''.join(_TEXT_RE.findall(paragraph))))
+    return outline
+
+
+def _time_once(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run(text, workers_list, repeat, extra_args):
+    temp_dir = tempfile.mkdtemp(prefix='md_bench_chunked_')
+    single_path = os.path.join(temp_dir, 'single.docx')
+    single = min(_time_once(lambda: convert_with_subprocess(text, 'docx', format=MARKDOWN_FORMAT,
+                                                            outputfile=single_path, extra_args=extra_args))
+                 for _ in range(repeat))
+    expected = _outline(single_path)
+    print(f"{'方式':<16} {'块数':>6} {'耗时 (s)':>10} {'加速比':>8}  内容一致")
+    print(f"{'整篇转换':<16} {1:>6} {single:>10.2f} {1.0:>8.2f}  -")
+    results = {'single_s': single, 'chunked': []}
+    for workers in workers_list:
+        chunks = split_markdown(text, workers)
+        if chunks is None:
+            print("语料无法分块（没有可用的顶层标题或包含无法分块的结构）。")
+            break
+        chunked_path = os.path.join(temp_dir, f'chunked_{workers}.docx')
+        best = min(_time_once(lambda: convert_docx_chunked(text, chunked_path, format=MARKDOWN_FORMAT,
+                                                           extra_args=extra_args, workers=workers))
+                   for _ in range(repeat))
+        identical = _outline(chunked_path) == expected
+        label = f"分块 {workers} 进程"
+        print(f"{label:<16} {len(chunks):>6} {best:>10.2f} {single / best:>8.2f}  {'是' if identical else '否'}")
+        results['chunked'].append({'workers': workers, 'chunks': len(chunks), 'best_s': best,
+                                   'speedup': single / best, 'identical': identical})
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kind', default='mixed', choices=CORPUS_KINDS, help="语料类型（默认 mixed）")
+    parser.add_argument('--size', default='2MB', help="语料大小（默认 2MB）")
+    parser.add_argument('--input', help="改用该 Markdown 文件作为语料")
+    parser.add_argument('--workers', nargs='+', type=int, default=_default_workers(),
+                        help="要测量的并行进程数列表（默认 2、4 …… 直到 CPU 核心数）")
+    parser.add_argument('--repeat', type=int, default=1, help="每种方式重复次数，取最快一次")
+    parser.add_argument('-o', '--output', help="把结果写入 JSON 文件")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            text = _preprocess_markdown(f.read())
+        source = args.input
+    else:
+        text = generate_corpus(args.kind, parse_size(args.size))
+        source = f"{args.kind} {args.size}"
+    reference_doc = create_reference_docx(PRESET_STYLES['general'])
+    extra_args = ['--mathjax'] + ([f'--reference-doc={reference_doc}'] if reference_doc else [])
+    print(f"语料: {source}（{format_size(len(text.encode('utf-8')))}），CPU 核心数 {os.cpu_count()}\n")
+    try:
+        results = run(text, args.workers, max(1, args.repeat), extra_args)
+    finally:
+        if reference_doc:
+            os.remove(reference_doc)
+    if args.output:
+        report = {'source': source, 'bytes': len(text.encode('utf-8')), 'cpu_count': os.cpu_count(),
+                  'platform': platform.platform(), 'python': platform.python_version(), **results}
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n结果已写入 {args.output}")
+    return 0 if all(item['identical'] for item in results['chunked']) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# benchmarks/bench_native.py
+"""
+内置 docx 引擎的基准：按语料类型比较 pandoc 与内置引擎导出 docx 的耗时，
+并核对两者输出的段落样式、列表层级、对齐方式与文字是否一致。
+包含公式等不支持语法的语料会显示为“回退”，此时实际导出会自动改用 pandoc。
+
+    python benchmarks/bench_native.py                            # 默认各类语料 64KB
+    python benchmarks/bench_native.py --size 4KB 1MB --repeat 3
+    python benchmarks/bench_native.py --input manual.md -o results.json
+
+需要安装 markdown-it-py。
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.converter import PRESET_STYLES, _preprocess_markdown, create_reference_docx  # noqa: E402
+from app.native_docx import UnsupportedMarkdown, native_engine_available, write_native_docx  # noqa: E402
+from app.pandoc_engine import MARKDOWN_FORMAT, convert_with_subprocess  # noqa: E402
+from corpus import CORPUS_KINDS, format_size, generate_corpus, parse_size  # noqa: E402
+
+_PARAGRAPH_RE = re.compile(r'<w:p>.*?</w:p>|<w:p .*?</w:p>|<w:p />', re.DOTALL)
+_STYLE_RE = re.compile(r'<w:pStyle w:val="([^"]*)"')
+_LEVEL_RE = re.compile(r'<w:ilvl w:val="(\d+)"')
+_JC_RE = re.compile(r'<w:jc w:val="([^"]*)"')
+_TEXT_RE = re.compile(r'<w:t(?: [^>]*)?>([^<]*)</w:t>|<w:br />')
+_DEFAULT_KINDS = ('prose', 'list', 'table', 'cjk', 'mixed')
+
+
+def _outline(docx_path):
+    """按段落提取 (样式, 列表层级, 对齐, 文字)，用于核对两种引擎的输出是否一致"""
+    with zipfile.ZipFile(docx_path) as archive:
+        document = archive.read('word/document.xml').decode('utf-8')
+    outline = []
+    for paragraph in _PARAGRAPH_RE.findall(document):
+        style = _STYLE_RE.search(paragraph)
+        level = _LEVEL_RE.search(paragraph)
+        jc = _JC_RE.search(paragraph)
+        text = ''.join(match.group(1) if match.group(1) is not None else '\n'
+                       for match in _TEXT_RE.finditer(paragraph))
+        outline.append((style.group(1) if style else '', level.group(1) if level else '',
+                        jc.group(1) if jc else '', text))
+    return outline
+
+
+def _best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run(samples, repeat, reference_doc):
+    temp_dir = tempfile.mkdtemp(prefix='md_bench_native_')
+    pandoc_path = os.path.join(temp_dir, 'pandoc.docx')
+    native_path = os.path.join(temp_dir, 'native.docx')
+    extra_args = ['--mathjax', f'--reference-doc={reference_doc}']
+    print(f"{'语料':<20} {'大小':>10} {'pandoc (s)':>11} {'内置 (s)':>10} {'加速比':>8}  内容一致")
+    results = []
+    try:
+        for label, text in samples:
+            size = len(text.encode('utf-8'))
+            pandoc_s = _best_time(lambda: convert_with_subprocess(text, 'docx', format=MARKDOWN_FORMAT,
+                                                                  outputfile=pandoc_path, extra_args=extra_args),
+                                  repeat)
+            try:
+                native_s = _best_time(lambda: write_native_docx(text, native_path, reference_doc), repeat)
+            except UnsupportedMarkdown as e:
+                print(f"{label:<20} {format_size(size):>10} {pandoc_s:>11.3f} {'-':>10} {'-':>8}  回退（{e}）")
+                results.append({'corpus': label, 'bytes': size, 'pandoc_s': pandoc_s, 'fallback': str(e)})
+                continue
+            identical = _outline(native_path) == _outline(pandoc_path)
+            print(f"{label:<20} {format_size(size):>10} {pandoc_s:>11.3f} {native_s:>10.3f} "
+                  f"{pandoc_s / native_s:>8.2f}  {'是' if identical else '否'}")
+            results.append({'corpus': label, 'bytes': size, 'pandoc_s': pandoc_s, 'native_s': native_s,
+                            'speedup': pandoc_s / native_s, 'identical': identical})
+    finally:
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kinds', nargs='+', default=list(_DEFAULT_KINDS), choices=CORPUS_KINDS,
+                        help="要测量的语料类型（默认 prose list table cjk mixed）")
+    parser.add_argument('--size', nargs='+', default=['64KB'], help="语料大小，可给出多个（默认 64KB）")
+    parser.add_argument('--input', help="改用该 Markdown 文件作为语料")
+    parser.add_argument('--repeat', type=int, default=1, help="每种方式重复次数，取最快一次")
+    parser.add_argument('-o', '--output', help="把结果写入 JSON 文件")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if not native_engine_available():
+        print("内置引擎不可用，请先安装 markdown-it-py。", file=sys.stderr)
+        return 2
+    if args.input:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            samples = [(os.path.basename(args.input), _preprocess_markdown(f.read()))]
+    else:
+        # 与应用导出时一样先经过预处理
+        samples = [(f"{kind} {size}", _preprocess_markdown(generate_corpus(kind, parse_size(size))))
+                   for size in args.size for kind in args.kinds]
+    reference_doc = create_reference_docx(PRESET_STYLES['general'])
+    if not reference_doc:
+        print("样式文件生成失败，内置引擎需要样式文件作为模板。", file=sys.stderr)
+        return 2
+    print(f"CPU 核心数 {os.cpu_count()}\n")
+    try:
+        results = run(samples, max(1, args.repeat), reference_doc)
+    finally:
+        os.remove(reference_doc)
+    if args.output:
+        report = {'cpu_count': os.cpu_count(), 'platform': platform.platform(),
+                  'python': platform.python_version(), 'results': results}
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n结果已写入 {args.output}")
+    return 0 if all(item.get('identical', True) for item in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# benchmarks/bench_office_pool.py
+"""
+Office 实例池的基准：用 FakeOfficeBackend 模拟启动与操作耗时，
+比较"每次复制都启动并关闭实例"（旧行为）与常驻实例池的总耗时。
+
+    python benchmarks/bench_office_pool.py
+    python benchmarks/bench_office_pool.py --copies 50 --launch-delay 1.5 --fail-every 7
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.office_automation import FakeOfficeBackend, OfficeInstancePool  # noqa: E402
+
+
+def _copy_once(pool):
+    backend = pool.backend
+
+    def _copy(instance):
+        doc = backend.new_document(instance)
+        try:
+            backend.insert_file(doc, 'fake.docx')
+            backend.copy_document(doc)
+        finally:
+            backend.close_document(doc)
+
+    pool.run('word', _copy)
+
+
+def run_scenario(name, max_operations, args):
+    backend = FakeOfficeBackend(launch_delay=args.launch_delay, operation_delay=args.operation_delay,
+                                fail_every=args.fail_every)
+    pool = OfficeInstancePool(backend, size=1, max_operations=max_operations)
+    failures = 0
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(args.copies):
+        t = time.perf_counter()
+        try:
+            _copy_once(pool)
+        except RuntimeError:
+            failures += 1
+        latencies.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+    pool.shutdown()
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    print(f"{name:<12} 总耗时 {total:7.2f}s  中位数 {p50 * 1000:8.1f} ms  最慢 {latencies[-1] * 1000:8.1f} ms  "
+          f"启动 {backend.launches:>3} 次  失败 {failures}")
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Office 实例池基准（模拟后端）")
+    parser.add_argument('--copies', type=int, default=20, help="连续复制次数")
+    parser.add_argument('--launch-delay', type=float, default=0.5, help="模拟启动 Office 的耗时（秒）")
+    parser.add_argument('--operation-delay', type=float, default=0.02, help="模拟插入文件的耗时（秒）")
+    parser.add_argument('--fail-every', type=int, default=0, help="每 N 次操作注入一次 COM 错误")
+    parser.add_argument('--max-operations', type=int, default=50, help="实例池中单个实例的最大操作次数")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    cold = run_scenario('每次启动', 1, args)
+    warm = run_scenario('实例池', args.max_operations, args)
+    print(f"加速比: {cold / warm:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+# benchmarks/bench_pipeline.py
+"""
+转换流水线各阶段的性能基准与回归检测。
+
+    python benchmarks/bench_pipeline.py                              # 默认语料与大小，结果打印到终端
+    python benchmarks/bench_pipeline.py -o results.json              # 同时写入 JSON
+    python benchmarks/bench_pipeline.py --kinds prose cjk --sizes 1KB 50MB --skip-pandoc
+    python benchmarks/bench_pipeline.py --compare baseline.json      # 与基线比较，任一阶段退化超过阈值则返回 1
+    python benchmarks/bench_pipeline.py --compare baseline.json --input results.json   # 只比较两份已有结果
+
+分别计时的阶段：process_text、_preprocess_markdown、create_reference_docx、
+pandoc 转换（Markdown → docx）与 get_filename_from_content。
+每个阶段重复 --repeat 次，记录最快一次与平均值；比较时使用最快一次，以减少噪声。
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.converter import PRESET_STYLES, _preprocess_markdown, create_reference_docx, process_text  # noqa: E402
+from app.pandoc_engine import MARKDOWN_FORMAT, PandocWorkerPool  # noqa: E402
+from app.utils import get_filename_from_content  # noqa: E402
+from corpus import CORPUS_KINDS, format_size, generate_corpus, parse_size  # noqa: E402
+
+RESULT_FORMAT_VERSION = 1
+DEFAULT_SIZES = ['1KB', '100KB', '1MB', '10MB', '50MB']
+# pandoc 处理大文档需要数分钟，超过该大小时默认跳过该阶段
+DEFAULT_PANDOC_MAX_SIZE = '1MB'
+# 比较时忽略绝对差值低于该值（秒）的变化，避免微秒级阶段因噪声误报
+DEFAULT_NOISE_FLOOR = 0.002
+
+
+def _time_call(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {'best_s': min(timings), 'mean_s': sum(timings) / len(timings), 'runs': len(timings)}
+
+
+def _with_throughput(result, size_bytes):
+    if result['best_s'] > 0:
+        result['mb_per_s'] = size_bytes / 1024 / 1024 / result['best_s']
+    return result
+
+
+def _bench_reference_docx(repeat):
+    def _create():
+        path = create_reference_docx(PRESET_STYLES['general'])
+        if not path:
+            raise RuntimeError("create_reference_docx 失败")
+        os.remove(path)
+    return _time_call(_create, repeat)
+
+
+def _bench_pandoc(pool, text, reference_doc, repeat):
+    fd, output_path = tempfile.mkstemp(suffix='.docx', prefix='md_bench_')
+    os.close(fd)
+    try:
+        extra_args = ['--mathjax', f'--reference-doc={reference_doc}']
+        return _time_call(lambda: pool.convert_text(source=text, to='docx', format=MARKDOWN_FORMAT,
+                                                    outputfile=output_path, extra_args=extra_args), repeat)
+    finally:
+        os.remove(output_path)
+
+
+def run_benchmarks(kinds, sizes, repeat, pandoc_max_size, skip_pandoc):
+    results = {}
+    print(f"{'语料':<16} {'阶段':<26} {'最快 (ms)':>12} {'平均 (ms)':>12} {'MB/s':>10}")
+
+    def _report(name, stage, result):
+        throughput = f"{result['mb_per_s']:10.1f}" if 'mb_per_s' in result else f"{'-':>10}"
+        print(f"{name:<16} {stage:<26} {result['best_s'] * 1000:12.2f} {result['mean_s'] * 1000:12.2f} {throughput}")
+
+    # 样式文件与语料无关，只测一次
+    reference_result = _bench_reference_docx(repeat)
+    results['reference'] = {'create_reference_docx': reference_result}
+    _report('reference', 'create_reference_docx', reference_result)
+
+    pool = None
+    reference_doc = None
+    if not skip_pandoc:
+        pool = PandocWorkerPool(size=1)
+        pool.warm_up()
+        reference_doc = create_reference_docx(PRESET_STYLES['general'])
+    try:
+        for kind in kinds:
+            for size in sizes:
+                name = f"{kind}/{format_size(size)}"
+                text = generate_corpus(kind, size)
+                size_bytes = len(text.encode('utf-8'))
+                stages = {
+                    'process_text': lambda: process_text(text, {'remove_separators': True}),
+                    '_preprocess_markdown': lambda: _preprocess_markdown(text),
+                    'get_filename_from_content': lambda: get_filename_from_content(text),
+                }
+                entry = {'bytes': size_bytes}
+                for stage, func in stages.items():
+                    entry[stage] = _with_throughput(_time_call(func, repeat), size_bytes)
+                    _report(name, stage, entry[stage])
+                if pool is not None and size <= pandoc_max_size:
+                    processed = _preprocess_markdown(text)
+                    entry['pandoc_docx'] = _with_throughput(_bench_pandoc(pool, processed, reference_doc, repeat),
+                                                            size_bytes)
+                    _report(name, 'pandoc_docx', entry['pandoc_docx'])
+                results[name] = entry
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if reference_doc and os.path.exists(reference_doc):
+            os.remove(reference_doc)
+    return results
+
+
+def _pandoc_version():
+    try:
+        import pypandoc
+        return pypandoc.get_pandoc_version()
+    except Exception:
+        return None
+
+
+def build_report(results, args):
+    return {
+        'format_version': RESULT_FORMAT_VERSION,
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'pandoc': _pandoc_version(),
+        },
+        'parameters': {'repeat': args.repeat},
+        'results': results,
+    }
+
+
+def compare_reports(current, baseline, threshold, noise_floor):
+    """
+    逐阶段比较最快耗时。返回退化列表 [(语料, 阶段, 基线秒数, 当前秒数, 比值)]；
+    只在两份结果中都存在的阶段参与比较。
+    """
+    regressions = []
+    print(f"\n与基线比较（阈值 +{threshold * 100:.0f}%）:")
+    print(f"{'语料':<16} {'阶段':<26} {'基线 (ms)':>12} {'当前 (ms)':>12} {'变化':>9}")
+    for name, stages in current['results'].items():
+        baseline_stages = baseline['results'].get(name)
+        if not baseline_stages:
+            continue
+        for stage, result in stages.items():
+            base = baseline_stages.get(stage)
+            if not isinstance(result, dict) or not isinstance(base, dict):
+                continue
+            old, new = base['best_s'], result['best_s']
+            ratio = new / old if old > 0 else float('inf')
+            regressed = ratio > 1 + threshold and new - old > noise_floor
+            marker = '  <-- 退化' if regressed else ''
+            print(f"{name:<16} {stage:<26} {old * 1000:12.2f} {new * 1000:12.2f} {(ratio - 1) * 100:+8.1f}%{marker}")
+            if regressed:
+                regressions.append((name, stage, old, new, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="转换流水线分阶段性能基准与回归检测")
+    parser.add_argument('--kinds', nargs='+', choices=sorted(CORPUS_KINDS),
+                        default=['prose', 'table', 'math', 'list', 'cjk'], help="语料种类")
+    parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="语料大小，例如 1KB 10MB")
+    parser.add_argument('--repeat', type=int, default=3, help="每个阶段的重复次数")
+    parser.add_argument('--pandoc-max-size', default=DEFAULT_PANDOC_MAX_SIZE,
+                        help="超过该大小的语料跳过 pandoc 阶段")
+    parser.add_argument('--skip-pandoc', action='store_true', help="完全跳过 pandoc 阶段")
+    parser.add_argument('-o', '--output', help="把结果写入 JSON 文件")
+    parser.add_argument('--compare', metavar='BASELINE', help="与基线 JSON 比较，出现退化时返回 1")
+    parser.add_argument('--input', help="配合 --compare 使用：不重新测量，直接比较该 JSON 结果")
+    parser.add_argument('--threshold', type=float, default=0.10, help="允许的退化比例，默认 0.10 即 10%%")
+    parser.add_argument('--noise-floor', type=float, default=DEFAULT_NOISE_FLOOR,
+                        help="忽略绝对差值小于该秒数的变化")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.input:
+        if not args.compare:
+            parser.error("--input 需要与 --compare 一起使用")
+        with open(args.input, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    else:
+        sizes = [parse_size(s) for s in args.sizes]
+        results = run_benchmarks(args.kinds, sizes, args.repeat, parse_size(args.pandoc_max_size), args.skip_pandoc)
+        report = build_report(results, args)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"\n结果已写入 {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, args.threshold, args.noise_floor)
+        if regressions:
+            print(f"\n检测到 {len(regressions)} 个阶段性能退化超过 {args.threshold * 100:.0f}%。")
+            return 1
+        print("\n未检测到性能退化。")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,156 @@
+# benchmarks/bench_preprocess.py
+"""
+_preprocess_markdown 的回归校验与吞吐量基准。
+
+    python benchmarks/bench_preprocess.py                 # 校验 + 1MB/10MB/100MB 吞吐量
+    python benchmarks/bench_preprocess.py --sizes 1 10    # 只测 1MB 与 10MB
+    python benchmarks/bench_preprocess.py --check-only    # 只做逐字节一致性校验
+
+校验部分把新的流式实现与重写前的实现（原样保留在本文件中）在回归语料上逐字节比较，
+任何差异都会导致非零退出码。
+"""
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.converter import _preprocess_markdown, iter_preprocess_markdown  # noqa: E402
+from corpus import generate_document  # noqa: E402
+
+
+def legacy_preprocess_markdown(text):
+    """重写前的实现，作为逐字节比较的基准，请勿修改"""
+    text = text.replace('\\\\', '\\')
+    text = text.replace('\\<br\\>', '  ').replace('<br>', '  ')
+    text = text.replace('\u00A0', ' ').replace('\u3000', ' ')
+
+    lines = text.split('\n')
+    processed_lines = []
+    for i, current_line in enumerate(lines):
+        processed_lines.append(current_line)
+        if i < len(lines) - 1:
+            next_line = lines[i + 1]
+            current_line_stripped = current_line.strip()
+            next_line_stripped = next_line.strip()
+            if not current_line_stripped or not next_line_stripped:
+                continue
+
+            is_normal_text_line = (not current_line_stripped.startswith(('* ', '- ', '+ ', '>', '#', '|')) and
+                                   not re.match(r'^\d+\.\s', current_line_stripped))
+            is_next_line_block_start = (next_line_stripped.startswith(('* ', '- ', '+ ', '|', '>')) or
+                                        re.match(r'^\d+\.\s', next_line_stripped))
+            is_current_line_list_item = (current_line_stripped.startswith(('* ', '- ', '+ ')) or
+                                         re.match(r'^\d+\.\s', current_line_stripped))
+            is_next_line_table_start = next_line_stripped.startswith('|')
+
+            if (is_normal_text_line and is_next_line_block_start) or \
+                    (is_current_line_list_item and is_next_line_table_start):
+                if re.match(r'^[\s|: -]+$', current_line_stripped) and '|' in current_line_stripped:
+                    continue
+                logging.info(f"自动修正：在第 {i + 1} 行后插入了一个空行以确保块级元素格式正确。")
+                processed_lines.append('')
+
+    return '\n'.join(processed_lines)
+
+
+# 回归语料：覆盖各类边界情况的手写样例
+REGRESSION_CASES = [
+    "",
+    "\n",
+    "\n\n\n",
+    "单行文本",
+    "结尾有换行\n",
+    "段落\n- 列表",
+    "段落\n* 列表\n+ 列表",
+    "段落\n1. 有序\n2. 有序",
+    "段落\n١. 阿拉伯数字",
+    "段落\n10.\t制表符",
+    "段落\n> 引用",
+    "段落\n| a | b |\n|---|---|\n| 1 | 2 |",
+    "- 列表\n| a | b |",
+    "1. 有序\n|表格",
+    ":--|--\n- 列表",
+    " | :-- | \n| x |",
+    "# 标题\n- 列表",
+    "#标题\n段落",
+    "段落\n-不是列表\n*不是列表",
+    "  缩进段落  \n   - 缩进列表",
+    "段落\r\n- 列表\r\n",
+    "公式 $\\\\alpha$ 与 \\\\\\\\ 三个反斜杠 \\\\\\",
+    "换行<br>测试\\<br\\>测试\\\\<br\\\\>测试<br><br>",
+    "不间断\u00A0空格\u3000全角\n\u00A0- 列表",
+    "\u3000\n- 列表",
+    "|---|\n段落\n|---|",
+    "- a\n- b\n| t |\n文本\n> q\n1. x\n| y |",
+]
+
+_FUZZ_TOKENS = [
+    "文本", "text", "- ", "* ", "+ ", "-", "*", "1. ", "23.", "4.\t", "> ", ">", "# ", "#", "| ", "|", ":", "---",
+    " ", "  ", "\t", "\u00A0", "\u3000", "\\", "\\\\", "<br>", "\\<br\\>", "$x$", "\r", "١. ",
+]
+
+
+def fuzz_cases(count=3000, seed=20240601):
+    rng = random.Random(seed)
+    for _ in range(count):
+        lines = []
+        for _ in range(rng.randint(1, 8)):
+            lines.append(''.join(rng.choice(_FUZZ_TOKENS) for _ in range(rng.randint(0, 5))))
+        yield '\n'.join(lines)
+
+
+def check_equivalence():
+    cases = list(REGRESSION_CASES) + list(fuzz_cases()) + [generate_document(256 * 1024, seed=s) for s in range(4)]
+    for index, case in enumerate(cases):
+        expected = legacy_preprocess_markdown(case)
+        # 同时校验整篇调用与逐行流式调用两条路径
+        for actual in (_preprocess_markdown(case), '\n'.join(iter_preprocess_markdown(case.split('\n')))):
+            if expected.encode('utf-8') != actual.encode('utf-8'):
+                print(f"输出不一致（样例 #{index}）:\n输入:    {case!r}\n期望:    {expected!r}\n实际:    {actual!r}")
+                return False
+    print(f"逐字节一致性校验通过：共 {len(cases)} 个样例。")
+    return True
+
+
+def _measure(func, text, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes_mb, repeat):
+    print(f"{'大小':>8} {'旧实现 (MB/s)':>16} {'新实现 (MB/s)':>16} {'加速比':>8}")
+    for size_mb in sizes_mb:
+        text = generate_document(size_mb * 1024 * 1024, seed=size_mb)
+        actual_mb = len(text.encode('utf-8')) / 1024 / 1024
+        legacy = _measure(legacy_preprocess_markdown, text, repeat)
+        current = _measure(_preprocess_markdown, text, repeat)
+        print(f"{size_mb:>6}MB {actual_mb / legacy:>16.1f} {actual_mb / current:>16.1f} {legacy / current:>7.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="_preprocess_markdown 回归校验与吞吐量基准")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100], help="测试文本大小（MB）")
+    parser.add_argument('--repeat', type=int, default=3, help="每个大小重复次数，取最快一次")
+    parser.add_argument('--check-only', action='store_true', help="只做一致性校验")
+    args = parser.parse_args(argv)
+
+    # 与应用默认的 INFO 级别保持一致会让旧实现的逐行日志主导耗时，这里只保留警告
+    logging.basicConfig(level=logging.WARNING)
+    if not check_equivalence():
+        return 1
+    if not args.check_only:
+        run_benchmark(args.sizes, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# benchmarks/bench_rich_copy.py
+"""
+直接写入富文本的复制方式的基准：按语料类型分别测量 pandoc 生成 HTML 片段、写入内联样式、
+封装为 CF_HTML 三个阶段的耗时，并核对按描述头偏移取回的片段与原片段一致。
+不访问剪贴板，也不需要 Word/WPS，可以在任何平台上运行。
+含公式（或图片）的语料会显示“需 Office”，实际复制时这类文档仍经过 Office。
+
+    python benchmarks/bench_rich_copy.py                        # 默认各类语料 64KB
+    python benchmarks/bench_rich_copy.py --size 4KB 1MB --repeat 3
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.converter import PRESET_STYLES, _preprocess_markdown  # noqa: E402
+from app.pandoc_engine import convert_with_subprocess  # noqa: E402
+from app.rich_copy import apply_inline_styles, build_cf_html, extract_cf_html_fragment, needs_office  # noqa: E402
+from corpus import CORPUS_KINDS, format_size, generate_corpus, parse_size  # noqa: E402
+
+_DEFAULT_KINDS = ('prose', 'list', 'table', 'cjk', 'mixed')
+
+
+def _best_time(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(samples, repeat, styles):
+    print(f"{'语料':<20} {'大小':>10} {'HTML (ms)':>10} {'样式 (ms)':>10} {'CF_HTML (ms)':>13} {'输出':>10}  校验")
+    results = []
+    for label, text in samples:
+        size = len(text.encode('utf-8'))
+        render_s, fragment = _best_time(
+            lambda: convert_with_subprocess(text, 'html', extra_args=['--mathjax']).decode('utf-8'), repeat)
+        style_s, styled = _best_time(lambda: apply_inline_styles(fragment, styles), repeat)
+        build_s, payload = _best_time(lambda: build_cf_html(styled), repeat)
+        valid = extract_cf_html_fragment(payload) == styled
+        note = '需 Office' if needs_office(fragment) else ''
+        print(f"{label:<20} {format_size(size):>10} {render_s * 1000:>10.1f} {style_s * 1000:>10.1f} "
+              f"{build_s * 1000:>13.2f} {format_size(len(payload)):>10}  {'一致' if valid else '不一致'} {note}")
+        results.append({'corpus': label, 'bytes': size, 'render_s': render_s, 'style_s': style_s,
+                        'cf_html_s': build_s, 'payload_bytes': len(payload), 'valid': valid,
+                        'needs_office': bool(note)})
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kinds', nargs='+', default=list(_DEFAULT_KINDS), choices=CORPUS_KINDS,
+                        help="要测量的语料类型（默认 prose list table cjk mixed）")
+    parser.add_argument('--size', nargs='+', default=['64KB'], help="语料大小，可给出多个（默认 64KB）")
+    parser.add_argument('--preset', default='general', choices=sorted(PRESET_STYLES), help="使用的预设样式")
+    parser.add_argument('--repeat', type=int, default=1, help="每个阶段重复次数，取最快一次")
+    parser.add_argument('-o', '--output', help="把结果写入 JSON 文件")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    samples = [(f"{kind} {size}", _preprocess_markdown(generate_corpus(kind, parse_size(size))))
+               for size in args.size for kind in args.kinds]
+    print(f"CPU 核心数 {os.cpu_count()}\n")
+    results = run(samples, max(1, args.repeat), PRESET_STYLES[args.preset])
+    if args.output:
+        report = {'cpu_count': os.cpu_count(), 'platform': platform.platform(),
+                  'python': platform.python_version(), 'results': results}
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n结果已写入 {args.output}")
+    return 0 if all(item['valid'] for item in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,35 @@ import platform
 import ctypes
 
 
+# 无界面模式支持的子命令
+CLI_COMMANDS = ('convert', 'watch', 'serve')
+
+
+def configure_bundled_pandoc():
+    """PyInstaller 打包相关设置"""
+    if getattr(sys, 'frozen', False):
+        logging.info("在打包模式下运行。")
+        # 当使用PyInstaller打包时，sys._MEIPASS包含打包后的临时目录路径
+        try:
+            bundle_dir = sys._MEIPASS  # PyInstaller创建的临时目录
+            pandoc_path_in_bundle = os.path.join(bundle_dir, 'pandoc', 'pandoc.exe')
+            if os.path.exists(pandoc_path_in_bundle):
+                # 将打包的 pandoc 路径添加到环境变量，pypandoc 会自动使用它
+                os.environ['PYPANDOC_PANDOC'] = pandoc_path_in_bundle
+                logging.info("Pandoc in bundle found and configured at: %s", pandoc_path_in_bundle)
+            else:
+                logging.error("在打包目录中未找到 pandoc.exe: %s", pandoc_path_in_bundle)
+        except AttributeError:
+            logging.error("无法访问 sys._MEIPASS，这可能意味着程序不是通过PyInstaller打包运行的")
+
+
+def run_cli(argv):
+    """命令行模式：不切换工作目录，也不导入任何 GUI 相关模块"""
+    from app.cli import main as cli_main
+    configure_bundled_pandoc()
+    return cli_main(argv)
+
+
 def main():
     # --- 关键修复：确保程序能找到外部资源（如图片）---
     # 这一步在新结构中至关重要，它能让相对路径正确工作
@@ -13,6 +42,9 @@ def main():
     os.chdir(script_dir)
 
     # 导入我们自己的模块。必须在 chdir 之后进行，以确保模块能被找到。
+    # 最先启用导入耗时统计，窗口显示后会在日志中输出摘要
+    from app.startup_timing import install_import_timer
+    install_import_timer()
     from app.utils import get_app_data_dir, handle_exception
     from app.gui_manager import create_and_run_gui
 
@@ -20,34 +52,14 @@ def main():
     sys.excepthook = handle_exception
 
     # --- 日志系统设置 ---
+    # 日志经由队列交给专用线程写入，按大小轮转并保留历史文件
+    from app.logging_setup import setup_logging, stop_logging
     app_data_directory = get_app_data_dir()
     log_file_path = os.path.join(app_data_directory, 'converter_unified.log')
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(threadName)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.FileHandler(log_file_path, 'w', 'utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    setup_logging(log_file_path)
     logging.info("---------- 应用启动 ----------")
 
-    # --- PyInstaller 打包相关设置 ---
-    if getattr(sys, 'frozen', False):
-        logging.info("在打包模式下运行。")
-        # 当使用PyInstaller打包时，sys._MEIPASS包含打包后的临时目录路径
-        try:
-            bundle_dir = sys._MEIPASS  # PyInstaller创建的临时目录
-            pandoc_path_in_bundle = os.path.join(bundle_dir, 'pandoc', 'pandoc.exe')
-            if os.path.exists(pandoc_path_in_bundle):
-                # 将打包的 pandoc 路径添加到环境变量，pypandoc 会自动使用它
-                os.environ['PYPANDOC_PANDOC'] = pandoc_path_in_bundle
-                logging.info(f"Pandoc in bundle found and configured at: {pandoc_path_in_bundle}")
-            else:
-                logging.error(f"在打包目录中未找到 pandoc.exe: {pandoc_path_in_bundle}")
-        except AttributeError:
-            logging.error("无法访问 sys._MEIPASS，这可能意味着程序不是通过PyInstaller打包运行的")
+    configure_bundled_pandoc()
 
     # --- 启动应用 ---
     try:
@@ -61,6 +73,7 @@ def main():
                                              f"程序遇到致命错误: \n{e}\n\n详情请查看 app data 目录中的 error.log 文件。",
                                              "严重错误", 0x10)
         # 退出前确保日志被写入
+        stop_logging()
         logging.shutdown()
         sys.exit(1)
 
@@ -74,4 +87,6 @@ if __name__ == '__main__':
 
     freeze_support()
 
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        sys.exit(run_cli(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,220 @@
+/**
+ * 增量预览：把 Markdown 源文本按顶层块切分并计算哈希，
+ * 只重新解析发生变化的块、只替换对应的 DOM 节点，MathJax 也只对新节点排版。
+ * MathJax 由 loadMath 回调按需加载：文档中第一次出现公式时才会加载。
+ * 未变化的块保留原有节点（包括已排版的公式），预览区的滚动位置因此不会跳动。
+ */
+(function (global) {
+    'use strict';
+
+    const FENCE_RE = /^ {0,3}(`{3,}|~{3,})/;
+    const LINK_DEF_RE = /^ {0,3}\[[^\]]+\]:\s*\S/;
+    const LIST_ITEM_RE = /^ {0,3}([*+-]|\d{1,9}[.)])(\s|$)/;
+    const INDENTED_RE = /^( {2,}|\t)/;
+    const MATH_HINT_RE = /\$|\\\(|\\\[/;
+
+    /** FNV-1a 32 位哈希，附加长度以进一步降低碰撞概率 */
+    function hashString(text) {
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < text.length; i++) {
+            hash ^= text.charCodeAt(i);
+            hash = Math.imul(hash, 0x01000193);
+        }
+        return (hash >>> 0).toString(36) + ':' + text.length;
+    }
+
+    /** 判断一行是否打开了跨行的块级公式（$$ 或 \[），返回对应的结束标记 */
+    function openMathFence(trimmed) {
+        if (trimmed.startsWith('$$') && (trimmed.length === 2 || !trimmed.slice(2).includes('$$'))) return '$$';
+        if (trimmed.startsWith('\\[') && !trimmed.includes('\\]')) return '\\]';
+        return null;
+    }
+
+    /**
+     * 把文本切分为顶层块。空行是块的边界，但代码围栏、跨行公式、
+     * 缩进的续行以及松散列表的后续列表项都归入当前块，保证逐块解析与整篇解析结果一致。
+     * 链接引用定义会被单独收集，附加到每个块之后一起解析。
+     */
+    function splitBlocks(text) {
+        const lines = text.split('\n');
+        const blocks = [];
+        const defs = [];
+        let current = [];
+        let blankRun = 0;
+        let fence = null;
+        let mathEnd = null;
+
+        const flush = () => {
+            if (current.length) blocks.push(current.join('\n'));
+            current = [];
+        };
+
+        for (const line of lines) {
+            if (fence) {
+                current.push(line);
+                const match = FENCE_RE.exec(line);
+                if (match && match[1][0] === fence[0] && match[1].length >= fence.length && !line.trim().slice(match[0].trim().length).trim()) {
+                    fence = null;
+                }
+                continue;
+            }
+            if (mathEnd) {
+                current.push(line);
+                if (line.includes(mathEnd)) mathEnd = null;
+                continue;
+            }
+            if (!line.trim()) {
+                if (current.length) blankRun++;
+                continue;
+            }
+            if (blankRun) {
+                const continuesList = LIST_ITEM_RE.test(current[0]) && LIST_ITEM_RE.test(line);
+                if (INDENTED_RE.test(line) || continuesList) {
+                    for (let i = 0; i < blankRun; i++) current.push('');
+                } else {
+                    flush();
+                }
+                blankRun = 0;
+            }
+            if (LINK_DEF_RE.test(line)) defs.push(line);
+            current.push(line);
+            const fenceMatch = FENCE_RE.exec(line);
+            if (fenceMatch) {
+                fence = fenceMatch[1];
+                continue;
+            }
+            mathEnd = openMathFence(line.trim());
+        }
+        flush();
+        return { blocks, defs: defs.join('\n') };
+    }
+
+    class IncrementalPreview {
+        constructor(container, markedOptions, loadMath) {
+            this.container = container;
+            this.markedOptions = markedOptions || {};
+            this.loadMath = loadMath || null;
+            // 与 DOM 中 .md-block 节点一一对应: { text, hash, el }
+            this.entries = [];
+            this.defs = null;
+            this.typesetChain = Promise.resolve();
+        }
+
+        _createEntry(text, hash) {
+            const el = document.createElement('div');
+            el.className = 'md-block';
+            el.dataset.hash = hash;
+            const source = this.defs ? text + '\n\n' + this.defs : text;
+            el.innerHTML = global.marked.parse(source, this.markedOptions);
+            return { text, hash, el };
+        }
+
+        _releaseNodes(elements) {
+            if (!elements.length) return;
+            if (global.MathJax && global.MathJax.typesetClear) {
+                try { global.MathJax.typesetClear(elements); } catch (err) { console.error('MathJax Clear Error:', err); }
+            }
+            elements.forEach(el => el.remove());
+        }
+
+        _typeset(entries) {
+            const elements = entries.filter(entry => MATH_HINT_RE.test(entry.text)).map(entry => entry.el);
+            if (!elements.length) return this.typesetChain;
+            // MathJax 要求排版调用串行执行；首次遇到公式时先等待其加载完成
+            this.typesetChain = this.typesetChain
+                .then(() => this.loadMath ? this.loadMath() : (global.MathJax && global.MathJax.startup && global.MathJax.startup.promise))
+                .then(() => {
+                    if (global.MathJax && global.MathJax.typesetPromise) {
+                        return global.MathJax.typesetPromise(elements.filter(el => el.isConnected));
+                    }
+                })
+                .catch(err => console.error('MathJax Typesetting Error:', err));
+            return this.typesetChain;
+        }
+
+        /** 全部重建，用于首次渲染或链接定义发生变化时 */
+        reset() {
+            this._releaseNodes(this.entries.map(entry => entry.el));
+            this.entries = [];
+            this.container.innerHTML = '';
+        }
+
+        render(text) {
+            const { blocks, defs } = splitBlocks(text);
+            if (defs !== this.defs) {
+                this.reset();
+                this.defs = defs;
+            }
+            const old = this.entries;
+            let start = 0;
+            while (start < old.length && start < blocks.length && old[start].text === blocks[start]) start++;
+            let oldEnd = old.length;
+            let newEnd = blocks.length;
+            while (oldEnd > start && newEnd > start && old[oldEnd - 1].text === blocks[newEnd - 1]) {
+                oldEnd--;
+                newEnd--;
+            }
+
+            // 中间区域里被移动（而非修改）的块按哈希复用原节点
+            const pool = new Map();
+            for (let i = start; i < oldEnd; i++) {
+                const list = pool.get(old[i].hash);
+                if (list) list.push(old[i]); else pool.set(old[i].hash, [old[i]]);
+            }
+            const anchor = oldEnd < old.length ? old[oldEnd].el : null;
+            const middle = [];
+            const created = [];
+            for (let i = start; i < newEnd; i++) {
+                const hash = hashString(blocks[i]);
+                const candidates = pool.get(hash);
+                let entry = null;
+                if (candidates) {
+                    const index = candidates.findIndex(candidate => candidate.text === blocks[i]);
+                    if (index !== -1) entry = candidates.splice(index, 1)[0];
+                }
+                if (!entry) {
+                    entry = this._createEntry(blocks[i], hash);
+                    created.push(entry);
+                }
+                this.container.insertBefore(entry.el, anchor);
+                middle.push(entry);
+            }
+            const unused = [];
+            pool.forEach(list => list.forEach(entry => unused.push(entry.el)));
+            this._releaseNodes(unused);
+
+            this.entries = old.slice(0, start).concat(middle, old.slice(oldEnd));
+            return this._typeset(created);
+        }
+    }
+
+    let mathJaxLoading = null;
+
+    /**
+     * 按需加载本地打包的 MathJax，返回在其初始化完成后 resolve 的 Promise。
+     * 加载失败时允许下次重试。调用前需要先设置好 window.MathJax 配置对象。
+     */
+    function loadMathJax(src) {
+        if (!mathJaxLoading) {
+            mathJaxLoading = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.id = 'MathJax-script';
+                script.async = true;
+                script.src = src;
+                script.onload = () => global.MathJax.startup.promise.then(resolve, reject);
+                script.onerror = () => {
+                    mathJaxLoading = null;
+                    script.remove();
+                    reject(new Error('无法加载 MathJax: ' + src));
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return mathJaxLoading;
+    }
+
+    global.IncrementalPreview = IncrementalPreview;
+    global.IncrementalPreview.loadMathJax = loadMathJax;
+    global.IncrementalPreview.splitBlocks = splitBlocks;
+    global.IncrementalPreview.hashString = hashString;
+})(window);
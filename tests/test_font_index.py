@@ -0,0 +1,62 @@
+# tests/test_font_index.py
+# 字体扫描失败时不能覆盖已有的字体索引
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from app import font_index
+from app.font_index import FONT_INDEX_VERSION, FontIndex
+
+_GOOD_FONTS = {
+    'Arial': {'styles': ['Bold', 'Regular'], 'cjk': False},
+    'SimSun': {'styles': ['Regular'], 'cjk': True},
+}
+
+
+class FontIndexScanFailureTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, 'font_index.json')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write_index(self, signature='old'):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'version': FONT_INDEX_VERSION, 'signature': signature, 'fonts': _GOOD_FONTS}, f)
+
+    def _read_index(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_refresh_keeps_index_when_scan_fails(self):
+        self._write_index()
+        index = FontIndex(self.path)
+        with mock.patch.object(font_index, 'compute_font_signature', return_value='new'), \
+                mock.patch.object(font_index, 'scan_system_fonts', side_effect=OSError("fc-list 超时")):
+            self.assertIsNone(index.refresh())
+        self.assertEqual(index.get_fonts(), _GOOD_FONTS)
+        saved = self._read_index()
+        self.assertEqual(saved['fonts'], _GOOD_FONTS)
+        self.assertEqual(saved['signature'], 'old')
+
+    def test_first_scan_failure_does_not_save_empty_index(self):
+        index = FontIndex(self.path)
+        with mock.patch.object(font_index, 'compute_font_signature', return_value='sig'), \
+                mock.patch.object(font_index, 'scan_system_fonts', side_effect=OSError("fc-list 不存在")):
+            self.assertEqual(index.get_fonts(), {})
+        self.assertFalse(os.path.exists(self.path))
+
+        # 下一次刷新重新扫描，成功后所有字体都作为新增字体推送
+        with mock.patch.object(font_index, 'compute_font_signature', return_value='sig'), \
+                mock.patch.object(font_index, 'scan_system_fonts', return_value=_GOOD_FONTS):
+            delta = index.refresh()
+        self.assertEqual(delta['added'], ['Arial', 'SimSun'])
+        self.assertEqual(delta['removed'], [])
+        self.assertEqual(self._read_index()['fonts'], _GOOD_FONTS)
+
+
+if __name__ == '__main__':
+    unittest.main()